@@ -1,12 +1,18 @@
+from collections import ChainMap, deque
 from dataclasses import dataclass, field
-from typing import NamedTuple, TypeAlias
+import json
+from typing import IO, Any, Callable, Mapping, NamedTuple, TypeAlias
 
 from py2cpp.ast.dsn import DSN
+from py2cpp.ast.parser import ParserSetting
 from py2cpp.errors import LogicError
+from py2cpp.lang.cache import CacheProvider
 from py2cpp.lang.implementation import injectable
+from py2cpp.module.depends import file_digest, package_digest, source_path_of
 from py2cpp.module.modules import Module, Modules
 import py2cpp.node.definition as defs
 from py2cpp.node.interface import IDomainName
+from py2cpp.node.node import Node
 
 DeclVar: TypeAlias = defs.Parameter | defs.AnnoAssign | defs.MoveAssign
 DeclAll: TypeAlias = defs.Parameter | defs.AnnoAssign | defs.MoveAssign | defs.ClassKind
@@ -74,17 +80,212 @@ class Expanded:
 	decl_vars: list[DeclVar] = field(default_factory=list)
 	import_nodes: list[defs.Import] = field(default_factory=list)
 
+	@classmethod
+	def expand(cls, module: Module) -> 'Expanded':
+		"""モジュールの全シンボルを展開
+
+		Args:
+			module (Module): モジュール
+		Returns:
+			Expanded: 展開データ
+		"""
+		rows: dict[str, SymbolRow] = {}
+		decl_vars: list[DeclVar] = []
+		import_nodes: list[defs.Import] = []
+		entrypoint = module.entrypoint.as_a(defs.Entrypoint)
+		for node in entrypoint.flatten():
+			if isinstance(node, defs.ClassKind):
+				rows[node.domain_id] = SymbolRow(node.domain_id, node.domain_id, module, node.symbol, node, node)
+
+			if type(node) is defs.Import:
+				import_nodes.append(node)
+
+			if type(node) is defs.Function:
+				decl_vars.extend(node.decl_vars)
+			elif type(node) is defs.ClassMethod:
+				decl_vars.extend(node.decl_vars)
+			elif type(node) is defs.Constructor:
+				decl_vars.extend(node.decl_vars)
+			elif type(node) is defs.Method:
+				decl_vars.extend(node.decl_vars)
+			elif type(node) is defs.Class:
+				decl_vars.extend(node.vars)
+			elif type(node) is defs.Enum:
+				decl_vars.extend(node.vars)
+
+		# XXX calculatedに含まれないためエントリーポイントは個別に処理
+		decl_vars = [*entrypoint.decl_vars, *decl_vars]
+
+		return cls(rows, decl_vars, import_nodes)
+
+	def copy(self) -> 'Expanded':
+		"""複製を生成
+
+		Returns:
+			Expanded: 複製したインスタンス
+		"""
+		return Expanded(dict(self.rows), list(self.decl_vars), list(self.import_nodes))
+
+	def dumps(self) -> dict[str, Any]:
+		"""ノードを位置(フルパスとクラス名)に置き換えたシリアライズ可能なデータに変換
+
+		Returns:
+			dict[str, Any]: データ
+		Raises:
+			LogicError: クラス以外のシンボルデータを含む
+		Note:
+			シンボルテーブルはクラスのみで構成されるため、タイプノードのみを保存し、シンボル・宣言ノードは復元時に導出
+			シンボルノードはエイリアスによってプロキシーに置き換わる場合があり、位置から復元できないため
+		"""
+		def locate(node: Node) -> list[str]:
+			return [node.full_path, node.__class__.__name__]
+
+		invalid_rows = [key for key, row in self.rows.items() if row.decl is not row.types]
+		if len(invalid_rows) > 0:
+			raise LogicError(f'Not serializable rows. keys: {invalid_rows}')
+
+		return {
+			'rows': [[key, row.ref_path, row.org_path, locate(row.types)] for key, row in self.rows.items()],
+			'decl_vars': [locate(var) for var in self.decl_vars],
+			'import_nodes': [locate(node) for node in self.import_nodes],
+		}
+
+	@classmethod
+	def loads(cls, module: Module, data: dict[str, Any]) -> 'Expanded':
+		"""シリアライズしたデータから展開データを復元
+
+		Args:
+			module (Module): モジュール
+			data (dict[str, Any]): データ @see dumps
+		Returns:
+			Expanded: 展開データ
+		Raises:
+			LogicError: ノードのクラスが不正
+		Note:
+			ノードは位置を基にモジュールから解決するため、データはモジュールと同じソースから生成されていることが前提
+		"""
+		def resolve(location: list[str]) -> Any:
+			full_path, class_name = location
+			ctor = getattr(defs, class_name, None)
+			if not isinstance(ctor, type) or not issubclass(ctor, Node):
+				raise LogicError(f'Invalid node class. class: {class_name}')
+
+			return module.by(full_path).as_a(ctor)
+
+		rows: dict[str, SymbolRow] = {}
+		for key, ref_path, org_path, location in data['rows']:
+			types = resolve(location).as_a(defs.ClassKind)
+			rows[key] = SymbolRow(ref_path, org_path, module, types.symbol, types, types)
+
+		decl_vars = [resolve(location) for location in data['decl_vars']]
+		import_nodes = [resolve(location) for location in data['import_nodes']]
+		return cls(rows, decl_vars, import_nodes)
+
+
+class ExpandedStored:
+	"""ストア(展開データ版)
+
+	Note:
+		復元時はノードの位置のみを保持し、モジュールを指定して展開データに変換する @see restore
+	"""
+
+	version = 1
+
+	def __init__(self, data: dict[str, Any], expanded: Expanded | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			data (dict[str, Any]): シリアライズしたデータ @see Expanded.dumps
+			expanded (Expanded | None): 展開データ。生成直後のみ保持(default = None)
+		"""
+		self.__data = data
+		self.__expanded = expanded
+
+	@classmethod
+	def make(cls, expanded: Expanded) -> 'ExpandedStored':
+		"""展開データからインスタンスを生成
+
+		Args:
+			expanded (Expanded): 展開データ
+		Returns:
+			ExpandedStored: インスタンス
+		"""
+		return cls(expanded.dumps(), expanded)
+
+	def restore(self, module: Module) -> Expanded:
+		"""展開データに変換
+
+		Args:
+			module (Module): モジュール
+		Returns:
+			Expanded: 展開データ
+		"""
+		if self.__expanded is None:
+			self.__expanded = Expanded.loads(module, self.__data)
+
+		return self.__expanded
+
+	@classmethod
+	def load(cls, stream: IO) -> 'ExpandedStored':
+		"""インスタンスを復元
+
+		Args:
+			stream (IO): IO
+		Returns:
+			ExpandedStored: インスタンス
+		"""
+		return cls(json.load(stream))
+
+	def save(self, stream: IO) -> None:
+		"""インスタンスを保存
+
+		Args:
+			stream (IO): IO
+		"""
+		stream.write(json.dumps(self.__data).encode('utf-8'))
+
+
+class LibraryExpands(dict[Module, Expanded]):
+	"""標準ライブラリーモジュールの展開データのキャッシュ。モジュールのインスタンスと展開データをマッピング
+
+	Note:
+		既定ではシンボルテーブル毎に生成されるため共有されない
+		常駐プロセスなどでモジュールのインスタンスを使い回す場合は、同じインスタンスを注入して共有する
+	"""
+
+	def expand(self, module: Module, factory: Callable[[Module], Expanded] = Expanded.expand) -> Expanded:
+		"""モジュールの全シンボルを展開。展開結果はモジュール毎にキャッシュ
+
+		Args:
+			module (Module): 標準ライブラリーモジュール
+			factory (Callable[[Module], Expanded]): 展開データのファクトリー(default = Expanded.expand)
+		Returns:
+			Expanded: 展開データ
+		Note:
+			展開データは呼び出し元で更新されるため、キャッシュの複製を返却
+		"""
+		if module not in self:
+			self[module] = factory(module)
+
+		return self[module].copy()
+
 
 class SymbolDB:
 	"""シンボルテーブル"""
 
 	@injectable
-	def __init__(self, modules: Modules) -> None:
+	def __init__(self, modules: Modules, library_expands: LibraryExpands, cache: CacheProvider, parser_setting: ParserSetting) -> None:
 		"""インスタンスを生成
 
 		Args:
 			modules (Modules): モジュールマネージャー @inject
+			library_expands (LibraryExpands): 標準ライブラリーモジュールの展開データのキャッシュ @inject
+			cache (CacheProvider): キャッシュプロバイダー @inject
+			parser_setting (ParserSetting): シンタックスパーサー設定データ @inject
 		"""
+		self.__library_expands = library_expands
+		self.__cache = cache
+		self.__environment = {'grammar': file_digest(parser_setting.grammar), 'package': package_digest()}
 		self.rows = self.__make_rows(modules)
 
 	def __make_rows(self, modules: Modules) -> dict[str, SymbolRow]:
@@ -94,104 +295,156 @@ class SymbolDB:
 			modules (Modules): モジュールマネージャー
 		Returns:
 			dict[str, SymbolRow]: シンボルテーブル
+		Note:
+			モジュール毎のシンボルテーブルは(自身 -> 標準ライブラリー -> インポート)の順で参照する階層構造
+			各階層は1度だけ生成し、統合時も各行を1度だけ複写するため、処理量は全シンボル数に比例
+			インポートモジュールが展開済みの場合は展開後のシンボルテーブル、未展開の場合は展開データから参照 @see __expand_modules
 		"""
-		main = modules.main
-
-		# メインモジュールを展開
-		expends: dict[Module, Expanded] = {}
-		expends[main] = self.__expand_module(main)
-
-		# インポートモジュールを全て展開
-		import_index = 0
-		import_modules_from_main = [modules.load(node.module_path.tokens) for node in expends[main].import_nodes]
-		import_modules = [*modules.libralies, *import_modules_from_main]
-		while import_index < len(import_modules):
-			import_module = import_modules[import_index]
-			expanded = self.__expand_module(import_module)
-			import_modules_from_depended = [modules.load(node.module_path.tokens) for node in expanded.import_nodes]
-			import_modules = [*import_modules, *import_modules_from_depended]
-			expends[import_module] = expanded
-			import_index += 1
-
-		all_modules = [*import_modules, main]
-		for expand_module in all_modules:
-			expand_target = expends[expand_module]
-
-			# 標準ライブラリを展開
-			if expand_module not in modules.libralies:
-				for core_module in modules.libralies:
-					# 第1層で宣言されているシンボルに限定
-					entrypoint = core_module.entrypoint.as_a(defs.Entrypoint)
-					primary_symbol_names = [node.symbol.tokens for node in entrypoint.statements if isinstance(node, DeclAll)]
-					expanded = expends[core_module]
-					filtered_db = {row.path_to(expand_module): row.to(expand_module) for row in expanded.rows.values() if row.symbol.tokens in primary_symbol_names}
-					expand_target.rows = {**filtered_db, **expand_target.rows}
-
-			# インポートモジュールを展開
+		libraries = modules.libralies
+		expends = self.__expand_modules(modules, libraries)
+		tables: dict[Module, ChainMap[str, SymbolRow]] = {}
+		indexes: dict[Module, dict[str, list[SymbolRow]]] = {}
+		library_rows: list[SymbolRow] | None = None
+		for expand_module, expand_target in expends.items():
+			# 標準ライブラリを展開。先に指定された標準ライブラリーを優先
+			library_layer: dict[str, SymbolRow] = {}
+			if expand_module not in libraries:
+				if library_rows is None:
+					library_rows = self.__primary_rows(libraries, tables)
+
+				for row in library_rows:
+					library_layer.setdefault(row.path_to(expand_module), row.to(expand_module))
+
+			# インポートモジュールを展開。先に記述されたインポートを優先
 			# XXX 別枠として分離するより、ステートメントの中で処理するのが理想
 			# XXX また、ステートメントのスコープも合わせて考慮
+			import_layer: dict[str, SymbolRow] = {}
 			for import_node in expand_target.import_nodes:
 				# import句で明示されたシンボルに限定
-				imported_symbol_names = [symbol.tokens for symbol in import_node.import_symbols]
 				import_module = modules.load(import_node.module_path.tokens)
-				expanded = expends[import_module]
-				filtered_db = {row.path_to(expand_module): row.to(expand_module) for row in expanded.rows.values() if row.symbol.tokens in imported_symbol_names}
-				expand_target.rows = {**filtered_db, **expand_target.rows}
+				index = self.__symbol_index(import_module, expends, tables, indexes)
+				for symbol in import_node.import_symbols:
+					for row in index.get(symbol.tokens, []):
+						import_layer.setdefault(row.path_to(expand_module), row.to(expand_module))
+
+			table = ChainMap(expand_target.rows, library_layer, import_layer)
 
 			# 展開対象モジュールの変数シンボルを展開
 			for var in expand_target.decl_vars:
-				expand_target.rows[var.symbol.domain_id] = self.__resolve_var_type(var, expand_target.rows).varnize(var)
+				table[var.symbol.domain_id] = self.__resolve_var_type(var, table).varnize(var)
 
-		# シンボルテーブルを統合
+			tables[expand_module] = table
+
+		# シンボルテーブルを統合。メインモジュール -> 標準ライブラリー -> インポートモジュールの順で優先
+		*depends, main_table = tables.values()
 		rows: dict[str, SymbolRow] = {}
-		for expanded in expends.values():
-			rows = {**expanded.rows, **rows}
+		for table in reversed([main_table, *depends]):
+			rows.update(table)
 
 		return rows
 
-	def __expand_module(self, module: Module) -> Expanded:
-		"""モジュールの全シンボルを展開
+	def __expand_modules(self, modules: Modules, libraries: list[Module]) -> dict[Module, Expanded]:
+		"""メインモジュールと依存モジュールを重複なく展開
+
+		Args:
+			modules (Modules): モジュールマネージャー
+			libraries (list[Module]): 標準ライブラリーモジュールリスト
+		Returns:
+			dict[Module, Expanded]: モジュールと展開データのマップ。標準ライブラリー、インポートモジュール、メインモジュールの順
+		Note:
+			標準ライブラリーは全てのモジュールから暗黙的に参照されるため先頭に並べる
+			インポートモジュールは標準ライブラリーとメインモジュールのインポートから幅優先で辿り、循環インポートは1度のみ辿る
+			そのため、インポートする側のモジュールがインポートされる側のモジュールより先に並ぶ場合がある
+		"""
+		main = modules.main
+		main_expanded = self.__expand(main)
+		expends: dict[Module, Expanded] = {}
+		remains = deque([*libraries, *[modules.load(node.module_path.tokens) for node in main_expanded.import_nodes]])
+		while len(remains):
+			module = remains.popleft()
+			if module is main or module in expends:
+				continue
+
+			expends[module] = self.__library_expands.expand(module, self.__expand) if module in libraries else self.__expand(module)
+			remains.extend(modules.load(node.module_path.tokens) for node in expends[module].import_nodes)
+
+		expends[main] = main_expanded
+		return expends
+
+	def __primary_rows(self, libraries: list[Module], tables: dict[Module, ChainMap[str, SymbolRow]]) -> list[SymbolRow]:
+		"""標準ライブラリーの第1層で宣言されているシンボルのシンボルデータを取得
+
+		Args:
+			libraries (list[Module]): 標準ライブラリーモジュールリスト
+			tables (dict[Module, ChainMap[str, SymbolRow]]): 生成済みのシンボルテーブル
+		Returns:
+			list[SymbolRow]: シンボルデータリスト
+		"""
+		rows: list[SymbolRow] = []
+		for core_module in libraries:
+			entrypoint = core_module.entrypoint.as_a(defs.Entrypoint)
+			primary_symbol_names = {node.symbol.tokens for node in entrypoint.statements if isinstance(node, DeclAll)}
+			rows.extend(row for row in tables[core_module].values() if row.symbol.tokens in primary_symbol_names)
+
+		return rows
+
+	def __symbol_index(self, module: Module, expends: dict[Module, Expanded], tables: dict[Module, ChainMap[str, SymbolRow]], indexes: dict[Module, dict[str, list[SymbolRow]]]) -> dict[str, list[SymbolRow]]:
+		"""モジュールのシンボルテーブルをシンボル名で索引化
 
 		Args:
 			module (Module): モジュール
+			expends (dict[Module, Expanded]): モジュールと展開データのマップ
+			tables (dict[Module, ChainMap[str, SymbolRow]]): 生成済みのシンボルテーブル
+			indexes (dict[Module, dict[str, list[SymbolRow]]]): 生成済みの索引
 		Returns:
-			Expanded: 展開データ
+			dict[str, list[SymbolRow]]: シンボル名とシンボルデータリストのマップ
+		Note:
+			循環インポートによってシンボルテーブルが未生成の場合は、展開データから索引を生成し、キャッシュしない
 		"""
-		rows: dict[str, SymbolRow] = {}
-		decl_vars: list[DeclVar] = []
-		import_nodes: list[defs.Import] = []
-		entrypoint = module.entrypoint.as_a(defs.Entrypoint)
-		for node in entrypoint.flatten():
-			if isinstance(node, defs.ClassKind):
-				rows[node.domain_id] = SymbolRow(node.domain_id, node.domain_id, module, node.symbol, node, node)
+		if module in indexes:
+			return indexes[module]
 
-			if type(node) is defs.Import:
-				import_nodes.append(node)
+		index: dict[str, list[SymbolRow]] = {}
+		rows = tables[module] if module in tables else expends[module].rows
+		for row in rows.values():
+			index.setdefault(row.symbol.tokens, []).append(row)
 
-			if type(node) is defs.Function:
-				decl_vars.extend(node.decl_vars)
-			elif type(node) is defs.ClassMethod:
-				decl_vars.extend(node.decl_vars)
-			elif type(node) is defs.Constructor:
-				decl_vars.extend(node.decl_vars)
-			elif type(node) is defs.Method:
-				decl_vars.extend(node.decl_vars)
-			elif type(node) is defs.Class:
-				decl_vars.extend(node.vars)
-			elif type(node) is defs.Enum:
-				decl_vars.extend(node.vars)
+		if module in tables:
+			indexes[module] = index
 
-		# XXX calculatedに含まれないためエントリーポイントは個別に処理
-		decl_vars = [*entrypoint.decl_vars, *decl_vars]
+		return index
+
+	def __expand(self, module: Module) -> Expanded:
+		"""モジュールの全シンボルを展開。展開データはソースのダイジェスト毎にキャッシュから復元
+
+		Args:
+			module (Module): モジュール
+		Returns:
+			Expanded: 展開データ
+		Note:
+			展開データの参照パスは参照名に依存するため、キャッシュキーは実体と参照名の組み合わせ
+			展開データはシンタックスツリーとノードの定義に依存するため、ソースに加えて文法とpy2cppパッケージのダイジェストが一致する場合のみ復元
+			ソースが存在しないモジュールはキャッシュしない
+		"""
+		digest = file_digest(source_path_of(module.actual_path))
+		if digest == '':
+			return Expanded.expand(module)
+
+		basepath = module.actual_path.replace('.', '/')
+		identity = {'digest': digest, **self.__environment, 'version': str(ExpandedStored.version)}
+
+		@self.__cache.get(f'{basepath}.{module.path}.symbols', identity=identity, format='json')
+		def instantiate() -> ExpandedStored:
+			return ExpandedStored.make(Expanded.expand(module))
 
-		return Expanded(rows, decl_vars, import_nodes)
+		return instantiate().restore(module)
 
-	def __resolve_var_type(self, var: DeclVar, rows: dict[str, SymbolRow]) -> SymbolRow:
+	def __resolve_var_type(self, var: DeclVar, rows: Mapping[str, SymbolRow]) -> SymbolRow:
 		"""シンボルテーブルから変数の型を解決
 
 		Args:
 			var (DeclVar): 変数宣言ノード
-			rows (dict[str, SymbolRow]): シンボルテーブル
+			rows (Mapping[str, SymbolRow]): シンボルテーブル
 		Returns:
 			SymbolRow: シンボルデータ
 		"""
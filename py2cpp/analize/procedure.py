@@ -1,4 +1,4 @@
-from typing import Callable, Generic, TypeVar, cast
+from typing import Any, Callable, ClassVar, Generic, NamedTuple, TypeVar
 
 from py2cpp.errors import LogicError
 from py2cpp.lang.annotation import FunctionAnnotation
@@ -7,10 +7,139 @@ from py2cpp.node.node import Node
 T_Ret = TypeVar('T_Ret')
 
 
+class ArgKinds(NamedTuple):
+	"""ハンドラー引数の解決方法一覧"""
+
+	Node = 0
+	List = 1
+	Value = 2
+
+
+class HandlerPlan(NamedTuple):
+	"""ハンドラーの呼び出し計画
+
+	Note:
+		引数はスタックから取り出す順(=宣言の逆順)に並べる
+	"""
+
+	handler: Callable[..., Any]
+	args: tuple[tuple[str, int], ...]
+
+
+class Dispatch(NamedTuple):
+	"""ノードの分類に対応するハンドラーの呼び出し計画"""
+
+	action: HandlerPlan | None
+	enter: bool
+	exit: Callable[..., Any] | None
+
+
+class ValueStack(Generic[T_Ret]):
+	"""ハンドラーの結果を受け渡す値スタック
+
+	Note:
+		リスト引数は要素数分の値を1回のスライスで取り出す
+		デバッグモードでは値毎に積んだノードのフルパスを記録する @see Procedure.process
+	"""
+
+	def __init__(self, debug: bool = False) -> None:
+		"""インスタンスを生成
+
+		Args:
+			debug (bool): True = 値を積んだノードを記録(default = False)
+		"""
+		self.__values: list[T_Ret] = []
+		self.__owners: list[str] | None = [] if debug else None
+
+	def __len__(self) -> int:
+		"""int: 値の数"""
+		return len(self.__values)
+
+	def push(self, value: T_Ret, owner: Node) -> None:
+		"""値を積む
+
+		Args:
+			value (T_Ret): 値
+			owner (Node): 値を積んだノード
+		"""
+		self.__values.append(value)
+		if self.__owners is not None:
+			self.__owners.append(owner.full_path)
+
+	def pop(self) -> T_Ret:
+		"""値を取り出す
+
+		Returns:
+			T_Ret: 値
+		Raises:
+			LogicError: スタックが空
+		"""
+		if len(self.__values) == 0:
+			raise LogicError('Stack underflow. 1 > 0')
+
+		if self.__owners is not None:
+			self.__owners.pop()
+
+		return self.__values.pop()
+
+	def pop_n(self, counts: int) -> list[T_Ret]:
+		"""指定の数の値を積んだ順序のまま取り出す
+
+		Args:
+			counts (int): 取り出す数
+		Returns:
+			list[T_Ret]: 値リスト
+		Raises:
+			LogicError: スタックの値が不足
+		"""
+		if counts == 0:
+			return []
+
+		if len(self.__values) < counts:
+			raise LogicError(f'Stack underflow. {counts} > {len(self.__values)}')
+
+		values = self.__values[-counts:]
+		del self.__values[-counts:]
+		if self.__owners is not None:
+			del self.__owners[-counts:]
+
+		return values
+
+	def owners(self) -> list[str]:
+		"""値を積んだノードのフルパスリストを取得。デバッグモード以外は空
+
+		Returns:
+			list[str]: フルパスリスト
+		"""
+		return list(self.__owners) if self.__owners is not None else []
+
+
 class Procedure(Generic[T_Ret]):
-	def __init__(self) -> None:
-		self._stack: list[T_Ret] = []
+	"""ノードの分類に応じてハンドラーを呼び出し、結果をスタックで受け渡すプロシージャーの基底クラス
+
+	Note:
+		ハンドラーは以下の命名規則で定義する
+		* on_{classification}: アクション
+		* on_fallback: アクションが未定義の場合の代替
+		* on_exit_{classification}: アクションの結果を加工
+		ハンドラーの探索結果は派生クラス・分類毎に1度だけ構築し、クラス変数で共有する @see __dispatch
+	"""
+
+	__dispatches: ClassVar[dict[type['Procedure'], dict[str, Dispatch]]] = {}
+
+	def __init__(self, debug: bool = False) -> None:
+		"""インスタンスを生成
+
+		Args:
+			debug (bool): True = ノード毎にスタックの収支を検証(default = False)
+		"""
+		self._stack = ValueStack[T_Ret](debug)
 		self.__invoker = HandlerInvoker[T_Ret]()
+		self.__debug = debug
+		if self.__class__ not in Procedure.__dispatches:
+			Procedure.__dispatches[self.__class__] = {}
+
+		self.__table = Procedure.__dispatches[self.__class__]
 
 	def result(self) -> T_Ret:
 		if len(self._stack) != 1:
@@ -18,63 +147,159 @@ class Procedure(Generic[T_Ret]):
 
 		return self._stack.pop()
 
+	def drain(self) -> list[T_Ret]:
+		"""スタックに積まれた全ての結果を積んだ順序のまま取り出す
+
+		Returns:
+			list[T_Ret]: 結果リスト
+		Note:
+			処理済みの部分木の結果を逐次出力する場合に使用 @see py2cpp.bin.transpile.transpile
+		"""
+		return self._stack.pop_n(len(self._stack))
+
 	def process(self, node: Node) -> None:
-		self._enter(node)
-		self._action(node)
-		self._exit(node)
-
-	def _action(self, node: Node) -> None:
-		handler_name = f'on_{node.classification}'
-		if hasattr(self, handler_name):
-			self._run_action(handler_name, node)
-		elif hasattr(self, 'on_fallback'):
-			self._run_action('on_fallback', node)
-		else:
+		dispatch = self.__dispatch(node.classification)
+		if not self.__debug:
+			self._enter(node, dispatch)
+			self._action(node, dispatch)
+			self._exit(node, dispatch)
+			return
+
+		owners = self._stack.owners()
+		self._enter(node, dispatch)
+		self._action(node, dispatch)
+		self._exit(node, dispatch)
+		self.__verify(node, owners)
+
+	def _action(self, node: Node, dispatch: Dispatch) -> None:
+		if dispatch.action is None:
 			raise LogicError(f'Handler not defined. node: {str(node)}')
 
-	def _enter(self, node: Node) -> None:
-		handler_name = f'on_enter_{node.classification}'
-		if hasattr(self, handler_name):
+		result = self.__invoker.invoke(self, dispatch.action, node, self._stack)
+		if result is not None:
+			self._stack.push(result, node)
+
+	def _enter(self, node: Node, dispatch: Dispatch) -> None:
+		if dispatch.enter:
 			# FIXME impl?
 			raise NotImplementedError()
 
-	def _exit(self, node: Node) -> None:
-		handler_name = f'on_exit_{node.classification}'
-		if hasattr(self, handler_name):
-			handler = cast(Callable[[Node, T_Ret], T_Ret], getattr(self, handler_name))
-			self._stack.append(handler(node, self._stack.pop()))
+	def _exit(self, node: Node, dispatch: Dispatch) -> None:
+		if dispatch.exit is not None:
+			self._stack.push(dispatch.exit(self, node, self._stack.pop()), node)
 
-	def _run_action(self, handler_name: str, node: Node) -> None:
-		result = self.__invoker.invoke(getattr(self, handler_name), node, self._stack)
-		if result is not None:
-			self._stack.append(result)
+	def __verify(self, node: Node, before: list[str]) -> None:
+		"""ノードの処理前後でスタックの収支を検証
+
+		Args:
+			node (Node): 処理したノード
+			before (list[str]): 処理前のスタックの値を積んだノードのフルパスリスト
+		Raises:
+			LogicError: 配下以外の値を消費、または配下の値を消費せずに残した
+		Note:
+			帰りがけ順で処理するため、配下のノードが積んだ値はスタックの末尾に連続して並ぶ
+			ハンドラーはその範囲の値を過不足なく消費し、結果を高々1つ積むことが正常
+		"""
+		after = self._stack.owners()
+		pushed = 1 if len(after) > 0 and after[-1] == node.full_path else 0
+		remain = len(after) - pushed
+		under = f'{node.full_path}.'
+		consumed = before[remain:]
+		foreigns = [owner for owner in consumed if not owner.startswith(under)]
+		if len(foreigns) > 0:
+			raise LogicError(f'Stack imbalance. consumed foreign values. node: {str(node)}, owners: {foreigns}')
+
+		if remain > 0 and after[remain - 1].startswith(under):
+			raise LogicError(f'Stack imbalance. values left behind. node: {str(node)}, owner: {after[remain - 1]}')
+
+	def __dispatch(self, classification: str) -> Dispatch:
+		"""分類に対応するハンドラーの呼び出し計画を取得
+
+		Args:
+			classification (str): ノードの分類
+		Returns:
+			Dispatch: 呼び出し計画
+		Note:
+			初回の参照時にハンドラーを探索し、以降は派生クラス毎のテーブルから取得
+		"""
+		if classification not in self.__table:
+			self.__table[classification] = self.__compile(classification)
+
+		return self.__table[classification]
+
+	def __compile(self, classification: str) -> Dispatch:
+		"""分類に対応するハンドラーを探索し、呼び出し計画を構築
+
+		Args:
+			classification (str): ノードの分類
+		Returns:
+			Dispatch: 呼び出し計画
+		"""
+		ctor = self.__class__
+		action_name = f'on_{classification}'
+		if not hasattr(ctor, action_name) and hasattr(ctor, 'on_fallback'):
+			action_name = 'on_fallback'
+
+		action = self.__invoker.plan(getattr(ctor, action_name)) if hasattr(ctor, action_name) else None
+		enter = hasattr(ctor, f'on_enter_{classification}')
+		exit = getattr(ctor, f'on_exit_{classification}', None)
+		return Dispatch(action, enter, exit)
 
 
 class HandlerInvoker(Generic[T_Ret]):
-	def invoke(self, handler: Callable[..., T_Ret], node: Node, stack: list[T_Ret]) -> T_Ret | None:
-		args = self.__invoke_args(handler, node, stack)
-		return handler(**args)
+	"""ハンドラーの引数をスタックから解決して呼び出す"""
+
+	__plans: ClassVar[dict[Callable[..., Any], HandlerPlan]] = {}
+
+	def plan(self, handler: Callable[..., Any]) -> HandlerPlan:
+		"""ハンドラーの呼び出し計画を取得
+
+		Args:
+			handler (Callable[..., Any]): ハンドラー(非バインド)
+		Returns:
+			HandlerPlan: 呼び出し計画
+		Note:
+			アノテーションの解析はハンドラー毎に1度のみ実施
+		"""
+		if handler not in HandlerInvoker.__plans:
+			HandlerInvoker.__plans[handler] = HandlerPlan(handler, self.__plan_args(handler))
+
+		return HandlerInvoker.__plans[handler]
+
+	def invoke(self, receiver: Any, plan: HandlerPlan, node: Node, stack: ValueStack[T_Ret]) -> T_Ret | None:
+		"""呼び出し計画に従ってハンドラーを呼び出す
 
-	def __invoke_args(self, handler: Callable, node: Node, stack: list[T_Ret]) -> dict[str, Node | T_Ret | list[T_Ret]]:
-		func_anno = FunctionAnnotation(handler)
+		Args:
+			receiver (Any): ハンドラーの所有者
+			plan (HandlerPlan): 呼び出し計画
+			node (Node): ノード
+			stack (ValueStack[T_Ret]): スタック
+		Returns:
+			T_Ret | None: 結果
+		Note:
+			リスト引数の要素数はノードが展開時に記録した値を使用 @see Node.arity_of
+		"""
 		args: dict[str, Node | T_Ret | list[T_Ret]] = {}
-		args_anno = func_anno.args
-		args_keys = reversed(args_anno.keys())
-		for key in args_keys:
-			arg_anno = args_anno[key]
-			if issubclass(arg_anno.org_type, Node):
+		for key, kind in plan.args:
+			if kind == ArgKinds.Node:
 				args[key] = node
-			elif arg_anno.is_list:
-				args[key] = self.__pluck_values(stack, node, key)
+			elif kind == ArgKinds.List:
+				args[key] = stack.pop_n(node.arity_of(key))
 			else:
-				args[key] = self.__pluck_value(stack)
+				args[key] = stack.pop()
 
-		return args
+		return plan.handler(receiver, **args)
 
-	def __pluck_values(self, stack: list[T_Ret], node: Node, key: str) -> list[T_Ret]:
-		counts = len(getattr(node, key))
-		args = [stack.pop() for _ in range(counts)]
-		return list(reversed(args))
+	def __plan_args(self, handler: Callable[..., Any]) -> tuple[tuple[str, int], ...]:
+		args: list[tuple[str, int]] = []
+		args_anno = FunctionAnnotation(handler).args
+		for key in reversed(args_anno.keys()):
+			arg_anno = args_anno[key]
+			if issubclass(arg_anno.org_type, Node):
+				args.append((key, ArgKinds.Node))
+			elif arg_anno.is_list:
+				args.append((key, ArgKinds.List))
+			else:
+				args.append((key, ArgKinds.Value))
 
-	def __pluck_value(self, stack: list[T_Ret]) -> T_Ret:
-		return stack.pop()
+		return tuple(args)
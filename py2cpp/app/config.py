@@ -8,6 +8,7 @@ def default_definitions() -> ModuleDefinitions:
 		ModuleDefinition: モジュール定義
 	"""
 	return {
+		'py2cpp.analize.db.LibraryExpands': 'py2cpp.analize.db.LibraryExpands',
 		'py2cpp.analize.db.SymbolDB': 'py2cpp.analize.db.SymbolDB',
 		'py2cpp.analize.symbols.Symbols': 'py2cpp.analize.symbols.Symbols',
 		'py2cpp.ast.entry.Entry': 'py2cpp.ast.provider.make_entrypoint',
@@ -1,23 +1,57 @@
-from typing import Generic, TypeVar
+from array import array
+from typing import Callable, Generic, Iterator, TypeVar
 
-from py2cpp.errors import NotFoundError
+from py2cpp.ast.dsn import DSN
+from py2cpp.ast.path import ParsedPath
+from py2cpp.errors import LogicError, NotFoundError
 
 T = TypeVar('T')
 
 
 class EntryCache(Generic[T]):
-	"""エントリーキャッシュ
+	"""エントリーキャッシュ。エントリーを登録順に配列へ格納し、ツリー構造を整数インデックスで表現するアリーナ
 
 	Note:
 		グループ検索用のインデックスは、ツリーの先頭から順序通りに登録することが正常動作の必須要件
 		効率よくインデックスを構築出来る反面、シンタックスツリーが静的であることを前提とした実装のため、
 		インデックスを作り替えることは出来ず、登録順序にも強い制限がある
+		## 構造
+		エントリーは登録順(=行きがけ順)のインデックスで識別し、以下の並列配列で構造を管理する
+		* tags: エントリータグID
+		* parents: 親のインデックス(ルートは-1)
+		* elem_indexs: パスの要素インデックス(同名の兄弟が無い場合は-1) @see EntryPath.identify
+		* ends: 配下の末尾のインデックス(配下が無い場合は自身)
+		子のインデックスは親のインデックス毎に登録順のリストで管理する
+		配下のエントリーは[index, ends[index]]の連続した区間に収まる
+		endsは登録時には更新せず、参照時に帰りがけ順の1回の走査でまとめて算出する
+		## パス
+		登録時はパスを生成せず、参照時に親を辿って生成する。生成したパスとパスから引いたインデックスは相互にキャッシュ
+		## 遅延展開
+		展開関数を指定した場合、子はchildren_ofで初回に参照した時点でエントリーから展開して登録する
+		パスの検索も同様に、辿った経路上の子のみを展開する。そのため、参照していない部分木はエントリーから読み出されない
+		展開関数を指定した場合に外部から登録するのはルートのみとし、登録順が行きがけ順にならないためend_of/group_byは使用できない
 	"""
 
-	def __init__(self) -> None:
-		"""インスタンスを生成"""
+	def __init__(self, unfold: Callable[[T], list[tuple[str, int, T]]] | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			unfold (Callable[[T], list[tuple[str, int, T]]] | None): 子の展開関数。(エントリータグ, 要素インデックス, エントリー)のリストを返却。Noneの場合は遅延展開しない(default = None) @see ASTFinder.unfold
+		"""
+		self.__unfold = unfold
+		self.__unfolded = array('b')
 		self.__entries: list[T] = []
-		self.__indexs: dict[str, tuple[int, int]] = {}
+		self.__tag_ids: dict[str, int] = {}
+		self.__tag_names: list[str] = []
+		self.__tags = array('i')
+		self.__parents = array('i')
+		self.__elem_indexs = array('i')
+		self.__roots: list[int] = []
+		self.__children: dict[int, list[int]] = {}
+		self.__ends = array('i')
+		self.__ends_dirty = False
+		self.__paths: dict[int, str] = {}
+		self.__indexs: dict[str, int] = {}
 
 	def exists(self, full_path: str) -> bool:
 		"""指定のパスのエントリーが存在するか判定
@@ -27,7 +61,156 @@ class EntryCache(Generic[T]):
 		Returns:
 			bool: True = 存在する
 		"""
-		return full_path in self.__indexs
+		return self.__find(full_path) != -1
+
+	def index_of(self, full_path: str) -> int:
+		"""指定のパスのエントリーのインデックスを取得
+
+		Args:
+			full_path (str): フルパス
+		Returns:
+			int: インデックス
+		Raises:
+			NotFoundError: エントリーが存在しない
+		"""
+		index = self.__find(full_path)
+		if index == -1:
+			raise NotFoundError(full_path)
+
+		return index
+
+	def __find(self, full_path: str) -> int:
+		"""指定のパスの要素をルートから順に辿り、エントリーのインデックスを検索
+
+		Args:
+			full_path (str): フルパス
+		Returns:
+			int: インデックス。エントリーが存在しない場合は-1
+		"""
+		if full_path in self.__indexs:
+			return self.__indexs[full_path]
+
+		index = -1
+		for tag, elem_index in ParsedPath.parse(full_path).pairs:
+			candidates = self.children_of(index) if index != -1 else self.__roots
+			tag_id = self.tag_id(tag)
+			index = next((child for child in candidates if self.__tags[child] == tag_id and self.__elem_indexs[child] == elem_index), -1)
+			if index == -1:
+				return -1
+
+		if index != -1:
+			self.__indexs[full_path] = index
+
+		return index
+
+	def path_of(self, index: int) -> str:
+		"""指定のインデックスのエントリーのフルパスを取得
+
+		Args:
+			index (int): インデックス
+		Returns:
+			str: フルパス
+		Note:
+			未生成の祖先のパスも合わせて生成し、キャッシュする
+		"""
+		unders: list[int] = []
+		at = index
+		while at != -1 and at not in self.__paths:
+			unders.append(at)
+			at = self.__parents[at]
+
+		path = self.__paths[at] if at != -1 else ''
+		for under in reversed(unders):
+			tag = self.__tag_names[self.__tags[under]]
+			elem_index = self.__elem_indexs[under]
+			path = DSN.join(path, tag if elem_index == -1 else f'{tag}[{elem_index}]')
+			self.__paths[under] = path
+			self.__indexs[path] = under
+
+		return self.__paths[index]
+
+	def at(self, index: int) -> T:
+		"""指定のインデックスのエントリーをフェッチ
+
+		Args:
+			index (int): インデックス
+		Returns:
+			T: エントリー
+		"""
+		return self.__entries[index]
+
+	def tag_of(self, index: int) -> str:
+		"""指定のインデックスのエントリータグを取得
+
+		Args:
+			index (int): インデックス
+		Returns:
+			str: エントリータグ
+		"""
+		return self.__tag_names[self.__tags[index]]
+
+	def tag_id_of(self, index: int) -> int:
+		"""指定のインデックスのエントリータグIDを取得
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: エントリータグID
+		"""
+		return self.__tags[index]
+
+	def tag_id(self, tag: str) -> int:
+		"""エントリータグをIDに変換。未登録のタグは-1
+
+		Args:
+			tag (str): エントリータグ
+		Returns:
+			int: エントリータグID
+		"""
+		return self.__tag_ids.get(tag, -1)
+
+	def parent_of(self, index: int) -> int:
+		"""指定のインデックスの親のインデックスを取得。ルートの場合は-1
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: 親のインデックス
+		"""
+		return self.__parents[index]
+
+	def children_of(self, index: int) -> list[int]:
+		"""指定のインデックスの子のインデックスを取得
+
+		Args:
+			index (int): インデックス
+		Returns:
+			list[int]: 子のインデックスリスト
+		Note:
+			内部のリストをそのまま返却するため、呼び出し側で変更しないこと
+			展開関数を指定した場合、未展開の子はこの時点で展開して登録する
+		"""
+		if self.__unfold is not None and not self.__unfolded[index]:
+			self.__unfolded[index] = 1
+			for tag, elem_index, child in self.__unfold(self.__entries[index]):
+				self.add(child, tag, index, elem_index)
+
+		return self.__children.get(index, [])
+
+	def end_of(self, index: int) -> int:
+		"""指定のインデックスの配下の末尾のインデックスを取得
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: 配下の末尾のインデックス。配下が無い場合は自身
+		Raises:
+			LogicError: 遅延展開が有効
+		"""
+		if self.__unfold is not None:
+			raise LogicError(f'Not supported with lazy unfolding. index: {index}')
+
+		return self.__settled_ends()[index]
 
 	def by(self, full_path: str) -> T:
 		"""指定のパスのエントリーをフェッチ
@@ -36,46 +219,146 @@ class EntryCache(Generic[T]):
 			full_path (str): フルパス
 		Returns:
 			T: エントリー
+		Raises:
+			NotFoundError: エントリーが存在しない
 		"""
-		if not self.exists(full_path):
-			raise NotFoundError(full_path)
-
-		begin, _ = self.__indexs[full_path]
-		return self.__entries[begin]
+		return self.__entries[self.index_of(full_path)]
 
-	def group_by(self, via: str) -> dict[str, T]:
+	def group_by(self, via: str) -> 'EntryGroup[T]':
 		"""指定の基準パス以下のエントリーをフェッチ
 
 		Args:
 			via (str): 基準のパス(フルパス)
 		Returns:
-			dict[str, T]: (フルパス, エントリー)
+			EntryGroup[T]: (フルパス, エントリー)のビュー
+		Raises:
+			NotFoundError: エントリーが存在しない
+			LogicError: 遅延展開が有効
+		"""
+		begin = self.index_of(via)
+		return EntryGroup(self, begin, self.end_of(begin))
+
+	def add(self, entry: T, tag: str, parent: int = -1, elem_index: int = -1) -> int:
+		"""エントリーを親のインデックスと紐付けてキャッシュに追加
+
+		Args:
+			entry (T): エントリー
+			tag (str): エントリータグ
+			parent (int): 親のインデックス。ルートの場合は-1 (default = -1)
+			elem_index (int): パスの要素インデックス。同名の兄弟が無い場合は-1 (default = -1)
+		Returns:
+			int: 追加したエントリーのインデックス
+		Note:
+			親のエントリーは登録済みであることが前提
+		"""
+		index = len(self.__entries)
+		self.__entries.append(entry)
+		self.__tags.append(self.__register_tag(tag))
+		self.__parents.append(parent)
+		self.__elem_indexs.append(elem_index)
+		self.__unfolded.append(0)
+		self.__ends.append(index)
+		self.__ends_dirty = True
+
+		if parent == -1:
+			self.__roots.append(index)
+			return index
+
+		if parent not in self.__children:
+			self.__children[parent] = []
+
+		self.__children[parent].append(index)
+		return index
+
+	def __settled_ends(self) -> array:
+		"""配下の末尾のインデックスを確定して取得
+
+		Returns:
+			array: 配下の末尾のインデックスの配列
+		Note:
+			子は必ず親より後方に登録されるため、末尾から走査すると子の確定後に親を確定できる(帰りがけ順)
+			親の末尾は最後の子の末尾と一致する
+		"""
+		if self.__ends_dirty:
+			for index in reversed(range(len(self.__ends))):
+				children = self.__children.get(index)
+				self.__ends[index] = self.__ends[children[-1]] if children else index
+
+			self.__ends_dirty = False
+
+		return self.__ends
+
+	def __register_tag(self, tag: str) -> int:
+		"""エントリータグを登録してIDを取得
+
+		Args:
+			tag (str): エントリータグ
+		Returns:
+			int: エントリータグID
+		"""
+		if tag not in self.__tag_ids:
+			self.__tag_ids[tag] = len(self.__tag_names)
+			self.__tag_names.append(tag)
+
+		return self.__tag_ids[tag]
+
+
+class EntryGroup(Generic[T]):
+	"""エントリーキャッシュの連続した区間に対するビュー。辞書を構築せずに区間内のエントリーを参照する"""
+
+	def __init__(self, entries: EntryCache[T], begin: int, end: int) -> None:
+		"""インスタンスを生成
+
+		Args:
+			entries (EntryCache[T]): エントリーキャッシュ
+			begin (int): 区間の先頭のインデックス
+			end (int): 区間の末尾のインデックス
 		"""
-		if not self.exists(via):
-			raise NotFoundError(via)
+		self.__entries = entries
+		self.__begin = begin
+		self.__end = end
 
-		begin, end = self.__indexs[via]
-		items = self.__entries[begin:end + 1]
-		keys = list(self.__indexs.keys())[begin:end + 1]
-		return {keys[index]: items[index] for index in range((end + 1) - begin)}
+	def __len__(self) -> int:
+		"""int: 区間内のエントリー数"""
+		return self.__end - self.__begin + 1
 
-	def add(self, full_path: str, entry: T) -> None:
-		"""指定のパスとエントリーを紐付けてキャッシュに追加
+	def __contains__(self, full_path: str) -> bool:
+		"""区間内に指定のパスのエントリーが存在するか判定
 
 		Args:
 			full_path (str): フルパス
-			entry (str): フルパス
+		Returns:
+			bool: True = 存在する
 		"""
-		if self.exists(full_path):
-			return
+		return self.__entries.exists(full_path) and self.__begin <= self.__entries.index_of(full_path) <= self.__end
 
-		begin = len(self.__entries)
-		self.__entries.append(entry)
-		self.__indexs[full_path] = (begin, begin)
-
-		remain = full_path.split('.')[:-1]
-		while len(remain):
-			in_key = '.'.join(remain)
-			begin, end = self.__indexs[in_key]
-			self.__indexs[in_key] = (begin, end + 1)
-			remain.pop()
+	def __getitem__(self, full_path: str) -> T:
+		"""区間内の指定のパスのエントリーをフェッチ
+
+		Args:
+			full_path (str): フルパス
+		Returns:
+			T: エントリー
+		Raises:
+			KeyError: 区間内にエントリーが存在しない
+		"""
+		if full_path not in self:
+			raise KeyError(full_path)
+
+		return self.__entries.by(full_path)
+
+	def __iter__(self) -> Iterator[str]:
+		"""Iterator[str]: フルパスのイテレーター"""
+		return self.keys()
+
+	def keys(self) -> Iterator[str]:
+		"""Iterator[str]: フルパスのイテレーター"""
+		return (self.__entries.path_of(index) for index in range(self.__begin, self.__end + 1))
+
+	def values(self) -> Iterator[T]:
+		"""Iterator[T]: エントリーのイテレーター"""
+		return (self.__entries.at(index) for index in range(self.__begin, self.__end + 1))
+
+	def items(self) -> Iterator[tuple[str, T]]:
+		"""Iterator[tuple[str, T]]: (フルパス, エントリー)のイテレーター"""
+		return ((self.__entries.path_of(index), self.__entries.at(index)) for index in range(self.__begin, self.__end + 1))
@@ -1,3 +1,7 @@
+import functools
+import sys
+
+
 class DSN:
 	"""AST用のドメイン名ユーティリティー。ドット区切りで要素を結合した書式を前提とする"""
 
@@ -10,7 +14,7 @@ class DSN:
 		Returns:
 			int: 要素数
 		"""
-		return len(cls.elements(origin))
+		return len(cls.parts(origin))
 
 	@classmethod
 	def elements(cls, origin: str) -> list[str]:
@@ -21,7 +25,22 @@ class DSN:
 		Returns:
 			list[str]: 要素リスト
 		"""
-		return [elem for elem in origin.split('.') if elem]
+		return list(cls.parts(origin))
+
+	@classmethod
+	@functools.lru_cache(maxsize=32768)
+	def parts(cls, origin: str) -> tuple[str, ...]:
+		"""ドメイン名を要素に分解(不変版)
+
+		Args:
+			origin (str): ドメイン名
+		Returns:
+			tuple[str, ...]: 要素リスト
+		Note:
+			分解結果はキャッシュし、同じドメイン名の分解を省略する
+			各要素はインターンし、異なるドメイン名の間で同じ文字列を共有する
+		"""
+		return tuple(sys.intern(elem) for elem in origin.split('.') if elem)
 
 	@classmethod
 	def join(cls, *prats: str) -> str:
@@ -44,7 +63,7 @@ class DSN:
 		Returns:
 			str: ドメイン名
 		"""
-		return cls.join(*(cls.elements(origin)[0:counts]))
+		return cls.join(*(cls.parts(origin)[0:counts]))
 
 	@classmethod
 	def right(cls, origin: str, counts: int) -> str:
@@ -56,7 +75,7 @@ class DSN:
 		Returns:
 			str: ドメイン名
 		"""
-		return cls.join(*(cls.elements(origin)[-counts:]))
+		return cls.join(*(cls.parts(origin)[-counts:]))
 
 	@classmethod
 	def root(cls, origin: str) -> str:
@@ -67,7 +86,7 @@ class DSN:
 		Returns:
 			str: ルート要素
 		"""
-		return cls.elements(origin)[0]
+		return cls.parts(origin)[0]
 
 	@classmethod
 	def parent(cls, origin: str) -> str:
@@ -78,4 +97,4 @@ class DSN:
 		Returns:
 			str: 親の要素
 		"""
-		return cls.elements(origin)[-2]
+		return cls.parts(origin)[-2]
@@ -1,10 +1,12 @@
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from typing import Any, Sequence
 
 
 class Entry(metaclass=ABCMeta):
 	"""ASTの各要素に対応するエントリーの抽象基底クラス"""
 
+	__slots__ = ()
+
 	@property
 	@abstractmethod
 	def source(self) -> Any:
@@ -25,8 +27,8 @@ class Entry(metaclass=ABCMeta):
 
 	@property
 	@abstractmethod
-	def children(self) -> list['Entry']:
-		"""list[Entry]: 配下のエントリーリスト"""
+	def children(self) -> Sequence['Entry']:
+		"""Sequence[Entry]: 配下のエントリーリスト"""
 		raise NotImplementedError()
 
 	@property
@@ -1,4 +1,5 @@
-from typing import Callable
+from collections import Counter
+from typing import Callable, Iterator
 
 from py2cpp.errors import NotFoundError
 from py2cpp.ast.entry import Entry
@@ -84,8 +85,7 @@ class ASTFinder:
 			NotFoundError: 基点のエントリーが存在しない
 		"""
 		entry = self.pluck(root, via)
-		all = self.full_pathfy(entry, via, depth)
-		return {in_path: in_entry for in_path, in_entry in all.items() if tester(in_entry, in_path)}
+		return {in_path: in_entry for in_path, in_entry in self.walk(entry, via, depth) if tester(in_entry, in_path)}
 
 	def full_pathfy(self, entry: Entry, path: str = '', depth: int = -1) -> dict[str, Entry]:
 		"""指定のエントリー以下のフルパスとマッピングを生成
@@ -96,6 +96,20 @@ class ASTFinder:
 			depth (int): 探索深度(-1: 無制限)
 		Returns:
 			dict[str, Entry]: フルパスとエントリーのマップ
+		Note:
+			@see walk
+		"""
+		return dict(self.walk(entry, path, depth))
+
+	def walk(self, entry: Entry, path: str = '', depth: int = -1) -> Iterator[tuple[str, Entry]]:
+		"""指定のエントリー以下を行きがけ順に走査し、フルパスとエントリーを順次返却
+
+		Args:
+			entry (entry): エントリー
+			path (str): 引数のエントリーのフルパス
+			depth (int): 探索深度(-1: 無制限)
+		Returns:
+			Iterator[tuple[str, Entry]]: (フルパス, エントリー)
 		Note:
 			引数のpathには必ずルート要素からのフルパスを指定すること
 			相対パスを指定してこの関数を実行すると、本来のフルパスとの整合性が取れなくなる点に注意
@@ -108,34 +122,60 @@ class ASTFinder:
 		if not len(path):
 			path = entry.name
 
-		in_paths = {path: entry}
-		if depth == 0:
-			return in_paths
+		stack: list[tuple[str, Entry, int]] = [(path, entry, depth)]
+		while len(stack):
+			in_path, in_entry, in_depth = stack.pop()
+			yield in_path, in_entry
 
-		if entry.has_child:
-			children = entry.children
-			tag_of_indexs = self.__aligned_children(children)
-			for index, in_entry in enumerate(children):
+			if in_depth == 0 or not in_entry.has_child:
+				continue
+
+			unders: list[tuple[str, Entry, int]] = []
+			for entry_tag, elem_index, child in self.unfold(in_entry):
 				# 同名の要素が並ぶか否かでパスの書式を変更
-				# @see EntryPath.identify
-				entry_tag = in_entry.name
-				indivisual = len(tag_of_indexs[entry_tag]) == 1
-				in_path = EntryPath.join(path, entry_tag) if indivisual else EntryPath.identify(path, entry_tag, index)
-				in_paths = {**in_paths, **self.full_pathfy(children[index], in_path.origin, depth - 1)}
+				child_path = EntryPath.join(in_path, entry_tag) if elem_index == -1 else EntryPath.identify(in_path, entry_tag, elem_index)
+				unders.append((child_path.origin, child, in_depth - 1))
+
+			stack.extend(reversed(unders))
 
-		return in_paths
+	def walk_indexs(self, entry: Entry, depth: int = -1) -> Iterator[tuple[int, int, Entry]]:
+		"""指定のエントリー以下を行きがけ順に走査し、親のインデックスとエントリーを順次返却
 
-	def __aligned_children(self, children: list[Entry]) -> dict[str, list[int]]:
-		"""子の要素を元にエントリータグ毎のインデックスリストに整理する
+		Args:
+			entry (entry): エントリー
+			depth (int): 探索深度(-1: 無制限)
+		Returns:
+			Iterator[tuple[int, int, Entry]]: (親のインデックス, 要素インデックス, エントリー)
+		Note:
+			インデックスは走査順の連番。引数のエントリーの親のインデックスは-1
+			パスを生成しないため、パスが必要な場合は要素インデックスから組み立てる @see unfold
+		"""
+		index = 0
+		stack: list[tuple[int, int, Entry, int]] = [(-1, -1, entry, depth)]
+		while len(stack):
+			parent, elem_index, in_entry, in_depth = stack.pop()
+			yield parent, elem_index, in_entry
+
+			if in_depth != 0 and in_entry.has_child:
+				stack.extend(reversed([(index, in_elem_index, child, in_depth - 1) for _, in_elem_index, child in self.unfold(in_entry)]))
+
+			index += 1
+
+	def unfold(self, entry: Entry) -> list[tuple[str, int, Entry]]:
+		"""子のエントリーをエントリータグと要素インデックスと共に取得
 
 		Args:
-			children (list[Entry]): 子の要素リスト
+			entry (Entry): エントリー
 		Returns:
-			dict[str, list[int]]: エントリータグ毎のインデックスリスト
+			list[tuple[str, int, Entry]]: (エントリータグ, 要素インデックス, エントリー)のリスト。子を持たない場合は空
+		Note:
+			要素インデックスは同名の兄弟が並ぶ場合のみ子のインデックスを設定し、それ以外は-1 @see EntryPath.identify
+			参照するのは1階層下のエントリーのみで、それより下のエントリーには触れない
 		"""
-		index_of_tags = {index: in_entry.name for index, in_entry in enumerate(children)}
-		tag_of_indexs: dict[str, list[int]]  = {tag: [] for tag in index_of_tags.values()}
-		for tag in tag_of_indexs.keys():
-			tag_of_indexs[tag] = [index for index, in_tag in index_of_tags.items() if tag == in_tag]
+		if not entry.has_child:
+			return []
 
-		return tag_of_indexs
+		children = entry.children
+		tags = [child.name for child in children]
+		tag_counts = Counter(tags)
+		return [(tag, index if tag_counts[tag] > 1 else -1, child) for index, (tag, child) in enumerate(zip(tags, children))]
@@ -1,9 +1,83 @@
+import functools
 import re
+import sys
+from typing import Any
 
 from py2cpp.ast.dsn import DSN
 from py2cpp.errors import LogicError
 
 
+class ParsedPath:
+	"""分解済みのエントリーパス。不変オブジェクトとしてインターンテーブルで共有
+
+	Attributes:
+		origin (str): パス
+		elements (tuple[str, ...]): 区切り文字で分解した要素リスト
+		pairs (tuple[tuple[str, int], ...]): (エントリータグ, 要素インデックス)のリスト。インデックスがない場合は-1
+		tags (tuple[str, ...]): エントリータグリスト
+		de_identified (str): 一意性を解除したパス
+	"""
+
+	__slots__ = ('origin', 'elements', 'pairs', 'tags', 'de_identified', '_hash')
+
+	@classmethod
+	@functools.lru_cache(maxsize=32768)
+	def parse(cls, origin: str) -> 'ParsedPath':
+		"""パスを分解してインスタンスを生成。同じパスは同じインスタンスを返却
+
+		Args:
+			origin (str): パス
+		Returns:
+			ParsedPath: インスタンス
+		"""
+		return cls(origin)
+
+	def __init__(self, origin: str) -> None:
+		"""インスタンスを生成
+
+		Args:
+			origin (str): パス
+		Note:
+			直接生成せず、parseを経由することを推奨
+		"""
+		elements = DSN.parts(origin)
+		pairs = tuple(self.break_tag(elem) for elem in elements)
+		tags = tuple(tag for tag, _ in pairs)
+		object.__setattr__(self, 'origin', origin)
+		object.__setattr__(self, 'elements', elements)
+		object.__setattr__(self, 'pairs', pairs)
+		object.__setattr__(self, 'tags', tags)
+		object.__setattr__(self, 'de_identified', '.'.join(tags))
+		object.__setattr__(self, '_hash', hash(origin))
+
+	def __setattr__(self, name: str, value: Any) -> None:
+		"""Note: 不変オブジェクトのため変更は禁止"""
+		raise AttributeError(f'{self.__class__.__name__} is immutable. name: {name}')
+
+	def __hash__(self) -> int:
+		"""int: ハッシュ値"""
+		return self._hash
+
+	def __eq__(self, other: object) -> bool:
+		"""bool: True = 同じパス"""
+		return isinstance(other, ParsedPath) and self.origin == other.origin
+
+	@classmethod
+	@functools.lru_cache(maxsize=4096)
+	def break_tag(cls, elem: str) -> tuple[str, int]:
+		"""要素から元のタグと付与されたインデックスに分解。インデックスがない場合は-1とする
+
+		Args:
+			elem (str): 要素
+		Returns:
+			tuple[str, int]: (エントリータグ, インデックス)
+		Note:
+			分解結果はキャッシュし、異なるパスの間で同じ要素の分解結果を共有する
+		"""
+		matches = re.fullmatch(r'(\w+)\[(\d+)\]', elem)
+		return (sys.intern(matches[1]), int(matches[2])) if matches else (elem, -1)
+
+
 class EntryPath:
 	"""エントリーパス"""
 
@@ -39,15 +113,20 @@ class EntryPath:
 		"""
 		self.origin = origin
 
+	@property
+	def parsed(self) -> ParsedPath:
+		"""ParsedPath: 分解済みのパス"""
+		return ParsedPath.parse(self.origin)
+
 	@property
 	def valid(self) -> bool:
 		"""bool: True = パスが有効"""
-		return DSN.elem_counts(self.origin) > 0
+		return len(self.parsed.elements) > 0
 
 	@property
 	def elements(self) -> list[str]:
 		"""list[str]: 区切り文字で分解した要素を返却"""
-		return DSN.elements(self.origin)
+		return list(self.parsed.elements)
 
 	@property
 	def escaped_origin(self) -> str:
@@ -71,7 +150,7 @@ class EntryPath:
 		Returns:
 			tuple[str, int]: (エントリータグ, 要素インデックス)
 		"""
-		return self.__break_tag(self.elements[0])
+		return self.parsed.pairs[0]
 
 	@property
 	def last(self) -> tuple[str, int]:
@@ -80,7 +159,7 @@ class EntryPath:
 		Returns:
 			tuple[str, int]: (エントリータグ, 要素インデックス)
 		"""
-		return self.__break_tag(self.elements[-1])
+		return self.parsed.pairs[-1]
 
 	@property
 	def first_tag(self) -> str:
@@ -107,18 +186,7 @@ class EntryPath:
 		Returns:
 			str: エントリータグ
 		"""
-		return self.shift(-1).last[0]
-
-	def __break_tag(self, elem: str) -> tuple[str, int]:
-		"""要素から元のタグと付与されたインデックスに分解。インデックスがない場合は-1とする
-
-		Args:
-			elem (str): 要素
-		Returns:
-			tuple[str, int]: (エントリータグ, インデックス)
-		"""
-		matches = re.fullmatch(r'(\w+)\[(\d+)\]', elem)
-		return (matches[1], int(matches[2])) if matches else (elem, -1)
+		return self.parsed.tags[-2]
 
 	def contains(self, entry_tag: str) -> bool:
 		"""指定のエントリータグが含まれるか判定
@@ -128,7 +196,7 @@ class EntryPath:
 		Returns:
 			bool: True = 含まれる
 		"""
-		return entry_tag in self.de_identify().elements
+		return entry_tag in self.parsed.tags
 
 	def consists_of_only(self, *entry_tags: str) -> bool:
 		"""指定のエントリータグのみでパスが構築されているか判定
@@ -138,7 +206,7 @@ class EntryPath:
 		Returns:
 			bool: True = 構築されている
 		"""
-		return len([entry_tag for entry_tag in self.de_identify().elements if entry_tag not in entry_tags]) == 0
+		return len([entry_tag for entry_tag in self.parsed.tags if entry_tag not in entry_tags]) == 0
 
 	def de_identify(self) -> 'EntryPath':
 		"""一意性を解除したパスでインスタンスを生成
@@ -146,7 +214,7 @@ class EntryPath:
 		Returns:
 			EntryPath: インスタンス
 		"""
-		return EntryPath(re.sub(r'\[\d+\]', '', self.origin))
+		return EntryPath(self.parsed.de_identified)
 
 	def relativefy(self, starts: str) -> 'EntryPath':
 		"""指定のパスより先の相対パスでインスタンスを生成
@@ -172,7 +240,7 @@ class EntryPath:
 		Returns:
 			EntryPath: インスタンス
 		"""
-		elems = self.elements
+		elems = self.parsed.elements
 		if skip == 0:
 			pass
 		elif skip > 0:
@@ -22,6 +22,41 @@ class Query(Generic[T], metaclass=ABCMeta):
 		"""
 		raise NotImplementedError()
 
+	@abstractmethod
+	def id_of(self, full_path: str) -> int:
+		"""指定のパスに紐づくエントリーのIDを取得
+
+		Args:
+			full_path (str): フルパス
+		Returns:
+			int: エントリーID
+		Raises:
+			NotFoundError: エントリーが存在しない
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def path_of(self, entry_id: int) -> str:
+		"""指定のIDのエントリーのフルパスを取得
+
+		Args:
+			entry_id (int): エントリーID
+		Returns:
+			str: フルパス
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def tag_of(self, entry_id: int) -> str:
+		"""指定のIDのエントリータグを取得
+
+		Args:
+			entry_id (int): エントリーID
+		Returns:
+			str: エントリータグ
+		"""
+		raise NotImplementedError()
+
 	@abstractmethod
 	def by(self, full_path: str) -> T:
 		"""指定のパスに紐づく一意なエントリーをフェッチ
@@ -88,6 +123,20 @@ class Query(Generic[T], metaclass=ABCMeta):
 		"""
 		raise NotImplementedError()
 
+	@abstractmethod
+	def at(self, via: str, index: int) -> T:
+		"""指定のパスを基準に1階層下の指定のインデックスのエントリーをフェッチ
+
+		Args:
+			via (str): 基点のパス(フルパス)
+			index (int): 子のインデックス
+		Returns:
+			T: エントリー
+		Raises:
+			NotFoundError: 基点のエントリー、または指定のインデックスの子が存在しない
+		"""
+		raise NotImplementedError()
+
 	@abstractmethod
 	def expand(self, via: str) -> list[T]:
 		"""指定のパスから下に存在する展開が可能なエントリーをフェッチ
@@ -111,3 +160,115 @@ class Query(Generic[T], metaclass=ABCMeta):
 			list[str]: 値リスト
 		"""
 		raise NotImplementedError()
+
+	@abstractmethod
+	def node_of(self, entry_id: int) -> T:
+		"""指定のIDのエントリーをフェッチ
+
+		Args:
+			entry_id (int): エントリーID
+		Returns:
+			T: エントリー
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def parent_of(self, entry_id: int) -> T:
+		"""指定のIDのエントリーを子として親のエントリーをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			T: エントリー
+		Raises:
+			NotFoundError: 親が存在しない
+		Note:
+			@see parent
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def ancestor_of(self, entry_id: int, tag: str) -> T:
+		"""指定のエントリータグを持つ直近の親エントリーをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+			tag (str): エントリータグ
+		Returns:
+			T: エントリー
+		Raises:
+			NotFoundError: 指定のエントリータグを持つ親が存在しない
+		Note:
+			@see ancestor
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def siblings_of(self, entry_id: int) -> list[T]:
+		"""指定のIDのエントリーを基準に同階層のエントリーをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[T]: エントリーリスト
+		Raises:
+			NotFoundError: 親が存在しない
+		Note:
+			@see siblings
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def children_of(self, entry_id: int) -> list[T]:
+		"""指定のIDのエントリーを基準に1階層下のエントリーをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[T]: エントリーリスト
+		Note:
+			@see children
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def child_of(self, entry_id: int, index: int) -> T:
+		"""指定のIDのエントリーを基準に1階層下の指定のインデックスのエントリーをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+			index (int): 子のインデックス
+		Returns:
+			T: エントリー
+		Raises:
+			NotFoundError: 指定のインデックスの子が存在しない
+		Note:
+			@see at
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def expand_of(self, entry_id: int) -> list[T]:
+		"""指定のIDのエントリーから下に存在する展開が可能なエントリーをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[T]: エントリーリスト
+		Note:
+			@see expand
+		"""
+		raise NotImplementedError()
+
+	@abstractmethod
+	def values_of(self, entry_id: int) -> list[str]:
+		"""指定のIDのエントリー以下(基点を含む)のエントリーの値を取得
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[str]: 値リスト
+		Note:
+			@see values
+		"""
+		raise NotImplementedError()
@@ -1,14 +1,24 @@
+from concurrent.futures import ProcessPoolExecutor
+import glob
+from itertools import repeat
+import json
 import os
 import sys
-from typing import Generic, Iterator, TypedDict, TypeVar
+import time
+from typing import IO, ClassVar, Generic, Iterator, NamedTuple, TypedDict, TypeVar, cast
 
+from py2cpp.analize.db import LibraryExpands
 from py2cpp.analize.procedure import Procedure
 from py2cpp.app.app import App
-from py2cpp.ast.parser import ParserSetting
+from py2cpp.ast.parser import ParserSetting, SyntaxParser
+from py2cpp.ast.provider import cache_setting
 from py2cpp.errors import LogicError
+from py2cpp.lang.di import ModuleDefinitions
 from py2cpp.lang.error import stacktrace
 from py2cpp.lang.eventemitter import EventEmitter, T_Callback
-from py2cpp.module.types import ModulePath
+from py2cpp.module.depends import DependGraph, collect_imports, file_digest, package_digest, source_path_of
+from py2cpp.module.module import Module
+from py2cpp.module.types import LibraryPaths, ModulePath
 import py2cpp.node.definition as defs
 from py2cpp.node.node import Node
 from py2cpp.view.render import Renderer, Writer
@@ -296,22 +306,60 @@ class Handler(Procedure[str]):
 		return node.tokens
 
 
+T_Args = TypedDict('T_Args', {'grammar': str, 'sources': list[str], 'workers': int, 'serve': bool, 'incremental': bool})
+
+
 class Args:
 	def __init__(self) -> None:
 		args = self.__parse_argv()
 		self.grammar = args['grammar']
-		self.source = args['source']
+		self.sources = args['sources']
+		self.source = self.sources[0] if len(self.sources) else ''
+		self.workers = args['workers']
+		self.serve = args['serve']
+		self.incremental = args['incremental']
+
+	@property
+	def batch(self) -> bool:
+		return len(self.sources) > 1 or os.path.isdir(self.source) or self.incremental
+
+	def __parse_argv(self) -> T_Args:
+		_, grammar, *options = sys.argv
+		sources: list[str] = []
+		workers = os.cpu_count() or 1
+		serve = False
+		incremental = False
+		while len(options):
+			option = options.pop(0)
+			if option in ['-w', '--workers']:
+				workers = max(1, int(options.pop(0)))
+			elif option == '--serve':
+				serve = True
+			elif option in ['-i', '--incremental']:
+				incremental = True
+			else:
+				sources.append(option)
+
+		if len(sources) == 0 and not serve:
+			raise LogicError('Source not specified')
+
+		return {'grammar': grammar, 'sources': sources, 'workers': workers, 'serve': serve, 'incremental': incremental}
+
 
-	def __parse_argv(self) -> dict[str, str]:
-		_, grammar, source = sys.argv
-		return {'grammar': grammar, 'source': source}
+def output_path(source: str) -> str:
+	basepath, _ = os.path.splitext(source)
+	return f'{basepath}.cpp'
+
+
+def source_module_path(source: str) -> ModulePath:
+	basepath, _ = os.path.splitext(os.path.normpath(source))
+	module_path = basepath.replace(os.path.sep, '.')
+	return ModulePath('__main__', module_path)
 
 
 def make_context(args: Args) -> Context:
-	basepath, _ = os.path.splitext(args.source)
-	output = f'{basepath}.cpp'
 	template_dir = 'example/template'
-	return Context(Writer(output), Renderer(template_dir))
+	return Context(Writer(output_path(args.source)), Renderer(template_dir))
 
 
 def make_parser_setting(args: Args) -> ParserSetting:
@@ -319,31 +367,360 @@ def make_parser_setting(args: Args) -> ParserSetting:
 
 
 def make_module_path(args: Args) -> ModulePath:
-	basepath, _ = os.path.splitext(args.source)
-	module_path = basepath.replace('/', '.')
-	return ModulePath('__main__', module_path)
+	return source_module_path(args.source)
+
+
+def transpile(root: Node, ctx: Context, verbose: bool) -> None:
+	"""ASTをC++のソースコードへ変換して出力
+
+	Args:
+		root (Node): エントリーポイントのノード
+		ctx (Context): コンテキスト
+		verbose (bool): True = 処理したノードを表示
+	Note:
+		トップレベルのステートメント毎に変換結果を一時ファイルへスピルし、バッファの増加を抑える @see Writer.spill
+		ステートメントの区切りはブロックのテンプレート(block.j2)と同じく改行を使用
+		エントリーポイント自体はステートメントを連結するのみのため処理しない
+	"""
+	handler = Handler(ctx.view)
+	top_levels = {statement.entry_id for statement in root.as_a(defs.Entrypoint).statements}
+	emitted = 0
+
+	for node in root.calculated():
+		if verbose:
+			print('action:', str(node))
 
+		handler.process(node)
 
-def task(root: Node, ctx: Context) -> None:
-	try:
-		handler = Handler(ctx.view)
+		if node.entry_id not in top_levels:
+			continue
 
-		flatted = root.calculated()
-		flatted.append(root)  # XXX
+		for statement in handler.drain():
+			ctx.writer.put(f'\n{statement}' if emitted > 0 else statement)
+			emitted += 1
+
+		ctx.writer.spill()
+
+	ctx.writer.flush()
 
-		for node in flatted:
-			print('action:', str(node))
-			handler.process(node)
 
-		ctx.writer.put(handler.result())
-		ctx.writer.flush()
+def task(root: Node, ctx: Context) -> None:
+	try:
+		transpile(root, ctx, verbose=True)
 	except Exception as e:
+		ctx.writer.rollback()
 		print(''.join(stacktrace(e)))
 
 
+def batch_task(root: Node, ctx: Context) -> list[str]:
+	try:
+		transpile(root, ctx, verbose=False)
+		return collect_imports(root)
+	except Exception:
+		ctx.writer.rollback()
+		raise
+
+
+class BatchResult(NamedTuple):
+	source: str
+	seconds: float
+	error: str
+	imports: dict[str, list[str]] = {}
+	skipped: bool = False
+
+
+class BatchWorker:
+	"""バッチ変換のワーカー。パーサー・標準ライブラリー・テンプレートをプロセス内の全モジュールで共有
+
+	Note:
+		ワーカープロセス毎に1度だけ生成 @see setup
+		共有するモジュールは標準ライブラリーのみ。それ以外のモジュールは変更され得るため、変換毎にロードする
+	"""
+
+	instance: ClassVar['BatchWorker | None'] = None
+
+	@classmethod
+	def setup(cls, grammar: str) -> None:
+		cls.instance = cls(grammar)
+
+	@classmethod
+	def run(cls, source: str, depends: bool = False) -> BatchResult:
+		return cast(BatchWorker, cls.instance).transpile(source, depends)
+
+	def __init__(self, grammar: str) -> None:
+		app = App({'py2cpp.ast.parser.ParserSetting': lambda: ParserSetting(grammar=grammar)})
+		self.__parser = app.resolve(SyntaxParser)
+		self.__library_paths = app.resolve(LibraryPaths)
+		self.__libraries: dict[str, Module] = {}
+		self.__imports: dict[tuple[str, str], list[str]] = {}
+		self.__library_expands = LibraryExpands()
+		self.__renderer = Renderer('example/template')
+
+	def load(self, module_path: str) -> Module:
+		if module_path not in self.__library_paths:
+			return self.__load_module(module_path)
+
+		if module_path not in self.__libraries:
+			self.__libraries[module_path] = self.__load_module(module_path)
+
+		return self.__libraries[module_path]
+
+	def __load_module(self, module_path: str) -> Module:
+		definitions = {
+			**self.__shared_definitions(),
+			'py2cpp.module.types.ModulePath': lambda: ModulePath(module_path, module_path),
+		}
+		return App(definitions).resolve(Module)
+
+	def warmup(self) -> None:
+		"""パーサー・標準ライブラリーのモジュールとシンボルの展開データを事前にロード"""
+		for module_path in self.__library_paths:
+			self.__library_expands.expand(self.load(module_path))
+
+	def __shared_definitions(self) -> ModuleDefinitions:
+		return {
+			'py2cpp.analize.db.LibraryExpands': lambda: self.__library_expands,
+			'py2cpp.ast.parser.SyntaxParser': lambda: self.__parser,
+			'py2cpp.module.loader.ModuleLoader': lambda: self.load,
+		}
+
+	def transpile(self, source: str, depends: bool = False) -> BatchResult:
+		"""ソースを変換
+
+		Args:
+			source (str): ソースファイルのパス
+			depends (bool): True = 推移的なインポートを収集(default = False) @see DependGraph
+		Returns:
+			BatchResult: 変換結果
+		"""
+		begin = time.perf_counter()
+		module_path = source_module_path(source)
+		definitions = {
+			**self.__shared_definitions(),
+			f'{Context.__module__}.{Context.__name__}': lambda: Context(Writer(output_path(source)), self.__renderer),
+			'py2cpp.module.types.ModulePath': lambda: module_path,
+		}
+		try:
+			imports = App(definitions).run(batch_task)
+			collected = self.__collect_imports(module_path.actual, imports) if depends else {}
+			return BatchResult(source, time.perf_counter() - begin, '', collected)
+		except Exception as e:
+			return BatchResult(source, time.perf_counter() - begin, ''.join(stacktrace(e)))
+
+	def __collect_imports(self, module_path: str, imports: list[str]) -> dict[str, list[str]]:
+		"""変換したモジュールから推移的にインポートモジュールを辿り、モジュール毎のインポートを収集
+
+		Args:
+			module_path (str): 変換したモジュールのパス
+			imports (list[str]): 変換したモジュールのインポートモジュールのパスリスト
+		Returns:
+			dict[str, list[str]]: モジュールパスとインポートモジュールのパスリストのマップ
+		Note:
+			標準ライブラリーは暗黙的にインポートされるため、変換したモジュールのインポートに含める
+			ソースが存在しないモジュールはインポート無しとして扱う
+		"""
+		collected = {module_path: [*self.__library_paths, *imports]}
+		remains = list(collected[module_path])
+		while len(remains):
+			import_path = remains.pop()
+			if import_path in collected:
+				continue
+
+			collected[import_path] = self.__imports_of(import_path)
+			remains.extend(collected[import_path])
+
+		return collected
+
+	def __imports_of(self, module_path: str) -> list[str]:
+		"""モジュールのインポートモジュールのパスリストを取得。ソースのダイジェスト毎にキャッシュ
+
+		Args:
+			module_path (str): モジュールパス
+		Returns:
+			list[str]: インポートモジュールのパスリスト
+		"""
+		key = (module_path, file_digest(source_path_of(module_path)))
+		if key[1] == '':
+			return []
+
+		if key not in self.__imports:
+			self.__imports[key] = collect_imports(self.load(module_path).entrypoint)
+
+		return self.__imports[key]
+
+
+def collect_sources(sources: list[str]) -> list[str]:
+	founds: list[str] = []
+	for source in sources:
+		if not os.path.isdir(source):
+			founds.append(source)
+			continue
+
+		for dirpath, _, filenames in sorted(os.walk(source)):
+			founds.extend(os.path.join(dirpath, filename) for filename in sorted(filenames) if filename.endswith('.py'))
+
+	return founds
+
+
+def run_batch(grammar: str, sources: list[str], workers: int, depends: bool = False) -> list[BatchResult]:
+	if len(sources) == 0:
+		return []
+
+	if workers == 1:
+		BatchWorker.setup(grammar)
+		return [BatchWorker.run(source, depends) for source in sources]
+
+	# パーサーと標準ライブラリーのキャッシュを事前に生成し、ワーカー間でキャッシュの生成を競合させない
+	BatchWorker.setup(grammar)
+	cast(BatchWorker, BatchWorker.instance).warmup()
+
+	with ProcessPoolExecutor(max_workers=workers, initializer=BatchWorker.setup, initargs=(grammar,)) as executor:
+		return list(executor.map(BatchWorker.run, sources, repeat(depends)))
+
+
+def depends_path() -> str:
+	return os.path.join(cache_setting().basedir, 'depends.json')
+
+
+def depends_environment(grammar: str) -> dict[str, str]:
+	"""変換結果に影響する環境(文法・テンプレート・py2cppパッケージ)のダイジェストを取得"""
+	filepaths = [grammar, *sorted(glob.glob('example/template/**/*.j2', recursive=True))]
+	return {
+		**{os.path.normpath(filepath): file_digest(filepath) for filepath in filepaths},
+		'py2cpp': package_digest(),
+	}
+
+
+def load_depends(filepath: str, environment: dict[str, str]) -> DependGraph:
+	"""依存グラフをファイルから読み込み
+
+	Args:
+		filepath (str): 依存グラフのファイルパス
+		environment (dict[str, str]): 変換環境のダイジェスト @see depends_environment
+	Returns:
+		DependGraph: 依存グラフ。ファイルが存在しない場合は空
+	"""
+	if not os.path.isfile(filepath):
+		return DependGraph(environment)
+
+	with open(filepath, mode='r') as f:
+		return DependGraph.loads(f.read(), environment)
+
+
+def save_depends(filepath: str, graph: DependGraph) -> None:
+	"""依存グラフをファイルへ保存
+
+	Args:
+		filepath (str): 依存グラフのファイルパス
+		graph (DependGraph): 依存グラフ
+	Note:
+		書き込みは一時ファイルを経由するため、保存の途中で中断しても既存のファイルは破損しない @see Writer
+	"""
+	os.makedirs(os.path.dirname(filepath), exist_ok=True)
+	with Writer(filepath) as writer:
+		writer.put(graph.dumps())
+		writer.flush()
+
+
+def run_incremental(grammar: str, sources: list[str], workers: int, graph: DependGraph) -> list[BatchResult]:
+	"""依存グラフに基づき、ソースか推移的なインポートモジュールが変更されたソースのみ変換
+
+	Args:
+		grammar (str): 文法ファイルのパス
+		sources (list[str]): ソースファイルのパスリスト
+		workers (int): ワーカー数
+		graph (DependGraph): 依存グラフ。変換結果を記録する
+	Returns:
+		list[BatchResult]: 変換結果。変換を省略したソースを含む
+	Note:
+		出力ファイルが存在しない場合も変換の対象とする
+	"""
+	module_paths = {source: source_module_path(source).actual for source in sources}
+	dirties = [source for source in sources if graph.dirty(module_paths[source]) or not os.path.exists(output_path(source))]
+	transpiled = {result.source: result for result in run_batch(grammar, dirties, workers, depends=True)}
+	for result in transpiled.values():
+		if result.error:
+			graph.discard(module_paths[result.source])
+		else:
+			graph.record(module_paths[result.source], result.imports)
+
+	return [transpiled[source] if source in transpiled else BatchResult(source, 0.0, '', skipped=True) for source in sources]
+
+
+def report_batch(results: list[BatchResult], seconds: float) -> None:
+	for result in results:
+		status = 'SKIP' if result.skipped else 'NG' if result.error else 'OK'
+		print(f'{status:4} {result.seconds * 1000:9.2f}ms {result.source}')
+
+	failures = [result for result in results if result.error]
+	for result in failures:
+		print(f'==========\n{result.source}\n{result.error}')
+
+	skipped = len([result for result in results if result.skipped])
+	succeeded = len(results) - len(failures) - skipped
+	total = sum(result.seconds for result in results)
+	print(f'files: {len(results)}, succeeded: {succeeded}, failed: {len(failures)}, skipped: {skipped}, elapsed: {seconds:.2f}s, total: {total:.2f}s')
+
+
+def main_batch(args: Args) -> int:
+	begin = time.perf_counter()
+	sources = collect_sources(args.sources)
+	if args.incremental:
+		graph = load_depends(depends_path(), depends_environment(args.grammar))
+		results = run_incremental(args.grammar, sources, args.workers, graph)
+		save_depends(depends_path(), graph)
+	else:
+		results = run_batch(args.grammar, sources, args.workers)
+
+	report_batch(results, time.perf_counter() - begin)
+	return 1 if any(result.error for result in results) else 0
+
+
+def serve(worker: BatchWorker, reader: IO[str], writer: IO[str]) -> None:
+	"""JSON Lines形式のリクエストを1行ずつ受け付けて変換し、結果を1行ずつ応答
+
+	Args:
+		worker (BatchWorker): ワーカー
+		reader (IO[str]): リクエストの入力ストリーム
+		writer (IO[str]): レスポンスの出力ストリーム
+	Note:
+		リクエスト: {"source": "path/to/source.py"}
+		レスポンス: {"source": str, "output": str, "ok": bool, "seconds": float, "error": str}
+		入力ストリームの終端で終了
+	"""
+	for line in reader:
+		if len(line.strip()) == 0:
+			continue
+
+		try:
+			source = str(json.loads(line)['source'])
+			result = worker.transpile(source)
+			response = {'source': source, 'output': output_path(source), 'ok': not result.error, 'seconds': result.seconds, 'error': result.error}
+		except (ValueError, KeyError, TypeError) as e:
+			response = {'source': '', 'output': '', 'ok': False, 'seconds': 0.0, 'error': f'Invalid request. {e}'}
+
+		writer.write(f'{json.dumps(response)}\n')
+		writer.flush()
+
+
+def main_serve(args: Args) -> int:
+	BatchWorker.setup(args.grammar)
+	worker = cast(BatchWorker, BatchWorker.instance)
+	worker.warmup()
+	serve(worker, sys.stdin, sys.stdout)
+	return 0
+
+
 if __name__ == '__main__':
+	args = Args()
+	if args.serve:
+		sys.exit(main_serve(args))
+
+	if args.batch:
+		sys.exit(main_batch(args))
+
 	definitions = {
-		f'{Args.__module__}.{Args.__name__}': Args,
+		f'{Args.__module__}.{Args.__name__}': lambda: args,
 		f'{Context.__module__}.{Context.__name__}': make_context,
 		'py2cpp.ast.parser.ParserSetting': make_parser_setting,
 		'py2cpp.module.types.ModulePath': make_module_path,
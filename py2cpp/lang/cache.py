@@ -4,6 +4,7 @@ import json
 import hashlib
 import os
 import re
+import tempfile
 from typing import Any, Callable, Generic, IO, Protocol, TypeVar
 
 from py2cpp.lang.implementation import implements
@@ -84,10 +85,15 @@ class CachedProxy(Cached[T]):
 			cache_key (str): キャッシュキー
 		Returns:
 			T: インスタンス
+		Note:
+			キャッシュファイルが破損している(読み込み時にValueErrorが発生する)場合はキャッシュミスとして扱い、再生成して上書きする
 		"""
 		cache_path = self.to_cache_path(cache_key)
 		if self.cache_exists(cache_path):
-			return self.load_cache(cache_path)
+			try:
+				return self.load_cache(cache_path)
+			except ValueError:
+				pass
 
 		instance = self.instantiate()
 		self.save_cache(instance, cache_path)
@@ -128,16 +134,29 @@ class CachedProxy(Cached[T]):
 			cache_path (str): キャッシュファイルパス(実行ディレクトリーからの相対パス)
 		Note:
 			保存直前に古いキャッシュファイルを自動的に削除
+			複数のプロセスから同時に保存され得るため、一時ファイルへ書き出してからリネームし、書きかけのキャッシュファイルを参照させない
 		"""
 		dirpath = os.path.dirname(cache_path)
-		if not os.path.exists(dirpath):
-			os.makedirs(dirpath)
+		os.makedirs(dirpath, exist_ok=True)
 
 		for oldedst in self.find_oldest(cache_path):
-			os.unlink(oldedst)
+			if oldedst == cache_path:
+				continue
+
+			try:
+				os.unlink(oldedst)
+			except FileNotFoundError:
+				pass
+
+		fd, temp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(cache_path)}.', suffix='.tmp', dir=dirpath)
+		try:
+			with os.fdopen(fd, mode='wb') as f:
+				instance.save(f)
 
-		with open(cache_path, mode='wb') as f:
-			instance.save(f)
+			os.replace(temp_path, cache_path)
+		except BaseException:
+			os.unlink(temp_path)
+			raise
 
 	def find_oldest(self, cache_path: str) -> list[str]:
 		"""旧キャッシュファイルを検索
@@ -192,10 +211,12 @@ class CacheSetting:
 	Attributes:
 		basedir (str): キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
 		enabled (bool): True = 有効(default = True)
+		format (str): シンタックスツリーの保存形式。'json' | 'binary'(default = 'binary')
 	"""
 
 	basedir: str
 	enabled: bool = True
+	format: str = 'binary'
 
 
 class CacheProvider:
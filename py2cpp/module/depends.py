@@ -0,0 +1,220 @@
+import functools
+import glob
+import hashlib
+import json
+import os
+
+from py2cpp.errors import LogicError
+import py2cpp.node.definition as defs
+from py2cpp.node.node import Node
+
+
+def source_path_of(module_path: str) -> str:
+	"""モジュールパスをソースファイルのパスに変換
+
+	Args:
+		module_path (str): モジュールパス
+	Returns:
+		str: ソースファイルのパス(実行ディレクトリーからの相対パス)
+	"""
+	return f'{module_path.replace(".", "/")}.py'
+
+
+def file_digest(filepath: str) -> str:
+	"""ファイルの内容からダイジェストを生成
+
+	Args:
+		filepath (str): ファイルパス
+	Returns:
+		str: ダイジェスト。ファイルが存在しない場合は空文字
+	"""
+	if not os.path.isfile(filepath):
+		return ''
+
+	with open(filepath, mode='rb') as f:
+		return hashlib.md5(f.read()).hexdigest()
+
+
+def tree_digest(dirpath: str, pattern: str) -> str:
+	"""ディレクトリー配下のパターンに一致するファイル群の内容からダイジェストを生成
+
+	Args:
+		dirpath (str): ディレクトリーのパス
+		pattern (str): globパターン。ディレクトリーからの相対パス
+	Returns:
+		str: ダイジェスト
+	Note:
+		ファイルの追加・削除・リネームもダイジェストに反映するため、ディレクトリーからの相対パスを含めて生成
+	"""
+	filepaths = sorted(glob.glob(os.path.join(dirpath, pattern), recursive=True))
+	data = json.dumps([[os.path.relpath(filepath, dirpath), file_digest(filepath)] for filepath in filepaths])
+	return hashlib.md5(data.encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def package_digest() -> str:
+	"""py2cppパッケージのソースからダイジェストを生成
+
+	Returns:
+		str: ダイジェスト
+	Note:
+		実行中のプロセスが参照するソースはロード時点のものであるため、プロセス毎に1度だけ生成
+	"""
+	return tree_digest(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '**/*.py')
+
+
+def collect_imports(entrypoint: Node) -> list[str]:
+	"""エントリーポイント配下のインポート文からモジュールパスを収集
+
+	Args:
+		entrypoint (Node): エントリーポイント
+	Returns:
+		list[str]: インポートモジュールのパスリスト
+	"""
+	return [node.module_path.tokens for node in entrypoint.flatten() if type(node) is defs.Import]
+
+
+class DependGraph:
+	"""モジュールの依存グラフ。モジュール毎のインポートと変換時のシグネチャーを記録し、再変換の要否を判定
+
+	Note:
+		シグネチャーはモジュール自身と推移的なインポートモジュール全てのダイジェストから生成
+		そのため、いずれかのソースが変更された場合のみ再変換の対象となる
+		ダイジェストはインスタンス毎に1度だけ計算するため、判定から記録までの間にソースが変更された場合は次回の判定で再変換の対象となる
+		環境(文法・テンプレートなど)のダイジェストが一致しない記録は全て無効 @see loads
+	"""
+
+	version = 1
+
+	def __init__(self, environment: dict[str, str]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			environment (dict[str, str]): 変換結果に影響する環境のダイジェスト
+		"""
+		self.__environment = environment
+		self.__imports: dict[str, list[str]] = {}
+		self.__signatures: dict[str, str] = {}
+		self.__digests: dict[str, str] = {}
+
+	@property
+	def environment(self) -> dict[str, str]:
+		"""dict[str, str]: 変換結果に影響する環境のダイジェスト"""
+		return self.__environment
+
+	def digest(self, module_path: str) -> str:
+		"""モジュールのソースのダイジェストを取得
+
+		Args:
+			module_path (str): モジュールパス
+		Returns:
+			str: ダイジェスト。ソースが存在しない場合は空文字
+		"""
+		if module_path not in self.__digests:
+			self.__digests[module_path] = file_digest(source_path_of(module_path))
+
+		return self.__digests[module_path]
+
+	def depends(self, module_path: str) -> list[str]:
+		"""記録したインポートを辿り、モジュール自身を含む推移的な依存モジュールを取得
+
+		Args:
+			module_path (str): モジュールパス
+		Returns:
+			list[str]: 依存モジュールのパスリスト(昇順)
+		Note:
+			循環インポートは1度のみ辿る。インポートが未記録のモジュールは終端として扱う
+		"""
+		founds = {module_path}
+		remains = [module_path]
+		while len(remains):
+			for import_path in self.__imports.get(remains.pop(), []):
+				if import_path not in founds:
+					founds.add(import_path)
+					remains.append(import_path)
+
+		return sorted(founds)
+
+	def signature(self, module_path: str) -> str:
+		"""依存モジュールの現在のダイジェストからシグネチャーを生成
+
+		Args:
+			module_path (str): モジュールパス
+		Returns:
+			str: シグネチャー
+		"""
+		data = json.dumps([[path, self.digest(path)] for path in self.depends(module_path)])
+		return hashlib.md5(data.encode('utf-8')).hexdigest()
+
+	def dirty(self, module_path: str) -> bool:
+		"""再変換が必要か判定
+
+		Args:
+			module_path (str): モジュールパス
+		Returns:
+			bool: True = 未変換、またはモジュール自身か推移的なインポートモジュールが変更された
+		"""
+		if module_path not in self.__signatures:
+			return True
+
+		return self.__signatures[module_path] != self.signature(module_path)
+
+	def record(self, module_path: str, imports: dict[str, list[str]]) -> None:
+		"""変換したモジュールのインポートとシグネチャーを記録
+
+		Args:
+			module_path (str): 変換したモジュールのパス
+			imports (dict[str, list[str]]): モジュールパスとインポートモジュールのパスリストのマップ。変換したモジュールを含む
+		Raises:
+			LogicError: 変換したモジュールのインポートが含まれていない
+		"""
+		if module_path not in imports:
+			raise LogicError(f'Imports not recorded. module: {module_path}')
+
+		self.__imports.update(imports)
+		self.__signatures[module_path] = self.signature(module_path)
+
+	def discard(self, module_path: str) -> None:
+		"""変換したモジュールのシグネチャーを破棄し、次回の判定で再変換の対象とする
+
+		Args:
+			module_path (str): モジュールパス
+		"""
+		if module_path in self.__signatures:
+			del self.__signatures[module_path]
+
+	@classmethod
+	def loads(cls, text: str, environment: dict[str, str]) -> 'DependGraph':
+		"""JSON文字列からインスタンスを復元
+
+		Args:
+			text (str): JSON文字列 @see dumps
+			environment (dict[str, str]): 現在の環境のダイジェスト
+		Returns:
+			DependGraph: インスタンス。バージョンか環境が一致しない場合は空のインスタンス
+		"""
+		try:
+			data = json.loads(text)
+		except ValueError:
+			return cls(environment)
+
+		if not isinstance(data, dict) or data.get('version') != cls.version or data.get('environment') != environment:
+			return cls(environment)
+
+		graph = cls(environment)
+		graph.__imports = {path: list(imports) for path, imports in data['imports'].items()}
+		graph.__signatures = dict(data['signatures'])
+		return graph
+
+	def dumps(self) -> str:
+		"""JSON文字列に変換
+
+		Returns:
+			str: JSON文字列
+		"""
+		return json.dumps({
+			'version': self.version,
+			'environment': self.__environment,
+			'imports': self.__imports,
+			'signatures': self.__signatures,
+		}, indent=2, sort_keys=True)
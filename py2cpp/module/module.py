@@ -1,3 +1,4 @@
+from py2cpp.ast.query import Query
 from py2cpp.lang.implementation import injectable
 from py2cpp.module.types import ModulePath
 from py2cpp.node.node import Node
@@ -7,22 +8,41 @@ class Module:
 	"""モジュール。読み込んだモジュールのパスとエントリーポイントを管理"""
 
 	@injectable
-	def __init__(self, module_path: ModulePath, entrypoint: Node) -> None:
+	def __init__(self, module_path: ModulePath, entrypoint: Node, nodes: Query[Node]) -> None:
 		"""インスタンスを生成
 
 		Args:
 			module_path (ModulePath): モジュールパス @inject
 			entrypoint (Node): エントリーポイント @inject
+			nodes (Query[Node]): クエリーインターフェイス @inject
 		"""
 		self.__module_path = module_path
 		self.__entrypoint = entrypoint
+		self.__nodes = nodes
 
 	@property
 	def path(self) -> str:
 		"""str: モジュールパス"""
 		return self.__module_path.ref_name
 
+	@property
+	def actual_path(self) -> str:
+		"""str: モジュールパス(実体)"""
+		return self.__module_path.actual
+
 	@property
 	def entrypoint(self) -> Node:
 		"""Node: エントリーポイント"""
 		return self.__entrypoint
+
+	def by(self, full_path: str) -> Node:
+		"""指定のパスに紐づく一意なノードをフェッチ
+
+		Args:
+			full_path (str): フルパス
+		Returns:
+			Node: ノード
+		Raises:
+			NotFoundError: ノードが存在しない
+		"""
+		return self.__nodes.by(full_path)
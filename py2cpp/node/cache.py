@@ -1,71 +1,176 @@
-from typing import Any, Callable, Generic, ParamSpec, TypeVar
+from typing import Any, Callable, ClassVar, Generic, ParamSpec, TypeVar
 
-from py2cpp.node.base import NodeBase
-from py2cpp.node.node import Node
-from py2cpp.node.embed import EmbedKeys, Meta
+from py2cpp.node.embed import EmbedKeys, EmbedTable, Meta
 
-T = TypeVar('T', bound=NodeBase)
+T = TypeVar('T')
 T_Ret = TypeVar('T_Ret')
 P = ParamSpec('P')
 
 
 class Memoize:
-	__memo: dict[Callable, Any] = {}
+	"""メモ化デコレーター。関数と引数の組み合わせ毎に結果をキャッシュ
+
+	Note:
+		引数はキャッシュのキーとして使用するため、ハッシュ可能であることが前提
+		キャッシュは関数毎に管理し、利用状況は関数毎にヒット/ミスの回数として計数する
+	"""
+
+	__memo: ClassVar[dict[str, dict[tuple, Any]]] = {}
+	__stats: ClassVar[dict[str, list[int]]] = {}
 
 	@classmethod
 	def memo(cls, wrapped: Callable[P, T_Ret]) -> Callable[P, T_Ret]:
+		"""関数をメモ化
+
+		Args:
+			wrapped (Callable[P, T_Ret]): 対象の関数
+		Returns:
+			Callable[P, T_Ret]: デコレーター
+		"""
+		name = wrapped.__qualname__
+
 		def wrapper(*args: P.args, **kwargs: P.kwargs) -> T_Ret:
-			if wrapped.__name__ not in cls.__memo:
-				cls.__memo[wrapped] = wrapped(*args, **kwargs)
+			key = (args, tuple(sorted(kwargs.items()))) if kwargs else (args,)
+			memo = cls.__memo.setdefault(name, {})
+			stats = cls.__stats.setdefault(name, [0, 0])
+			if key in memo:
+				stats[0] += 1
+				return memo[key]
 
-			return cls.__memo[wrapped]
+			stats[1] += 1
+			memo[key] = wrapped(*args, **kwargs)
+			return memo[key]
 
 		return wrapper
 
+	@classmethod
+	def stats(cls) -> dict[str, tuple[int, int]]:
+		"""キャッシュの利用状況を取得
+
+		Returns:
+			dict[str, tuple[int, int]]: 関数名と(ヒット数, ミス数)のマップ
+		"""
+		return {name: (hits, misses) for name, (hits, misses) in cls.__stats.items()}
+
+	@classmethod
+	def discard(cls, owner: type) -> None:
+		"""指定のクラスに属する関数のキャッシュを破棄。利用状況は維持
+
+		Args:
+			owner (type): 関数が属するクラス
+		"""
+		prefix = f'{owner.__qualname__}.'
+		for name in [name for name in cls.__memo.keys() if name.startswith(prefix)]:
+			del cls.__memo[name]
+
+	@classmethod
+	def clear(cls) -> None:
+		"""キャッシュと利用状況を削除"""
+		cls.__memo.clear()
+		cls.__stats.clear()
+
 
 class MetaCache(Generic[T]):
+	"""メタデータキャッシュ。クラス毎にメタデータから派生した値をメモ化
+
+	Note:
+		インスタンスは(メタデータを保持するクラス, 対象クラス, メタデータのリビジョン)で同一視する
+		そのため、メタデータが追加で埋め込まれた場合は別のキャッシュとして扱われ、古い値を参照することはない
+		リビジョンの変化を検出した時点で古いリビジョンのキャッシュは全て破棄し、キャッシュが際限なく増えることを防ぐ
+	"""
+
+	__revisions: ClassVar[dict[type, int]] = {}
+
 	def __init__(self, holder: type[T], ctor: type[T]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			holder (type[T]): メタデータを保持するクラス
+			ctor (type[T]): 対象のクラス
+		"""
 		self.__holder = holder
 		self.__ctor = ctor
+		self.__revision = Meta.revision(holder)
+		if MetaCache.__revisions.get(holder, self.__revision) != self.__revision:
+			Memoize.discard(MetaCache)
+
+		MetaCache.__revisions[holder] = self.__revision
+
+	def __hash__(self) -> int:
+		"""int: ハッシュ値"""
+		return hash((self.__holder, self.__ctor, self.__revision))
+
+	def __eq__(self, other: object) -> bool:
+		"""bool: True = 同じキャッシュ"""
+		if not isinstance(other, MetaCache):
+			return False
+
+		return (self.__holder, self.__ctor, self.__revision) == (other.__holder, other.__ctor, other.__revision)
 
-	def has(self, ctor: type[T]) -> bool:
-		return ctor == self.__ctor
+	@Memoize.memo
+	def table(self) -> EmbedTable:
+		"""メタデータのテーブルを取得
+
+		Returns:
+			EmbedTable: メタデータのテーブル
+		"""
+		return EmbedTable(self.expands(), self.accept_tags(), self.actualized())
 
 	@Memoize.memo
-	def expands(self) -> list[str]:
+	def expands(self) -> tuple[str, ...]:
+		"""展開プロパティーのメソッド名リストを取得
+
+		Returns:
+			tuple[str, ...]: 展開プロパティーのメソッド名リスト
+		Note:
+			基底クラスから順に結合 @see embed.expandable
+		"""
 		prop_keys: list[str] = []
 		for ctor in self.__embed_classes():
-			meta = Meta.dig_for_method(self.__holder, ctor, EmbedKeys.Expandable, value_type=bool)
-			prop_keys = [*prop_keys, *[name for name, _ in meta.items()]]
+			prop_keys.extend(Meta.dig_for_method(self.__holder, ctor, EmbedKeys.Expandable, value_type=bool).keys())
 
-		return prop_keys
+		return tuple(prop_keys)
 
 	@Memoize.memo
-	def actualized(self) -> list[type[T]]:
+	def actualized(self) -> tuple[type[T], ...]:
+		"""特徴クラスのリストを取得
+
+		Returns:
+			tuple[type[T], ...]: 特徴クラスのリスト
+		Note:
+			基底クラスから順に結合 @see embed.actualized
+		"""
+		meta = Meta.dig_by_key_for_class(self.__holder, EmbedKeys.Actualized, value_type=type)
 		classes: dict[type[T], bool] = {}
 		for ctor in self.__embed_classes():
-			meta = Meta.dig_by_key_for_class(self.__holder, EmbedKeys.Actualized, value_type=type)
-			classes = {**classes, **{feature_class: True for feature_class, via_class in meta.items() if via_class is ctor}}
+			classes.update({feature_class: True for feature_class, via_class in meta.items() if via_class is ctor})
 
-		return list(classes.keys())
+		return tuple(classes.keys())
 
 	@Memoize.memo
-	def accept_tags(self) -> list[str]:
-		accept_tags: dict[str, bool] = {}
+	def accept_tags(self) -> tuple[str, ...]:
+		"""受け入れタグリストを取得
+
+		Returns:
+			tuple[str, ...]: 受け入れタグリスト
+		Note:
+			派生クラスによって上書き @see embed.accept_tags
+		"""
+		accept_tags: list[str] = []
 		for ctor in self.__embed_classes():
-			accept_tags = {**accept_tags, **{in_tag: True for in_tag in Meta.dig_for_class(Node, ctor, EmbedKeys.AcceptTags, default=[])}}
+			in_accept_tags = Meta.dig_for_class(self.__holder, ctor, EmbedKeys.AcceptTags, default=[])
+			if len(in_accept_tags) > 0:
+				accept_tags = in_accept_tags
 
-		return list(accept_tags.keys())
+		return tuple(accept_tags)
 
-	def __embed_classes(self) -> list[type['Node']]:
+	def __embed_classes(self) -> list[type[T]]:
 		"""対象のクラス自身を含む継承関係のあるクラスを基底クラス順に取得。取得されるクラスはメタデータと関連する派生クラスに限定
 
-		Args:
-			via (type[NodeBase]): 対象のクラス
 		Returns:
-			list[type[Node]]: クラスリスト
+			list[type[T]]: クラスリスト
 		Note:
-			Node以下の基底クラスはメタデータと関わりがないため除外
+			メタデータを保持するクラス以下の基底クラスはメタデータと関わりがないため除外
 		"""
-		classes = [ctor for ctor in self.__ctor.__mro__ if issubclass(ctor, Node) and ctor is not Node]
+		classes = [ctor for ctor in self.__ctor.__mro__ if issubclass(ctor, self.__holder) and ctor is not self.__holder]
 		return list(reversed(classes))
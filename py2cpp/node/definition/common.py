@@ -4,6 +4,8 @@ from py2cpp.node.node import Node
 
 @Meta.embed(Node, accept_tags('argvalue'))
 class Argument(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def value(self) -> Node:
@@ -12,6 +14,8 @@ class Argument(Node):
 
 @Meta.embed(Node, accept_tags('typed_argvalue'))
 class InheritArgument(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def class_type(self) -> Node:  # XXX 理想はTypeだが、参照違反になるため一旦Nodeで対応
@@ -10,6 +10,8 @@ from py2cpp.node.node import Node, T_Node
 
 @Meta.embed(Node, accept_tags('paramvalue'))
 class Parameter(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def symbol(self) -> Symbol:
@@ -30,6 +32,8 @@ class Parameter(Node):
 
 @Meta.embed(Node, accept_tags('return_type'))
 class ReturnType(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def var_type(self) -> Type:
@@ -38,6 +42,8 @@ class ReturnType(Node):
 
 @Meta.embed(Node, accept_tags('decorator'))
 class Decorator(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def symbol(self) -> DecoratorPath:  # XXX symbol以外の名前を検討
@@ -51,6 +57,8 @@ class Decorator(Node):
 
 @Meta.embed(Node, accept_tags('block'))
 class Block(Node, IScope):
+	__slots__ = ()
+
 	@property
 	@implements
 	def scope_part(self) -> str:
@@ -1,4 +1,5 @@
 from py2cpp.node.node import Node
 
 
-class Expression(Node): pass
+class Expression(Node):
+	__slots__ = ()
@@ -7,6 +7,8 @@ from py2cpp.node.node import Node
 
 @Meta.embed(Node, accept_tags('file_input'))
 class Entrypoint(Node):
+	__slots__ = ()
+
 	@property
 	@override
 	def namespace(self) -> str:
@@ -7,6 +7,8 @@ from py2cpp.node.node import Node
 
 
 class Literal(Node, IDomainName, ITerminal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
@@ -29,11 +31,14 @@ class Literal(Node, IDomainName, ITerminal):
 
 
 @Meta.embed(Node, accept_tags('number'))
-class Number(Literal): pass
+class Number(Literal):
+	__slots__ = ()
 
 
 @Meta.embed(Node, actualized(via=Number))
 class Integer(Number):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Node) -> bool:
 		return Terminal.match_terminal(via, allow_tags=['number', 'DEC_NUMBER', 'HEX_NUMBER'])
@@ -46,6 +51,8 @@ class Integer(Number):
 
 @Meta.embed(Node, actualized(via=Number))
 class Float(Number):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Node) -> bool:
 		return Terminal.match_terminal(via, allow_tags=['number', 'FLOAT_NUMBER'])
@@ -58,6 +65,8 @@ class Float(Number):
 
 @Meta.embed(Node, accept_tags('string'))
 class String(Literal):
+	__slots__ = ()
+
 	@property
 	@override
 	def class_symbol_alias(self) -> str:
@@ -69,6 +78,8 @@ class String(Literal):
 
 
 class Boolean(Literal):
+	__slots__ = ()
+
 	@property
 	@override
 	def class_symbol_alias(self) -> str:
@@ -76,15 +87,19 @@ class Boolean(Literal):
 
 
 @Meta.embed(Node, accept_tags('const_true'))
-class Truthy(Boolean): pass
+class Truthy(Boolean):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('const_false'))
-class Falsy(Boolean): pass
+class Falsy(Boolean):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('key_value'))
 class Pair(Literal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
@@ -108,6 +123,8 @@ class Pair(Literal):
 
 @Meta.embed(Node, accept_tags('list'))
 class List(Literal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
@@ -126,6 +143,8 @@ class List(Literal):
 
 @Meta.embed(Node, accept_tags('dict'))
 class Dict(Literal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
@@ -144,6 +163,8 @@ class Dict(Literal):
 
 @Meta.embed(Node, accept_tags('const_none'))
 class Null(Literal):
+	__slots__ = ()
+
 	@property
 	@override
 	def class_symbol_alias(self) -> str:
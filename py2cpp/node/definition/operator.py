@@ -5,6 +5,8 @@ from py2cpp.node.node import Node
 
 
 class UnaryOperator(Node):
+	__slots__ = ()
+
 	@property
 	@override
 	def tokens(self) -> str:
@@ -22,6 +24,8 @@ class UnaryOperator(Node):
 
 
 class BinaryOperator(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def left(self) -> Node:
@@ -39,48 +43,60 @@ class BinaryOperator(Node):
 
 
 @Meta.embed(Node, accept_tags('factor'))
-class Factor(UnaryOperator): pass
+class Factor(UnaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('not_test'))
-class NotCompare(UnaryOperator): pass
+class NotCompare(UnaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('or_test'))
-class OrCompare(BinaryOperator): pass
+class OrCompare(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('and_test'))
-class AndCompare(BinaryOperator): pass
+class AndCompare(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('comparison'))
-class Comparison(BinaryOperator): pass
+class Comparison(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('or_expr'))
-class OrBitwise(BinaryOperator): pass
+class OrBitwise(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('xor_expr'))
-class XorBitwise(BinaryOperator): pass
+class XorBitwise(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('and_expr'))
-class AndBitwise(BinaryOperator): pass
+class AndBitwise(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('shift_expr'))
-class ShiftBitwise(BinaryOperator): pass
+class ShiftBitwise(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('sum'))
-class Sum(BinaryOperator): pass
+class Sum(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('term'))
-class Term(BinaryOperator): pass
+class Term(BinaryOperator):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('group_expr'))
-class Group(Node): pass  # FIXME impl トランスパイルの性質上必要だが、あると色々と邪魔になる
+class Group(Node):  # FIXME impl トランスパイルの性質上必要だが、あると色々と邪魔になる
+	__slots__ = ()
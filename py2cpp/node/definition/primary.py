@@ -1,5 +1,5 @@
 import re
-from typing import cast
+from typing import Hashable, cast
 
 from py2cpp.ast.dsn import DSN
 from py2cpp.lang.implementation import implements, override
@@ -14,15 +14,37 @@ from py2cpp.node.node import Node
 
 @Meta.embed(Node, accept_tags('getattr', 'var', 'name'))
 class Fragment(Node):
-	@property
-	def is_class_var(self) -> bool:
-		"""Note: マッチング対象: クラス変数"""
+	__slots__ = ()
+
+	@classmethod
+	@override
+	def feature_key(cls, via: Node) -> Hashable | None:
+		"""Note: is_xxx/in_decl_xxxの判定が依存する要素(タグ, 親のタグ, クラス変数の宣言位置, トークンの形状)"""
+		fragment = cast(Fragment, via)
+		tokens = fragment.tokens
+		return (
+			fragment.tag,
+			fragment._full_path.parent_tag,
+			fragment.in_decl_class_var,
+			tokens if tokens in ['cls', 'self'] else '',
+			re.fullmatch(r'self.\w+', tokens) is not None,
+			DSN.elem_counts(tokens) == 1,
+		)
+
+	@property
+	def in_decl_class_var(self) -> bool:
+		"""Note: クラス変数の宣言位置と一致するか判定"""
 		# XXX ASTへの依存度が非常に高い判定なので注意
 		# XXX 期待するパス: class_def_raw.block.assign_stmt.(assign|anno_assign).(getattr|var|name)
 		elems = self._full_path.de_identify().elements
 		actual_class_def_at = last_index_of(elems, 'class_def_raw')
 		expect_class_def_at = max(0, len(elems) - 5)
-		in_decl_class_var = actual_class_def_at == expect_class_def_at
+		return actual_class_def_at == expect_class_def_at
+
+	@property
+	def is_class_var(self) -> bool:
+		"""Note: マッチング対象: クラス変数"""
+		in_decl_class_var = self.in_decl_class_var
 		in_decl_var = self._full_path.parent_tag in ['assign', 'anno_assign']
 		is_local = DSN.elem_counts(self.tokens) == 1
 		return in_decl_var and in_decl_class_var and is_local
@@ -71,6 +93,8 @@ class Fragment(Node):
 
 
 class Symbol(Fragment, IDomainName, ITerminal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def domain_id(self) -> str:
@@ -87,11 +111,14 @@ class Symbol(Fragment, IDomainName, ITerminal):
 		return False
 
 
-class Var(Symbol): pass
+class Var(Symbol):
+	__slots__ = ()
 
 
 @Meta.embed(Node, actualized(via=Fragment))
 class ClassVar(Var):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.is_class_var
@@ -103,6 +130,8 @@ class ClassVar(Var):
 
 @Meta.embed(Node, actualized(via=Fragment))
 class ThisVar(Var):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.is_this_var
@@ -126,11 +155,14 @@ class ThisVar(Var):
 		return cast(IDomainName, self._ancestor('class_def'))
 
 
-class BlockVar(Var): pass
+class BlockVar(Var):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('name'), actualized(via=Fragment))
 class ParamClass(BlockVar):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.is_param_class
@@ -142,6 +174,8 @@ class ParamClass(BlockVar):
 
 @Meta.embed(Node, accept_tags('name'), actualized(via=Fragment))
 class ParamThis(BlockVar):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.is_param_this
@@ -153,16 +187,21 @@ class ParamThis(BlockVar):
 
 @Meta.embed(Node, accept_tags('var', 'name'), actualized(via=Fragment))
 class LocalVar(BlockVar):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.is_local_var
 
 
-class DeclName(Symbol): pass
+class DeclName(Symbol):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('name'), actualized(via=Fragment))
 class ClassTypeName(DeclName):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.in_decl_class_type
@@ -170,12 +209,16 @@ class ClassTypeName(DeclName):
 
 @Meta.embed(Node, accept_tags('name'), actualized(via=Fragment))
 class ImportName(DeclName):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		return via.in_decl_import
 
 
 class Reference(Fragment, IDomainName):
+	__slots__ = ()
+
 	@property
 	@implements
 	def domain_id(self) -> str:
@@ -189,6 +232,8 @@ class Reference(Fragment, IDomainName):
 
 @Meta.embed(Node, accept_tags('getattr'), actualized(via=Fragment))
 class Relay(Reference):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Fragment) -> bool:
 		if via.is_local_var or via.is_this_var:
@@ -211,6 +256,8 @@ class Relay(Reference):
 
 @Meta.embed(Node, accept_tags('var', 'name'), actualized(via=Fragment))
 class Name(Reference, ITerminal):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Node) -> bool:
 		# XXX actualizeループの結果を元に排他的に決定(実質的なフォールバック)
@@ -224,6 +271,14 @@ class Name(Reference, ITerminal):
 
 @Meta.embed(Node, accept_tags('dotted_name'))
 class Path(Node, ITerminal):
+	__slots__ = ()
+
+	@classmethod
+	@override
+	def feature_key(cls, via: Node) -> Hashable | None:
+		"""Note: 派生クラスの判定が依存する要素(親のタグ)"""
+		return via._full_path.parent_tag
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
@@ -232,6 +287,8 @@ class Path(Node, ITerminal):
 
 @Meta.embed(Node, actualized(via=Path))
 class ImportPath(Path):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Node) -> bool:
 		return via._full_path.parent_tag == 'import_stmt'
@@ -239,6 +296,8 @@ class ImportPath(Path):
 
 @Meta.embed(Node, actualized(via=Path))
 class DecoratorPath(Path):
+	__slots__ = ()
+
 	@classmethod
 	def match_feature(cls, via: Node) -> bool:
 		return via._full_path.parent_tag == 'decorator'
@@ -246,6 +305,8 @@ class DecoratorPath(Path):
 
 @Meta.embed(Node, accept_tags('getitem'))
 class Indexer(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def symbol(self) -> Reference:  # XXX symbol以外の名前を検討
@@ -258,6 +319,8 @@ class Indexer(Node):
 
 
 class Type(Node, IDomainName, ITerminal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
@@ -286,6 +349,8 @@ class Type(Node, IDomainName, ITerminal):
 
 @Meta.embed(Node, accept_tags('typed_getattr', 'typed_var'))
 class GeneralType(Type):
+	__slots__ = ()
+
 	@property
 	@override
 	def can_expand(self) -> bool:
@@ -293,10 +358,13 @@ class GeneralType(Type):
 
 
 @Meta.embed(Node, accept_tags('typed_getitem'))
-class GenericType(Type): pass
+class GenericType(Type):
+	__slots__ = ()
 
 
 class CollectionType(GenericType):
+	__slots__ = ()
+
 	@property
 	def value_type(self) -> Type:
 		raise NotImplementedError()
@@ -304,6 +372,8 @@ class CollectionType(GenericType):
 
 @Meta.embed(Node, actualized(via=GenericType))
 class ListType(CollectionType):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: GenericType) -> bool:
@@ -318,6 +388,8 @@ class ListType(CollectionType):
 
 @Meta.embed(Node, actualized(via=GenericType))
 class DictType(GenericType):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: GenericType) -> bool:
@@ -337,6 +409,8 @@ class DictType(GenericType):
 
 @Meta.embed(Node, accept_tags('typed_or_expr'))
 class UnionType(GenericType):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def types(self) -> list[Type]:
@@ -345,6 +419,8 @@ class UnionType(GenericType):
 
 @Meta.embed(Node, accept_tags('typed_none'))
 class NullType(Type, ITerminal):
+	__slots__ = ()
+
 	@property
 	@override
 	def can_expand(self) -> bool:
@@ -364,6 +440,8 @@ class NullType(Type, ITerminal):
 
 @Meta.embed(Node, accept_tags('funccall'))
 class FuncCall(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def calls(self) -> Node:
@@ -378,6 +456,8 @@ class FuncCall(Node):
 
 @Meta.embed(Node, actualized(via=FuncCall))
 class Super(FuncCall):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: FuncCall) -> bool:
@@ -13,11 +13,14 @@ from py2cpp.node.interface import IDomainName, IScope
 from py2cpp.node.node import Node
 
 
-class Flow(Node): pass
+class Flow(Node):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('elif_'))
 class ElseIf(Flow):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def condition(self) -> Node:
@@ -31,6 +34,8 @@ class ElseIf(Flow):
 
 @Meta.embed(Node, accept_tags('if_stmt'))
 class If(Flow):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def condition(self) -> Node:
@@ -54,6 +59,8 @@ class If(Flow):
 
 @Meta.embed(Node, accept_tags('while_stmt'))
 class While(Flow):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def condition(self) -> Node:
@@ -67,6 +74,8 @@ class While(Flow):
 
 @Meta.embed(Node, accept_tags('for_stmt'))
 class For(Flow):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def symbol(self) -> Symbol:
@@ -85,6 +94,8 @@ class For(Flow):
 
 @Meta.embed(Node, accept_tags('except_clause'))
 class Catch(Flow):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def capture_type(self) -> Type:
@@ -104,6 +115,8 @@ class Catch(Flow):
 
 @Meta.embed(Node, accept_tags('try_stmt'))
 class Try(Flow):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def block(self) -> Block:
@@ -116,6 +129,8 @@ class Try(Flow):
 
 
 class ClassKind(Node, IDomainName, IScope):
+	__slots__ = ()
+
 	@property
 	@override
 	def public_name(self) -> str:
@@ -152,6 +167,8 @@ class ClassKind(Node, IDomainName, IScope):
 
 @Meta.embed(Node, accept_tags('function_def'))
 class Function(ClassKind):
+	__slots__ = ()
+
 	@property
 	def access(self) -> str:
 		name = self.symbol.tokens
@@ -202,6 +219,8 @@ class Function(ClassKind):
 
 @Meta.embed(Node, actualized(via=Function))
 class ClassMethod(Function):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: Function) -> bool:
@@ -215,6 +234,8 @@ class ClassMethod(Function):
 
 @Meta.embed(Node, actualized(via=Function))
 class Constructor(Function):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: Function) -> bool:
@@ -231,6 +252,8 @@ class Constructor(Function):
 
 @Meta.embed(Node, actualized(via=Function))
 class Method(Function):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: Function) -> bool:
@@ -247,6 +270,8 @@ class Method(Function):
 
 @Meta.embed(Node, accept_tags('class_def'))
 class Class(ClassKind):
+	__slots__ = ()
+
 	@property
 	@override
 	def namespace_part(self) -> str:
@@ -324,6 +349,8 @@ class Class(ClassKind):
 
 @Meta.embed(Node, accept_tags('enum_def'))
 class Enum(ClassKind):
+	__slots__ = ()
+
 	@property
 	@override
 	def namespace_part(self) -> str:
@@ -8,6 +8,8 @@ from py2cpp.node.node import Node
 
 @Meta.embed(Node, accept_tags('assign_stmt'))
 class Assign(Node):
+	__slots__ = ()
+
 	@property
 	def _elements(self) -> list[Node]:
 		return self._at(0)._children()
@@ -30,6 +32,8 @@ class Assign(Node):
 
 @Meta.embed(Node, actualized(via=Assign))
 class MoveAssign(Assign):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: Node) -> bool:
@@ -44,6 +48,8 @@ class MoveAssign(Assign):
 
 @Meta.embed(Node, actualized(via=Assign))
 class AnnoAssign(Assign):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: Node) -> bool:
@@ -63,6 +69,8 @@ class AnnoAssign(Assign):
 
 @Meta.embed(Node, actualized(via=Assign))
 class AugAssign(Assign):
+	__slots__ = ()
+
 	@classmethod
 	@override
 	def match_feature(cls, via: Node) -> bool:
@@ -81,6 +89,8 @@ class AugAssign(Assign):
 
 @Meta.embed(Node, accept_tags('return_stmt'))
 class Return(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def return_value(self) -> Node | Empty:
@@ -90,6 +100,8 @@ class Return(Node):
 
 @Meta.embed(Node, accept_tags('raise_stmt'))
 class Throw(Node):
+	__slots__ = ()
+
 	@property
 	@Meta.embed(Node, expandable)
 	def calls(self) -> FuncCall:
@@ -102,19 +114,24 @@ class Throw(Node):
 
 
 @Meta.embed(Node, accept_tags('pass_stmt'))
-class Pass(Node): pass
+class Pass(Node):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('break_stmt'))
-class Break(Node): pass
+class Break(Node):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('break_stmt'))
-class Continue(Node): pass
+class Continue(Node):
+	__slots__ = ()
 
 
 @Meta.embed(Node, accept_tags('import_stmt'))
 class Import(Node, ITerminal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
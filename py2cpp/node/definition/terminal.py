@@ -5,6 +5,8 @@ from py2cpp.node.node import Node
 
 
 class Terminal(Node):
+	__slots__ = ()
+
 	@classmethod
 	def match_terminal(cls, via: Node, allow_tags: list[str]) -> bool:  # XXX
 		rel_paths = [node._full_path.relativefy(via.full_path) for node in via._under_expand()]
@@ -17,6 +19,8 @@ class Terminal(Node):
 
 @Meta.embed(Node, accept_tags('__empty__', 'const_none'))
 class Empty(Node, ITerminal):
+	__slots__ = ()
+
 	@property
 	@implements
 	def can_expand(self) -> bool:
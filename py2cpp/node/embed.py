@@ -13,15 +13,42 @@ class EmbedKeys(NamedTuple):
 	Expandable = 'expandable'
 
 
+class EmbedTable(NamedTuple):
+	"""クラス毎に集約したメタデータの不変テーブル
+
+	Attributes:
+		expandable_keys (tuple[str, ...]): 展開プロパティーのメソッド名リスト
+		accept_tags (tuple[str, ...]): 受け入れタグリスト
+		feature_classes (tuple[type, ...]): 特徴クラスのリスト
+	"""
+
+	expandable_keys: tuple[str, ...]
+	accept_tags: tuple[str, ...]
+	feature_classes: tuple[type, ...]
+
+
 class MetaData:
-	"""メタデータコンテナー"""
+	"""メタデータコンテナー
+
+	Note:
+		参照用のインデックスは登録時に更新し、参照時の走査を不要とする
+		登録の度にリビジョンを更新するため、メタデータから派生したキャッシュはリビジョンの変化で破棄すること
+	"""
 
 	key = f'__meta_data_{id(__name__)}__'
 
 	def __init__(self) -> None:
 		"""インスタンスを生成"""
 		self.__classes: dict[type, dict[str, Any]] = {}
+		self.__classes_by_key: dict[str, dict[type, Any]] = {}
 		self.__methods: dict[FunctionType, dict[str, Any]] = {}
+		self.__methods_by_class: dict[str, dict[str, dict[str, Any]]] = {}
+		self.__revision = 0
+
+	@property
+	def revision(self) -> int:
+		"""int: リビジョン。メタデータの登録の度に更新"""
+		return self.__revision
 
 	def class_path(self, ctor: type) -> str:
 		"""クラスのモジュールパスを取得
@@ -54,7 +81,12 @@ class MetaData:
 		if ctor not in self.__classes:
 			self.__classes[ctor] = {}
 
+		if embed_key not in self.__classes_by_key:
+			self.__classes_by_key[embed_key] = {}
+
 		self.__classes[ctor][embed_key] = value
+		self.__classes_by_key[embed_key][ctor] = value
+		self.__revision += 1
 
 	def set_for_method(self, method: FunctionType, embed_key: str, value: Any) -> None:
 		"""メタデータを設定(メソッド用)
@@ -69,6 +101,13 @@ class MetaData:
 
 		self.__methods[method][embed_key] = value
 
+		class_path, _, method_name = self.method_path(method).rpartition('.')
+		if class_path not in self.__methods_by_class:
+			self.__methods_by_class[class_path] = {}
+
+		self.__methods_by_class[class_path][method_name] = self.__methods[method]
+		self.__revision += 1
+
 	def get_by_key_from_class(self, embed_key: str) -> dict[type, Any]:
 		"""メタデータを取得(クラス用)
 
@@ -78,11 +117,7 @@ class MetaData:
 		Returns:
 			dict[type, Any]: 対象クラスとメタデータのマップ
 		"""
-		return {
-			ctor: meta[embed_key]
-			for ctor, meta in self.__classes.items()
-			if embed_key in meta
-		}
+		return dict(self.__classes_by_key.get(embed_key, {}))
 
 	def get_from_class(self, ctor: type, embed_key: str) -> Any:
 		"""メタデータを取得(クラス用)
@@ -112,15 +147,10 @@ class MetaData:
 		Returns:
 			dict[str, Any]: 対象メソッドの名前とメタデータの値のマップ
 		"""
-		class_path = self.class_path(ctor)
-		class_in_meta = {
-			self.method_path(method): meta
-			for method, meta in self.__methods.items()
-			if self.method_path(method).startswith(f'{class_path}.')
-		}
+		class_in_meta = self.__methods_by_class.get(self.class_path(ctor), {})
 		return {
-			in_path.split('.')[-1]: meta[embed_key]
-			for in_path, meta in class_in_meta.items()
+			method_name: meta[embed_key]
+			for method_name, meta in class_in_meta.items()
 			if embed_key in meta
 		}
 
@@ -200,6 +230,20 @@ class Meta:
 		meta_data = cast(MetaData, getattr(holder, MetaData.key))
 		return meta_data.get_from_class(ctor, embed_key) or default
 
+	@classmethod
+	def revision(cls, holder: type) -> int:
+		"""メタデータのリビジョンを取得
+
+		Args:
+			holder (type): メタデータを保持するクラス
+		Returns:
+			int: リビジョン。メタデータが存在しない場合は0
+		"""
+		if not hasattr(holder, MetaData.key):
+			return 0
+
+		return cast(MetaData, getattr(holder, MetaData.key)).revision
+
 	@classmethod
 	def dig_for_method(cls, holder: type, ctor: type, embed_key: str, value_type: type[T_Data]) -> dict[str, T_Data]:
 		"""クラスに埋め込まれたメタデータを抽出(メソッド用)
@@ -5,6 +5,8 @@ class IScope:
 		対象: クラス/ファンクション/ブロック
 	"""
 
+	__slots__ = ()
+
 	@property
 	def scope_part(self) -> str:
 		"""str: スコープパート名 Note: 実装対象以外は空文字。対象: クラス/ファンクション/ブロック"""
@@ -23,6 +25,8 @@ class ITerminal:
 		対象: シンボル/リテラル/インポート/終端記号
 	"""
 
+	__slots__ = ()
+
 	@property
 	def can_expand(self) -> bool:
 		"""bool: True = 配下の要素を展開"""
@@ -36,6 +40,8 @@ class IDomainName:
 		対象: クラス/ファンクション/シンボル/リテラル
 	"""
 
+	__slots__ = ()
+
 	@property
 	def domain_id(self) -> str:
 		"""str: ドメインID Note: FQDN。スコープと対応"""
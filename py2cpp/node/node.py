@@ -1,5 +1,4 @@
-import functools
-from typing import Any, Iterator, TypeVar, cast
+from typing import Any, Callable, ClassVar, Hashable, Iterator, TypeVar, cast
 
 from py2cpp.ast.dsn import DSN
 from py2cpp.ast.path import EntryPath
@@ -9,7 +8,8 @@ from py2cpp.lang.implementation import deprecated, injectable
 from py2cpp.lang.sequence import flatten
 from py2cpp.lang.string import snakelize
 from py2cpp.module.types import ModulePath
-from py2cpp.node.embed import EmbedKeys, Meta
+from py2cpp.node.cache import MetaCache
+from py2cpp.node.embed import EmbedTable
 from py2cpp.node.interface import IScope, ITerminal
 
 T_Node = TypeVar('T_Node', bound='Node')
@@ -23,20 +23,38 @@ class Node:
 	Note:
 		ASTを役割に適した形に単純化するため、AST上の余分な階層構造は排除する
 		そのため、必ずしもAST上のエントリーとノードのアライメントは一致しない点に注意
+		インスタンス毎の属性はスロットで管理するため、派生クラスも__slots__を宣言すること
 	"""
 
+	__slots__ = ('__nodes', '__module_path', '__entry_id', '__arities')
+
+	__feature_matches: ClassVar[dict[tuple[type['Node'], Hashable], bool]] = {}
+	_classification: ClassVar[str] = 'node'
+
+	def __init_subclass__(cls, **kwargs: Any) -> None:
+		"""派生クラスの定義時にクラス毎の不変な値を算出
+
+		Args:
+			**kwargs (Any): クラス定義のキーワード引数
+		"""
+		super().__init_subclass__(**kwargs)
+		cls._classification = snakelize(cls.__name__)
+
 	@injectable
-	def __init__(self, nodes: Query['Node'], module_path: ModulePath, full_path: str) -> None:
+	def __init__(self, nodes: Query['Node'], module_path: ModulePath, entry_id: int) -> None:
 		"""インスタンスを生成
 
 		Args:
 			nodes (Query[Node]): クエリーインターフェイス @inject
 			module_path (ModulePath): モジュールパス @inject
-			full_path (str): ルート要素からのフルパス
+			entry_id (int): エントリーID
+		Note:
+			ノードはエントリーIDのみを保持し、フルパスは参照時にクエリーインターフェイスから取得する
 		"""
 		self.__nodes = nodes
 		self.__module_path = module_path
-		self._full_path = EntryPath(full_path)
+		self.__entry_id = entry_id
+		self.__arities: dict[str, int] | None = None
 
 	def __str__(self) -> str:
 		"""str: 文字列表現を取得"""
@@ -47,20 +65,30 @@ class Node:
 		"""str: モジュールパス"""
 		return self.__module_path.ref_name
 
+	@property
+	def entry_id(self) -> int:
+		"""int: エントリーID"""
+		return self.__entry_id
+
 	@property
 	def full_path(self) -> str:
-		"""str: ルート要素からのフルパス"""
-		return self._full_path.origin
+		"""str: ルート要素からのフルパス Note: 文字列表現・相対パスの探索・キャッシュキー用。それ以外の探索はエントリーIDで行う"""
+		return self.__nodes.path_of(self.__entry_id)
+
+	@property
+	def _full_path(self) -> EntryPath:
+		"""EntryPath: ルート要素からのフルパス"""
+		return EntryPath(self.full_path)
 
 	@property
 	def tag(self) -> str:
 		"""str: エントリータグ。Grammar上のルール名 Note: あくまでもマッチパターンに対するタグであり、必ずしも共通の構造を表さない点に注意"""
-		return self._full_path.last_tag
+		return self.__nodes.tag_of(self.__entry_id)
 
 	@property
 	def classification(self) -> str:
-		"""str: 構造を分類する識別子。実質的に派生クラスに対する識別子"""
-		return snakelize(self.__class__.__name__)
+		"""str: 構造を分類する識別子。実質的に派生クラスに対する識別子 Note: クラスの定義時に算出 @see __init_subclass__"""
+		return self._classification
 
 	@property
 	def public_name(self) -> str:
@@ -91,7 +119,7 @@ class Node:
 	@property
 	def parent(self) -> 'Node':
 		"""Node: 親のノード Note: あくまでもノード上の親であり、AST上の親と必ずしも一致しない点に注意"""
-		return self.__nodes.parent(self.full_path)
+		return self.__nodes.parent_of(self.__entry_id)
 
 	def flatten(self) -> list['Node']:
 		"""下位のノードを再帰的に展開し、1次元に平坦化して取得
@@ -108,84 +136,98 @@ class Node:
 				* 下位のノードを全て洗い出す場合はflatten
 				* ASTの計算順序の並びで欲しい場合はcalculated
 		"""
-		# XXX 参照方法が煩わしい
-		if isinstance(self, ITerminal) and not cast(ITerminal, self).can_expand:
-			return []
+		return list(flatten([[node, *node.flatten()] for node in self.__flatten_unders()]))
 
-		under = self.__prop_expand() or self._under_expand()
-		return list(flatten([[node, *node.flatten()] for node in under]))
-
-	def calculated(self) -> list['Node']:
+	def calculated(self) -> Iterator['Node']:
 		"""ASTの計算順序に合わせた順序で配下のノードを1次元に展開
 
 		Returns:
-			list[Node]: ノードリスト
+			Iterator[Node]: ノードのイテレーター
 		Note:
 			flattenとの相違点は並び順のみ
+			配下のノードを帰りがけ順(子が先、親が後)に逐次展開するため、全体の展開を待たずに先頭から処理できる
+			同じエントリーに紐づくノードは最初の1件のみ出力
 		"""
-		path_of_nodes = {node.full_path: node for node in self.flatten()}
-		sorted_paths = self.__calclation_order(enumerate(path_of_nodes.keys()))
-		return [path_of_nodes[full_path] for full_path in sorted_paths]
+		emitted: set[int] = set()
+		stack: list[tuple[Node, Iterator[Node]]] = [(self, iter(self.__flatten_unders()))]
+		while len(stack):
+			node, unders = stack[-1]
+			under = next(unders, None)
+			if under is not None:
+				stack.append((under, iter(under.__flatten_unders())))
+				continue
 
-	def __calclation_order(self, index_of_paths: Iterator[tuple[int, str]]) -> list[str]:
-		"""インデックスとフルパスを元にツリーの計算順序にソート
+			stack.pop()
+			# 自身は出力対象外
+			if len(stack) and node.entry_id not in emitted:
+				emitted.add(node.entry_id)
+				yield node
+
+	def __flatten_unders(self) -> list['Node']:
+		"""平坦化の対象とする1階層下のノードを取得
 
-		Args:
-			index_of_paths (Iterator[tuple[int, str]]): (インデックス, フルパス)形式のイテレーター
 		Returns:
-			list[str]: 並び替え後のパスリスト
+			list[Node]: ノードリスト
+		Note:
+			@see flatten
 		"""
-		def order(a: tuple[int, str], b: tuple[int, str]) -> int:
-			aindex, apath = a
-			bindex, bpath = b
-			if apath.startswith(bpath):
-				return -1
-			else:
-				return -1 if aindex < bindex else 1
+		# XXX 参照方法が煩わしい
+		if isinstance(self, ITerminal) and not cast(ITerminal, self).can_expand:
+			return []
 
-		return [path for _, path in sorted(index_of_paths, key=functools.cmp_to_key(order))]
+		return self.__prop_expand() or self._under_expand()
 
 	def __prop_expand(self) -> list['Node']:
 		"""展開プロパティーからノードリストを取得
 
 		Returns:
 			list[Node]: 展開プロパティーのノードリスト
+		Note:
+			展開プロパティー毎の要素数を記録 @see arity_of
 		"""
 		nodes: list[Node] = []
-		for key in self.__expandable_keys():
+		arities: dict[str, int] = {}
+		for key in self._embed_table().expandable_keys:
 			func_or_result = getattr(self, key)
 			result = cast(Node | list[Node], func_or_result() if callable(func_or_result) else func_or_result)
-			nodes.extend(result if type(result) is list else [cast(Node, result)])
+			in_nodes = result if type(result) is list else [cast(Node, result)]
+			arities[key] = len(in_nodes)
+			nodes.extend(in_nodes)
+
+		if len(arities):
+			self.__arities = arities
 
 		return nodes
 
-	def __expandable_keys(self) -> list[str]:
-		"""メタデータより展開プロパティーのメソッド名を抽出
+	def arity_of(self, key: str) -> int:
+		"""プロパティーが示すノードの要素数を取得
 
+		Args:
+			key (str): プロパティー名
 		Returns:
-			list[str]: 展開プロパティーのメソッド名リスト
+			int: 要素数。リスト以外は1
 		Note:
-			@see trans.node.embed.expandable
+			展開済みの展開プロパティーは記録した要素数を返却し、プロパティーを再評価しない
+			それ以外はプロパティーを評価して算出
 		"""
-		prop_keys: list[str] = []
-		for ctor in self.__embed_classes(self.__class__):
-			meta = Meta.dig_for_method(Node, ctor, EmbedKeys.Expandable, value_type=bool)
-			prop_keys = [*prop_keys, *[name for name, _ in meta.items()]]
+		if self.__arities is not None and key in self.__arities:
+			return self.__arities[key]
 
-		return prop_keys
+		result = getattr(self, key)
+		return len(result) if type(result) is list else 1
 
-	def __embed_classes(self, via: type[T_Node]) -> list[type['Node']]:
-		"""対象のクラス自身を含む継承関係のあるクラスを基底クラス順に取得。取得されるクラスはメタデータと関連する派生クラスに限定
+	@classmethod
+	def _embed_table(cls) -> EmbedTable:
+		"""自身のクラスに関するメタデータのテーブルを取得
 
-		Args:
-			via (type[T_Node]): 対象のクラス
 		Returns:
-			list[type[Node]]: クラスリスト
+			EmbedTable: メタデータのテーブル
 		Note:
-			Node以下の基底クラスはメタデータと関わりがないため除外
+			テーブルはメタデータキャッシュによってクラス毎に初回の参照時に1度だけ構築する @see cache.MetaCache.table
+			メタデータはクラスの生成後にデコレーターによって埋め込まれ、特徴クラスも派生クラスの定義時に追加されるため、クラスの生成時点では構築できない
+			メタデータが追加で埋め込まれた場合は、メタデータキャッシュのリビジョンの変化によって再構築される
 		"""
-		classes = [ctor for ctor in via.__mro__ if issubclass(ctor, Node) and ctor is not Node]
-		return list(reversed(classes))
+		return MetaCache(Node, cls).table()
 
 	def _exists(self, relative_path: str) -> bool:
 		"""指定のパスに紐づく一意なノードが存在するか判定
@@ -195,7 +237,7 @@ class Node:
 		Returns:
 			bool: True = 存在
 		"""
-		return self.__nodes.exists(self._full_path.joined(relative_path))
+		return self.__nodes.exists(DSN.join(self.full_path, relative_path))
 
 	def _by(self, relative_path: str) -> 'Node':
 		"""指定のパスに紐づく一意なノードをフェッチ
@@ -207,7 +249,7 @@ class Node:
 		Raises:
 			NotFoundError: ノードが存在しない
 		"""
-		return self.__nodes.by(self._full_path.joined(relative_path))
+		return self.__nodes.by(DSN.join(self.full_path, relative_path))
 
 	def _at(self, index: int) -> 'Node':
 		"""指定のインデックスの子ノードをフェッチ
@@ -219,11 +261,7 @@ class Node:
 		Raises:
 			NotFoundError: ノードが存在しない
 		"""
-		children = self._children()
-		if index < 0 or len(children) <= index:
-			raise NotFoundError(str(self), index)
-
-		return children[index]
+		return self.__nodes.child_of(self.__entry_id, index)
 
 	@deprecated
 	def _at_child(self, index: int) -> 'Node':
@@ -253,8 +291,8 @@ class Node:
 		Raises:
 			NotFoundError: 基点のノードが存在しない
 		"""
-		via = self._full_path.joined(relative_path) if relative_path else self.full_path
-		return [node for node in self.__nodes.siblings(via) if node.full_path != self.full_path]
+		siblings = self.__nodes.siblings(DSN.join(self.full_path, relative_path)) if relative_path else self.__nodes.siblings_of(self.__entry_id)
+		return [node for node in siblings if node.entry_id != self.__entry_id]
 
 	def _children(self, relative_path: str = '') -> list['Node']:
 		"""指定のパスを基準に1階層下のノードをフェッチ
@@ -267,8 +305,10 @@ class Node:
 		Raises:
 			NotFoundError: 基点のノードが存在しない
 		"""
-		via = self._full_path.joined(relative_path) if relative_path else self.full_path
-		return self.__nodes.children(via)
+		if relative_path:
+			return self.__nodes.children(DSN.join(self.full_path, relative_path))
+
+		return self.__nodes.children_of(self.__entry_id)
 
 	def _ancestor(self, tag: str) -> 'Node':
 		"""指定のエントリータグを持つ直近の親ノードをフェッチ
@@ -280,7 +320,7 @@ class Node:
 		Raises:
 			NotFoundError: ノードが存在しない
 		"""
-		return self.__nodes.ancestor(self.full_path, tag)
+		return self.__nodes.ancestor_of(self.__entry_id, tag)
 
 	def _under_expand(self) -> list['Node']:
 		"""配下に存在する展開が可能なノードをフェッチ
@@ -288,7 +328,7 @@ class Node:
 		Returns:
 			list[Node]: ノードリスト
 		"""
-		return self.__nodes.expand(self.full_path)
+		return self.__nodes.expand_of(self.__entry_id)
 
 	def _values(self) -> list[str]:
 		"""自身と配下のエントリーの値を取得
@@ -296,7 +336,7 @@ class Node:
 		Returns:
 			list[str]: 値リスト
 		"""
-		return self.__nodes.values(self.full_path)
+		return self.__nodes.values_of(self.__entry_id)
 
 	def as_a(self, to_class: type[T_Node]) -> T_Node:
 		"""指定の具象クラスに変換。変換先が派生クラスの場合のみ変換し、同じか基底クラスの場合は何もしない
@@ -321,7 +361,7 @@ class Node:
 		if not self.__acceptable_by(to_class):
 			raise LogicError(str(self), to_class)
 
-		return cast(T_Node, to_class(self.__nodes, self.__module_path, self.full_path))
+		return cast(T_Node, to_class(self.__nodes, self.__module_path, self.__entry_id))
 
 	def __acceptable_by(self, to_class: type[T_Node]) -> bool:
 		"""指定の具象クラスへの変換が受け入れられるか判定
@@ -331,27 +371,9 @@ class Node:
 		Returns:
 			list[str]: 受け入れタグリスト
 		"""
-		accept_tags = self.__accept_tags(to_class)
+		accept_tags = to_class._embed_table().accept_tags
 		return len(accept_tags) == 0 or self.tag in accept_tags
 
-	def __accept_tags(self, to_class: type[T_Node]) -> list[str]:
-		"""メタデータより変換先の受け入れタグリストを取得
-
-		Args:
-			to_class (type[T_Node]): 変換先の具象クラス
-		Returns:
-			list[str]: 受け入れタグリスト
-		Note:
-			派生クラスによって上書きする仕様 @see embed.accept_tags
-		"""
-		accept_tags: list[str] = []
-		for ctor in self.__embed_classes(to_class):
-			in_accept_tags = Meta.dig_for_class(Node, ctor, EmbedKeys.AcceptTags, default=[])
-			if len(in_accept_tags) > 0:
-				accept_tags = in_accept_tags
-
-		return accept_tags
-
 	def one_of(self, expects: type[T_Node]) -> T_Node:
 		"""指定のクラスと同じか派生クラスか判定し、合致すればそのままインスタンスを返す。いずれのクラスでもない場合はエラーを出力
 
@@ -411,18 +433,31 @@ class Node:
 		"""
 		return False
 
-	def _feature_classes(self) -> list[type['Node']]:
-		"""メタデータより自身に紐づけられた特徴クラス(=派生クラス)を抽出
+	@classmethod
+	def feature_key(cls, via: 'Node') -> Hashable | None:
+		"""match_featureの判定結果が依存する構造上のキーを取得
+		キーが同じノードはmatch_featureの判定結果も同じであることを表し、actualizeはキー毎に判定結果をキャッシュする
+		キーの宣言は派生クラス側で実装
 
+		Args:
+			via (Node): 変換前のノード
 		Returns:
-			list[type[Node]]: 特徴クラスのリスト
+			Hashable | None: キー。Noneの場合はキャッシュせず、毎回match_featureで判定
+		Note:
+			@see actualize, match_feature
+			## 注意点
+			* match_featureが参照する情報は全てキーに含めなければならない
+			* 同じ実装を継承した特徴クラスの間では、1回のactualizeにつきキーを1度だけ算出する
 		"""
-		classes: dict[type[Node], bool] = {}
-		for ctor in self.__embed_classes(self.__class__):
-			meta = Meta.dig_by_key_for_class(Node, EmbedKeys.Actualized, value_type=type)
-			classes = {**classes, **{feature_class: True for feature_class, via_class in meta.items() if via_class is ctor}}
+		return None
+
+	def _feature_classes(self) -> tuple[type['Node'], ...]:
+		"""メタデータより自身に紐づけられた特徴クラス(=派生クラス)を抽出
 
-		return list(classes.keys())
+		Returns:
+			tuple[type[Node], ...]: 特徴クラスのリスト
+		"""
+		return cast(tuple[type[Node], ...], self._embed_table().feature_classes)
 
 	def actualize(self) -> 'Node':
 		"""ASTの相関関係より判断した実体としてより適切な具象クラスのインスタンスに変換。条件は具象側で実装
@@ -430,15 +465,41 @@ class Node:
 		Returns:
 			Node: 具象クラスのインスタンス
 		"""
+		feature_keys: dict[Callable, Hashable | None] = {}
 		for feature_class in self._feature_classes():
 			if not self.__acceptable_by(feature_class):
 				continue
 
-			if feature_class.match_feature(self):
+			if self.__match_feature(feature_class, feature_keys):
 				return self.as_a(feature_class)
 
 		return self
 
+	def __match_feature(self, feature_class: type['Node'], feature_keys: dict[Callable, Hashable | None]) -> bool:
+		"""特徴クラスの特徴と一致するか判定。キーを宣言した特徴クラスはキー毎に判定結果をキャッシュ
+
+		Args:
+			feature_class (type[Node]): 特徴クラス
+			feature_keys (dict[Callable, Hashable | None]): キーの算出関数と算出済みのキーのマップ
+		Returns:
+			bool: True = 一致
+		Note:
+			@see feature_key
+		"""
+		key_func = cast(Callable, getattr(feature_class.feature_key, '__func__'))
+		if key_func not in feature_keys:
+			feature_keys[key_func] = feature_class.feature_key(self)
+
+		key = feature_keys[key_func]
+		if key is None:
+			return feature_class.match_feature(self)
+
+		matches = Node.__feature_matches
+		if (feature_class, key) not in matches:
+			matches[(feature_class, key)] = feature_class.match_feature(self)
+
+		return matches[(feature_class, key)]
+
 	def dirty_proxify(self, **overrides: Any) -> 'Node':
 		"""プロキシノードを生成
 
@@ -456,7 +517,7 @@ class Node:
 
 				return super().__getattribute__(__name)
 
-		return Proxy(self.__nodes, self.__module_path, self.full_path)
+		return Proxy(self.__nodes, self.__module_path, self.__entry_id)
 
 	# XXX def is_statement(self) -> bool: pass
 	# XXX def pretty(self) -> str: pass
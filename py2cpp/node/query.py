@@ -1,9 +1,6 @@
-import re
-
 from py2cpp.ast.cache import EntryCache
 from py2cpp.ast.entry import Entry
 from py2cpp.ast.finder import ASTFinder
-from py2cpp.ast.path import EntryPath
 from py2cpp.ast.query import Query
 from py2cpp.errors import NotFoundError
 from py2cpp.lang.implementation import implements
@@ -12,7 +9,12 @@ from py2cpp.node.resolver import NodeResolver
 
 
 class Nodes(Query[Node]):
-	"""ノードクエリーインターフェイス。ASTを元にノードの探索し、リゾルバーを介してインスタンスを解決"""
+	"""ノードクエリーインターフェイス。ASTを元にノードの探索し、リゾルバーを介してインスタンスを解決
+
+	Note:
+		探索はエントリーキャッシュのインデックスを基に行い、フルパスはノードの解決時にのみ参照する
+		エントリーキャッシュは遅延展開し、参照した経路の子のみをASTから読み出す @see EntryCache
+	"""
 
 	def __init__(self, resolver: NodeResolver, root: Entry) -> None:
 		"""インスタンスを生成
@@ -22,20 +24,29 @@ class Nodes(Query[Node]):
 			root (Entry): ASTのルート要素
 		"""
 		self.__resolver = resolver
-		self.__entries = EntryCache[Entry]()
-		for full_path, entry in ASTFinder().full_pathfy(root).items():
-			self.__entries.add(full_path, entry)
+		self.__entries = EntryCache[Entry](ASTFinder().unfold)
+		self.__entries.add(root, root.name)
+		self.__expands: dict[int, list[int]] = {}
 
-	def __resolve(self, entry: Entry, full_path: str) -> Node:
+	def __resolve(self, index: int) -> Node:
 		"""エントリーからノードを解決し、パスとマッピングしてキャッシュ
 
 		Args:
-			entry (Entry): エントリー
-			full_path (str): エントリーのフルパス
+			index (int): エントリーのインデックス
 		Returns:
 			Node: 解決したノード
 		"""
-		return self.__resolver.resolve(entry.name, full_path)
+		return self.__resolver.resolve(self.__entries.tag_of(index), index)
+
+	def __can_resolve(self, index: int) -> bool:
+		"""エントリーがノードとして解決出来るか判定
+
+		Args:
+			index (int): エントリーのインデックス
+		Returns:
+			bool: True = 解決できる
+		"""
+		return self.__resolver.can_resolve(self.__entries.tag_of(index))
 
 	@implements
 	def exists(self, full_path: str) -> bool:
@@ -48,6 +59,43 @@ class Nodes(Query[Node]):
 		"""
 		return self.__entries.exists(full_path)
 
+	@implements
+	def id_of(self, full_path: str) -> int:
+		"""指定のパスに紐づくエントリーのIDを取得
+
+		Args:
+			full_path (str): フルパス
+		Returns:
+			int: エントリーID
+		Raises:
+			NotFoundError: エントリーが存在しない
+		Note:
+			エントリーIDはエントリーキャッシュのインデックス
+		"""
+		return self.__entries.index_of(full_path)
+
+	@implements
+	def path_of(self, entry_id: int) -> str:
+		"""指定のIDのエントリーのフルパスを取得
+
+		Args:
+			entry_id (int): エントリーID
+		Returns:
+			str: フルパス
+		"""
+		return self.__entries.path_of(entry_id)
+
+	@implements
+	def tag_of(self, entry_id: int) -> str:
+		"""指定のIDのエントリータグを取得
+
+		Args:
+			entry_id (int): エントリーID
+		Returns:
+			str: エントリータグ
+		"""
+		return self.__entries.tag_of(entry_id)
+
 	@implements
 	def by(self, full_path: str) -> Node:
 		"""指定のパスに紐づく一意なノードをフェッチ
@@ -59,8 +107,7 @@ class Nodes(Query[Node]):
 		Raises:
 			NotFoundError: ノードが存在しない
 		"""
-		entry = self.__entries.by(full_path)
-		return self.__resolve(entry, full_path)
+		return self.__resolve(self.__entries.index_of(full_path))
 
 	@implements
 	def parent(self, via: str) -> Node:
@@ -73,14 +120,7 @@ class Nodes(Query[Node]):
 		Raises:
 			NotFoundError: 親が存在しない
 		"""
-		forwards = EntryPath(via).shift(-1)
-		while(forwards.valid):
-			if self.__resolver.can_resolve(forwards.last_tag):
-				return self.by(forwards.origin)
-
-			forwards = forwards.shift(-1)
-
-		raise NotFoundError(via)
+		return self.parent_of(self.__entries.index_of(via))
 
 	@implements
 	def ancestor(self, via: str, tag: str) -> Node:
@@ -93,16 +133,10 @@ class Nodes(Query[Node]):
 			Node: ノード
 		Raises:
 			NotFoundError: 指定のエントリータグを持つ親が存在しない
+		Note:
+			基点のエントリー自体も探索対象に含む
 		"""
-		base = EntryPath(via)
-		elems = list(reversed(base.de_identify().elements))
-		index = elems.index(tag)
-		if index == -1:
-			raise NotFoundError(via, tag)
-
-		slices = len(elems) - index
-		found_path = EntryPath.join(*base.elements[:slices])
-		return self.by(found_path.origin)
+		return self.ancestor_of(self.__entries.index_of(via), tag)
 
 	@implements
 	def siblings(self, via: str) -> list[Node]:
@@ -115,14 +149,7 @@ class Nodes(Query[Node]):
 		Raises:
 			NotFoundError: 基点のノードが存在しない
 		"""
-		uplayer_path = EntryPath(via).shift(-1)
-		if not uplayer_path.valid:
-			raise NotFoundError(via)
-
-		regular = re.compile(rf'{uplayer_path.escaped_origin}\.[^.]+')
-		tester = lambda _, path: regular.fullmatch(path) is not None
-		entries = {path: entry for path, entry in self.__entries.group_by(uplayer_path.origin).items() if tester(entry, path)}
-		return [self.__resolve(entry, path) for path, entry in entries.items()]
+		return self.siblings_of(self.__entries.index_of(via))
 
 	@implements
 	def children(self, via: str) -> list[Node]:
@@ -135,10 +162,21 @@ class Nodes(Query[Node]):
 		Raises:
 			NotFoundError: 基点のノードが存在しない
 		"""
-		regular = re.compile(rf'{EntryPath(via).escaped_origin}\.[^.]+')
-		tester = lambda _, path: regular.fullmatch(path) is not None
-		entries = {path: entry for path, entry in self.__entries.group_by(via).items() if tester(entry, path)}
-		return [self.__resolve(entry, path) for path, entry in entries.items()]
+		return self.children_of(self.__entries.index_of(via))
+
+	@implements
+	def at(self, via: str, index: int) -> Node:
+		"""指定のパスを基準に1階層下の指定のインデックスのノードをフェッチ
+
+		Args:
+			via (str): 基点のパス(フルパス)
+			index (int): 子のインデックス
+		Returns:
+			Node: ノード
+		Raises:
+			NotFoundError: 基点のノード、または指定のインデックスの子が存在しない
+		"""
+		return self.child_of(self.__entries.index_of(via), index)
 
 	@implements
 	def expand(self, via: str) -> list[Node]:
@@ -151,40 +189,182 @@ class Nodes(Query[Node]):
 		Raises:
 			NotFoundError: 基点のノードが存在しない
 		"""
-		memo: list[str] = []
-		def tester(entry: Entry, path: str) -> bool:
-			if via == path:
-				return False
+		return self.expand_of(self.__entries.index_of(via))
 
-			# 記録済みの変換対象以降の要素は全て除外
-			if len([cached for cached in memo if path.startswith(cached)]):
-				return False
+	@implements
+	def values(self, via: str) -> list[str]:
+		"""指定のパス以下(基点を含む)のエントリーの値を取得
 
-			entry_path = EntryPath(path)
+		Args:
+			via (str): 基点のパス(フルパス)
+		Returns:
+			list[str]: 値リスト
+		"""
+		return self.values_of(self.__entries.index_of(via))
 
-			# XXX 変換対象が存在する場合はそちらに対応を任せる(終端記号か否かは問わない)
-			if self.__resolver.can_resolve(entry_path.last_tag):
-				memo.append(entry_path.origin)
-				return True
+	@implements
+	def node_of(self, entry_id: int) -> Node:
+		"""指定のIDのノードをフェッチ
 
-			if entry.has_child:
-				return False
+		Args:
+			entry_id (int): エントリーID
+		Returns:
+			Node: ノード
+		"""
+		return self.__resolve(entry_id)
 
-			# 自身を含む配下のエントリーに変換対象のノードがなく、Terminalにフォールバックされる終端記号が対象
-			entry_tags = entry_path.relativefy(via).de_identify().elements
-			in_allows = [index for index, in_tag in enumerate(entry_tags) if self.__resolver.can_resolve(in_tag)]
-			return len(in_allows) == 0
+	@implements
+	def parent_of(self, entry_id: int) -> Node:
+		"""指定のIDのエントリーを子として親のノードをフェッチ
 
-		entries = {path: entry for path, entry in self.__entries.group_by(via).items() if tester(entry, path)}
-		return [self.__resolve(entry, path) for path, entry in entries.items()]
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			Node: ノード
+		Raises:
+			NotFoundError: 親が存在しない
+		Note:
+			ノードとして解決できないエントリーは飛ばして、直近のノードを返却
+		"""
+		index = self.__entries.parent_of(entry_id)
+		while index != -1:
+			if self.__can_resolve(index):
+				return self.__resolve(index)
+
+			index = self.__entries.parent_of(index)
+
+		raise NotFoundError(self.__entries.path_of(entry_id))
 
 	@implements
-	def values(self, via: str) -> list[str]:
-		"""指定のパス以下(基点を含む)のエントリーの値を取得
+	def ancestor_of(self, entry_id: int, tag: str) -> Node:
+		"""指定のエントリータグを持つ直近の親ノードをフェッチ
 
 		Args:
-			via (str): 基点のパス(フルパス)
+			entry_id (int): 基点のエントリーID
+			tag (str): エントリータグ
+		Returns:
+			Node: ノード
+		Raises:
+			NotFoundError: 指定のエントリータグを持つ親が存在しない
+		Note:
+			基点のエントリー自体も探索対象に含む
+		"""
+		tag_id = self.__entries.tag_id(tag)
+		index = entry_id
+		while index != -1:
+			if self.__entries.tag_id_of(index) == tag_id:
+				return self.__resolve(index)
+
+			index = self.__entries.parent_of(index)
+
+		raise NotFoundError(self.__entries.path_of(entry_id), tag)
+
+	@implements
+	def siblings_of(self, entry_id: int) -> list[Node]:
+		"""指定のIDのエントリーを基準に同階層のノードをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[Node]: ノードリスト
+		Raises:
+			NotFoundError: 親が存在しない
+		"""
+		parent = self.__entries.parent_of(entry_id)
+		if parent == -1:
+			raise NotFoundError(self.__entries.path_of(entry_id))
+
+		return [self.__resolve(index) for index in self.__entries.children_of(parent)]
+
+	@implements
+	def children_of(self, entry_id: int) -> list[Node]:
+		"""指定のIDのエントリーを基準に1階層下のノードをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[Node]: ノードリスト
+		"""
+		return [self.__resolve(index) for index in self.__entries.children_of(entry_id)]
+
+	@implements
+	def child_of(self, entry_id: int, index: int) -> Node:
+		"""指定のIDのエントリーを基準に1階層下の指定のインデックスのノードをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+			index (int): 子のインデックス
+		Returns:
+			Node: ノード
+		Raises:
+			NotFoundError: 指定のインデックスの子が存在しない
+		"""
+		children = self.__entries.children_of(entry_id)
+		if index < 0 or len(children) <= index:
+			raise NotFoundError(self.__entries.path_of(entry_id), index)
+
+		return self.__resolve(children[index])
+
+	@implements
+	def expand_of(self, entry_id: int) -> list[Node]:
+		"""指定のIDのエントリーから下に存在する展開が可能なノードをフェッチ
+
+		Args:
+			entry_id (int): 基点のエントリーID
+		Returns:
+			list[Node]: ノードリスト
+		Note:
+			探索結果はインスタンスの生存期間中、基点のインデックス毎にキャッシュ
+		"""
+		if entry_id not in self.__expands:
+			self.__expands[entry_id] = self.__expand_indexs(entry_id)
+
+		return [self.__resolve(index) for index in self.__expands[entry_id]]
+
+	def __expand_indexs(self, via: int) -> list[int]:
+		"""指定のエントリーから下に存在する展開が可能なエントリーを深さ優先で探索
+
+		Args:
+			via (int): 基点のインデックス
+		Returns:
+			list[int]: 展開が可能なエントリーのインデックスリスト(行きがけ順)
+		Note:
+			変換対象のエントリーを検出した時点で、その配下の探索は打ち切る
+		"""
+		founds: list[int] = []
+		stack = list(reversed(self.__entries.children_of(via)))
+		while len(stack):
+			index = stack.pop()
+			# XXX 変換対象が存在する場合はそちらに対応を任せ、配下の要素は全て除外(終端記号か否かは問わない)
+			if self.__can_resolve(index):
+				founds.append(index)
+			# 配下のエントリーに変換対象のノードがなく、Terminalにフォールバックされる終端記号が対象
+			elif not self.__entries.at(index).has_child:
+				founds.append(index)
+			else:
+				stack.extend(reversed(self.__entries.children_of(index)))
+
+		return founds
+
+	@implements
+	def values_of(self, entry_id: int) -> list[str]:
+		"""指定のIDのエントリー以下(基点を含む)のエントリーの値を取得
+
+		Args:
+			entry_id (int): 基点のエントリーID
 		Returns:
 			list[str]: 値リスト
+		Note:
+			値は行きがけ順に並ぶ
 		"""
-		return [entry.value for entry in self.__entries.group_by(via).values() if entry.value]
+		values: list[str] = []
+		stack = [entry_id]
+		while len(stack):
+			index = stack.pop()
+			value = self.__entries.at(index).value
+			if value:
+				values.append(value)
+
+			stack.extend(reversed(self.__entries.children_of(index)))
+
+		return values
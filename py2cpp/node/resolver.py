@@ -6,7 +6,7 @@ from py2cpp.node.node import Node
 
 
 class NodeResolver:
-	"""ノードリゾルバー。解決したノードとパスをマッピングして管理"""
+	"""ノードリゾルバー。解決したノードとエントリーIDをマッピングして管理"""
 
 	def __init__(self, currying: Currying, settings: SymbolMapping) -> None:
 		"""インスタンスを生成
@@ -17,7 +17,8 @@ class NodeResolver:
 		"""
 		self.__currying = currying
 		self.__resolver = Resolver[Node].load(settings)
-		self.__insts: dict[str, Node] = {}
+		self.__insts: dict[int, Node] = {}
+		self.__factories: dict[str, Callable[[int], Node]] = {}
 
 	def can_resolve(self, symbol: str) -> bool:
 		"""解決出来るか確認
@@ -29,24 +30,40 @@ class NodeResolver:
 		"""
 		return self.__resolver.can_resolve(symbol)
 
-	def resolve(self, symbol: str, full_path: str) -> Node:
+	def resolve(self, symbol: str, entry_id: int) -> Node:
 		"""ノードのインスタンスを解決
 
 		Args:
 			symbol (str): シンボル
-			full_path (str): エントリーのフルパス
+			entry_id (int): エントリーID
 		Returns:
 			Node: 解決したノード
 		Raises:
 			LogicError: シンボルの解決に失敗
 		"""
-		if full_path in self.__insts:
-			return self.__insts[full_path]
+		if entry_id in self.__insts:
+			return self.__insts[entry_id]
 
-		ctor = self.__resolver.resolve(symbol)
-		factory = self.__currying(ctor, Callable[[str], ctor])
-		self.__insts[full_path] = factory(full_path).actualize()
-		return self.__insts[full_path]
+		self.__insts[entry_id] = self.__factory(symbol)(entry_id).actualize()
+		return self.__insts[entry_id]
+
+	def __factory(self, symbol: str) -> Callable[[int], Node]:
+		"""シンボルに対応するノードのファクトリーを取得
+
+		Args:
+			symbol (str): シンボル
+		Returns:
+			Callable[[int], Node]: ファクトリー
+		Raises:
+			LogicError: シンボルの解決に失敗
+		Note:
+			カリー化はシンボル毎に初回のみ行い、以降はキャッシュしたファクトリーを返却する
+		"""
+		if symbol not in self.__factories:
+			ctor = self.__resolver.resolve(symbol)
+			self.__factories[symbol] = self.__currying(ctor, Callable[[int], ctor])
+
+		return self.__factories[symbol]
 
 	def clear(self) -> None:
 		"""インスタンスのマッピング情報を削除"""
@@ -1,3 +1,6 @@
+from array import array
+import mmap
+import struct
 from typing import Any
 
 from lark import Token, Tree
@@ -7,7 +10,14 @@ from py2cpp.lang.implementation import implements
 
 
 class EntryOfLark(Entry):
-	"""エントリーへの要素アクセスを代替するプロクシー"""
+	"""エントリーへの要素アクセスを代替するプロクシー
+
+	Note:
+		配下のエントリーは初回のアクセス時に1度だけラップし、以降は同じインスタンスを返却する
+		そのため、同じツリーを何度走査してもプロクシーの生成は1エントリーにつき1回に限られる
+	"""
+
+	__slots__ = ('__entry', '__name', '__value', '__children')
 
 	def __init__(self, entry: Tree | Token | None) -> None:
 		"""インスタンスを生成
@@ -16,6 +26,16 @@ class EntryOfLark(Entry):
 			entry (Tree | Token | None): エントリー
 		"""
 		self.__entry = entry
+		self.__children: tuple[Entry, ...] | None = None
+		if type(entry) is Tree:
+			self.__name = entry.data
+			self.__value = ''
+		elif type(entry) is Token:
+			self.__name = entry.type
+			self.__value = entry.value
+		else:
+			self.__name = self.empty_name
+			self.__value = ''
 
 	@property
 	@implements
@@ -27,12 +47,7 @@ class EntryOfLark(Entry):
 	@implements
 	def name(self) -> str:
 		"""str: エントリー名 @note: 空の場合を考慮"""
-		if type(self.__entry) is Tree:
-			return self.__entry.data
-		elif type(self.__entry) is Token:
-			return self.__entry.type
-		else:
-			return self.empty_name
+		return self.__name
 
 	@property
 	@implements
@@ -42,9 +57,12 @@ class EntryOfLark(Entry):
 
 	@property
 	@implements
-	def children(self) -> list[Entry]:
-		"""list[Entry]: 配下のエントリーリスト"""
-		return [EntryOfLark(in_entry) for in_entry in self.__entry.children] if type(self.__entry) is Tree else []
+	def children(self) -> tuple[Entry, ...]:
+		"""tuple[Entry, ...]: 配下のエントリーリスト"""
+		if self.__children is None:
+			self.__children = tuple(EntryOfLark(in_entry) for in_entry in self.__entry.children) if type(self.__entry) is Tree else ()
+
+		return self.__children
 
 	@property
 	@implements
@@ -56,7 +74,7 @@ class EntryOfLark(Entry):
 	@implements
 	def value(self) -> str:
 		"""str: 終端記号の値"""
-		return self.__entry.value if type(self.__entry) is Token else ''
+		return self.__value
 
 	@property
 	@implements
@@ -97,3 +115,357 @@ class Serialization:
 			return Token(entry['type'], entry['value'])
 		else:
 			return None
+
+
+class EntryOfBinary(Entry):
+	"""バイナリーフォーマットのシンタックスツリーを参照するエントリー
+
+	Note:
+		エントリーの情報はテーブルから都度参照し、配下のエントリーは初回のアクセス時に1度だけ生成する
+		そのため、参照したエントリーに対応する領域のみがデコードされる
+		@see BinarySerialization
+	"""
+
+	__slots__ = ('__table', '__index', '__children')
+
+	def __init__(self, table: 'BinaryTable', index: int) -> None:
+		"""インスタンスを生成
+
+		Args:
+			table (BinaryTable): テーブル
+			index (int): エントリーのインデックス
+		"""
+		self.__table = table
+		self.__index = index
+		self.__children: tuple[Entry, ...] | None = None
+
+	@property
+	@implements
+	def source(self) -> Tree | Token | None:
+		"""Tree | Token | None: オリジナルのエントリー
+
+		Note:
+			参照の度に配下を含めて復元するため、頻繁な参照は非推奨
+		"""
+		return self.__table.materialize(self.__index)
+
+	@property
+	@implements
+	def name(self) -> str:
+		"""str: エントリー名 @note: 空の場合を考慮"""
+		tag = self.__table.tag_of(self.__index)
+		return self.__table.string(tag) if tag != -1 else self.empty_name
+
+	@property
+	@implements
+	def has_child(self) -> bool:
+		"""bool: True = 子を持つエントリー"""
+		return self.__table.tag_of(self.__index) != -1 and self.__table.count_of(self.__index) >= 0
+
+	@property
+	@implements
+	def children(self) -> tuple[Entry, ...]:
+		"""tuple[Entry, ...]: 配下のエントリーリスト"""
+		if self.__children is None:
+			children: list[Entry] = []
+			index = self.__index + 1
+			for _ in range(max(0, self.__table.count_of(self.__index))):
+				children.append(EntryOfBinary(self.__table, index))
+				index = self.__table.end_of(index) + 1
+
+			self.__children = tuple(children)
+
+		return self.__children
+
+	@property
+	@implements
+	def is_terminal(self) -> bool:
+		"""bool: True = 終端記号"""
+		return self.__table.count_of(self.__index) < 0
+
+	@property
+	@implements
+	def value(self) -> str:
+		"""str: 終端記号の値"""
+		value = self.__table.value_of(self.__index)
+		return self.__table.string(value) if value != -1 else ''
+
+	@property
+	@implements
+	def is_empty(self) -> bool:
+		"""bool: True = 空"""
+		return self.__table.tag_of(self.__index) == -1
+
+
+class BinarySerialization:
+	"""シンタックスツリーのバイナリーシリアライザー
+
+	Note:
+		ツリーを行きがけ順の平坦な配列に展開し、再帰を用いずに変換する
+		## フォーマット
+		全ての数値はネイティブのバイトオーダーの32bit整数。キャッシュ用途のため、実行環境を跨いだ互換性は考慮しない
+		* header: magic(4byte), version, エントリー数(N), 文字列数(M)
+		* tags: エントリー名の文字列ID(N件)。空のエントリーは-1
+		* counts: 子の数(N件)。終端記号は-1
+		* values: 値の文字列ID(N件)。終端記号以外は-1
+		* ends: 配下の末尾のインデックス(N件)。配下が無い場合は自身
+		* offsets: 文字列テーブルの各文字列の開始位置(バイト)(M + 1件)
+		* strings: 文字列テーブル。全ての文字列を連結したUTF-8文字列
+	"""
+
+	magic = b'P2CA'
+	version = 2
+	header = struct.Struct('=4sIII')
+
+	@classmethod
+	def dumps(cls, entry: Tree | Token | None) -> bytes:
+		"""シンタックスツリーをバイナリーに変換
+
+		Args:
+			entry (Tree | Token | None): ルートエントリー
+		Returns:
+			bytes: バイナリー
+		"""
+		string_ids: dict[str, int] = {}
+		strings: list[bytes] = []
+
+		def string_id(string: str) -> int:
+			if string not in string_ids:
+				string_ids[string] = len(strings)
+				strings.append(string.encode('utf-8'))
+
+			return string_ids[string]
+
+		tags = array('i')
+		counts = array('i')
+		values = array('i')
+		parents = array('i')
+		stack: list[tuple[Tree | Token | None, int]] = [(entry, -1)]
+		while len(stack):
+			in_entry, parent = stack.pop()
+			index = len(tags)
+			parents.append(parent)
+			if type(in_entry) is Tree:
+				tags.append(string_id(str(in_entry.data)))
+				counts.append(len(in_entry.children))
+				values.append(-1)
+				stack.extend((child, index) for child in reversed(in_entry.children))
+			elif type(in_entry) is Token:
+				tags.append(string_id(in_entry.type))
+				counts.append(-1)
+				values.append(string_id(in_entry.value))
+			else:
+				tags.append(-1)
+				counts.append(0)
+				values.append(-1)
+
+		# 子は必ず親より後方に並ぶため、末尾から走査すると子の確定後に親へ伝播できる
+		ends = array('i', range(len(tags)))
+		for index in reversed(range(len(tags))):
+			parent = parents[index]
+			if parent != -1 and ends[parent] < ends[index]:
+				ends[parent] = ends[index]
+
+		offsets = array('i', [0])
+		for string in strings:
+			offsets.append(offsets[-1] + len(string))
+
+		return b''.join([
+			cls.header.pack(cls.magic, cls.version, len(tags), len(strings)),
+			tags.tobytes(),
+			counts.tobytes(),
+			values.tobytes(),
+			ends.tobytes(),
+			offsets.tobytes(),
+			*strings,
+		])
+
+	@classmethod
+	def unpack_header(cls, buffer: bytes | memoryview | mmap.mmap) -> tuple[int, int]:
+		"""ヘッダーを検証して展開
+
+		Args:
+			buffer (bytes | memoryview | mmap.mmap): バイナリー。先頭のヘッダーのみでも可
+		Returns:
+			tuple[int, int]: (エントリー数, 文字列数)
+		Raises:
+			ValueError: ヘッダーが不足、またはマジックナンバーかバージョンが不一致
+		"""
+		if len(buffer) < cls.header.size:
+			raise ValueError(f'Broken header. size: {len(buffer)}')
+
+		magic, version, entries, string_count = cls.header.unpack_from(buffer, 0)
+		if magic != cls.magic or version != cls.version:
+			raise ValueError(f'Unsupported format. magic: {magic!r}, version: {version}')
+
+		return entries, string_count
+
+	@classmethod
+	def loads(cls, buffer: bytes | memoryview | mmap.mmap) -> Tree | Token | None:
+		"""バイナリーからシンタックスツリーを復元
+
+		Args:
+			buffer (bytes | memoryview | mmap.mmap): バイナリー
+		Returns:
+			Tree | Token | None: ルートエントリー
+		Raises:
+			ValueError: 不正なフォーマット
+		"""
+		table = BinaryTable(buffer)
+		try:
+			return table.materialize(0)
+		finally:
+			table.release()
+
+
+class BinaryTable:
+	"""バイナリーフォーマットのシンタックスツリーを参照するテーブル
+
+	Note:
+		各配列はバッファーを複製せずに参照するビューで、文字列は初回の参照時にデコードする
+		@see BinarySerialization
+	"""
+
+	def __init__(self, buffer: bytes | memoryview | mmap.mmap) -> None:
+		"""インスタンスを生成
+
+		Args:
+			buffer (bytes | memoryview | mmap.mmap): バイナリー
+		Raises:
+			ValueError: 不正なフォーマット
+		"""
+		entries, string_count = BinarySerialization.unpack_header(buffer)
+		size = array('i').itemsize
+		begin = BinarySerialization.header.size
+		if len(buffer) < begin + (entries * 4 + string_count + 1) * size:
+			raise ValueError(f'Truncated tables. size: {len(buffer)}, entries: {entries}, strings: {string_count}')
+
+		view = memoryview(buffer)
+		arrays: list[memoryview] = []
+		for count in [entries, entries, entries, entries, string_count + 1]:
+			end = begin + count * size
+			arrays.append(view[begin:end].cast('i'))
+			begin = end
+
+		self.__tags, self.__counts, self.__values, self.__ends, self.__offsets = arrays
+		self.__blob = view[begin:]
+		blob_size, expected_size = len(self.__blob), self.__offsets[-1]
+		if blob_size < expected_size:
+			self.release()
+			view.release()
+			raise ValueError(f'Truncated strings. size: {blob_size}, expected: {expected_size}')
+
+		self.__strings: list[str | None] = [None] * string_count
+		view.release()
+
+	def __len__(self) -> int:
+		"""int: エントリー数"""
+		return len(self.__tags)
+
+	def tag_of(self, index: int) -> int:
+		"""指定のインデックスのエントリー名の文字列IDを取得。空のエントリーは-1
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: 文字列ID
+		"""
+		return self.__tags[index]
+
+	def count_of(self, index: int) -> int:
+		"""指定のインデックスの子の数を取得。終端記号は-1
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: 子の数
+		"""
+		return self.__counts[index]
+
+	def value_of(self, index: int) -> int:
+		"""指定のインデックスの値の文字列IDを取得。終端記号以外は-1
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: 文字列ID
+		"""
+		return self.__values[index]
+
+	def end_of(self, index: int) -> int:
+		"""指定のインデックスの配下の末尾のインデックスを取得
+
+		Args:
+			index (int): インデックス
+		Returns:
+			int: 配下の末尾のインデックス。配下が無い場合は自身
+		"""
+		return self.__ends[index]
+
+	def string(self, string_id: int) -> str:
+		"""文字列IDから文字列を取得
+
+		Args:
+			string_id (int): 文字列ID
+		Returns:
+			str: 文字列
+		"""
+		string = self.__strings[string_id]
+		if string is None:
+			string = str(self.__blob[self.__offsets[string_id]:self.__offsets[string_id + 1]], 'utf-8')
+			self.__strings[string_id] = string
+
+		return string
+
+	def materialize(self, index: int) -> Tree | Token | None:
+		"""指定のインデックスを起点にシンタックスツリーを復元
+
+		Args:
+			index (int): インデックス
+		Returns:
+			Tree | Token | None: 復元したエントリー
+		Raises:
+			ValueError: 不正なフォーマット
+		Note:
+			同じ種別と値の終端記号は1つのインスタンスを共有する
+		"""
+		end = self.__ends[index] + 1
+		tags = self.__tags[index:end].tolist()
+		counts = self.__counts[index:end].tolist()
+		values = self.__values[index:end].tolist()
+
+		# 末尾から復元することで、各エントリーの子は全て復元済みの状態でスタックの上部に揃う
+		tokens: dict[tuple[int, int], Token] = {}
+		stack: list[Tree | Token | None] = []
+		for offset in reversed(range(len(tags))):
+			tag = tags[offset]
+			count = counts[offset]
+			if tag == -1:
+				stack.append(None)
+			elif count > 0:
+				children = stack[-count:]
+				del stack[-count:]
+				children.reverse()
+				stack.append(Tree(self.string(tag), children))
+			elif count == 0:
+				stack.append(Tree(self.string(tag), []))
+			else:
+				key = (tag, values[offset])
+				if key not in tokens:
+					tokens[key] = Token(self.string(tag), self.string(values[offset]))
+
+				stack.append(tokens[key])
+
+		if len(stack) != 1:
+			raise ValueError(f'Broken structure. roots: {len(stack)}')
+
+		return stack[0]
+
+	def release(self) -> None:
+		"""バッファーへの参照を解放
+
+		Note:
+			解放後のテーブルは使用不可
+		"""
+		for view in [self.__tags, self.__counts, self.__values, self.__ends, self.__offsets, self.__blob]:
+			view.release()
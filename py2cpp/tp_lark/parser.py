@@ -1,3 +1,5 @@
+import io
+import mmap
 import os
 import json
 from typing import IO, cast
@@ -7,27 +9,30 @@ from lark.indenter import PythonIndenter
 
 from py2cpp.ast.entry import Entry
 from py2cpp.ast.parser import ParserSetting
-from py2cpp.lang.cache import CacheProvider
+from py2cpp.lang.cache import CacheProvider, CacheSetting
 from py2cpp.lang.implementation import implements, injectable
 from py2cpp.lang.io import FileLoader
-from py2cpp.tp_lark.entry import EntryOfLark, Serialization
+from py2cpp.tp_lark.entry import BinarySerialization, BinaryTable, EntryOfBinary, EntryOfLark, Serialization
 
 
 class SyntaxParserOfLark:
 	"""シンタックスパーサー(Lark版)"""
 
 	@injectable
-	def __init__(self, loader: FileLoader, setting: ParserSetting, cache: CacheProvider) -> None:
+	def __init__(self, loader: FileLoader, setting: ParserSetting, cache: CacheProvider, cache_setting: CacheSetting) -> None:
 		"""インスタンスを生成
 
 		Args:
 			loader (FileLoader): ファイルローダー @inject
 			setting (ParserSetting): パーサー設定データ @inject
 			cache (CacheProvider): キャッシュプロバイダー @inject
+			cache_setting (CacheSetting): キャッシュ設定データ @inject
 		"""
 		self.__loader = loader
 		self.__setting = setting
 		self.__cache = cache
+		self.__cache_setting = cache_setting
+		self.__parser: Lark | None = None
 
 	@implements
 	def __call__(self, module_path: str) -> Entry:
@@ -46,7 +51,12 @@ class SyntaxParserOfLark:
 
 		Returns:
 			Lark: シンタックスパーサー
+		Note:
+			ロードしたパーサーはインスタンスの生存期間中保持し、モジュール毎に再ロードしない
 		"""
+		if self.__parser is not None:
+			return self.__parser
+
 		def identity() -> dict[str, str]:
 			return {
 				'mtime': str(os.path.getmtime(self.__setting.grammar)),
@@ -64,7 +74,8 @@ class SyntaxParserOfLark:
 				postlex=PythonIndenter()
 			))
 
-		return instantiate().lark
+		self.__parser = instantiate().lark
+		return self.__parser
 
 	def __load_entry(self, parser: Lark, module_path: str) -> Entry:
 		"""シンタックスツリーをロード
@@ -86,6 +97,13 @@ class SyntaxParserOfLark:
 		def load_source() -> str:
 			return self.__loader(source_path())
 
+		if self.__cache_setting.format == 'binary':
+			@self.__cache.get(basepath, identity={**identity(), 'version': str(BinarySerialization.version)}, format='bin')
+			def instantiate_binary() -> EntryBinaryStored:
+				return EntryBinaryStored(EntryOfLark(parser.parse(load_source())))
+
+			return instantiate_binary().entry
+
 		@self.__cache.get(basepath, identity=identity(), format='json')
 		def instantiate() -> EntryStored:
 			return EntryStored(EntryOfLark(parser.parse(load_source())))
@@ -166,3 +184,59 @@ class EntryStored:
 		"""
 		data = Serialization.dumps(cast(Tree, self.entry.source))
 		stream.write(json.dumps(data).encode('utf-8'))
+
+
+class EntryBinaryStored:
+	"""ストア(シンタックスツリー/バイナリー版)
+
+	Note:
+		@see BinarySerialization
+	"""
+
+	def __init__(self, entry: Entry) -> None:
+		""""インスタンスを生成
+
+		Args:
+			entry (Entry): ルートエントリー
+		"""
+		self.entry = entry
+
+	@classmethod
+	def load(cls, stream: IO) -> 'EntryBinaryStored':
+		""""インスタンスを復元
+
+		Args:
+			stream (IO): IO
+		Returns:
+			EntryBinaryStored: インスタンス
+		Raises:
+			ValueError: 不正なフォーマット。空、ヘッダーの不一致、または途中で切れたファイル
+		Note:
+			ファイルの場合はmmapでマッピングし、エントリーは参照時にマッピングした領域から遅延して復元する
+			マッピングはエントリーが参照されなくなるまで保持される
+			空のファイルはマッピング出来ないため、マッピングの前にヘッダーを検証する
+		"""
+		header = stream.read(BinarySerialization.header.size)
+		BinarySerialization.unpack_header(header)
+		try:
+			buffer: bytes | mmap.mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+		except (AttributeError, io.UnsupportedOperation):
+			buffer = header + stream.read()
+
+		try:
+			table = BinaryTable(buffer)
+		except ValueError:
+			if isinstance(buffer, mmap.mmap):
+				buffer.close()
+
+			raise
+
+		return EntryBinaryStored(EntryOfBinary(table, 0))
+
+	def save(self, stream: IO) -> None:
+		""""インスタンスを保存
+
+		Args:
+			stream (IO): IO
+		"""
+		stream.write(BinarySerialization.dumps(cast(Tree, self.entry.source)))
@@ -1,10 +1,18 @@
-from typing import Any, Union, TypedDict
+import os
+import secrets
+from typing import IO, Any, Union, TypedDict, cast
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 
 class Writer:
-	"""ファイルライター"""
+	"""ファイルライター
+
+	Note:
+		出力はチャンクのリストとしてバッファリングし、スピル毎に出力先と同じディレクトリーの一時ファイルへ追記する
+		フラッシュ時に一時ファイルを出力先へリネームするため、出力先が書きかけの状態で参照されることはない
+		フラッシュせずに破棄する一時ファイルは、withブロックの終了時かrollbackの呼び出し時に削除する
+	"""
 
 	def __init__(self, filepath: str) -> None:
 		"""インスタンスを生成
@@ -13,7 +21,17 @@ class Writer:
 			filepath (str): 出力ファイルのパス
 		"""
 		self.__filepath = filepath
-		self.__content = ''
+		self.__chunks: list[str] = []
+		self.__temp: IO[str] | None = None
+		self.__temp_path = ''
+
+	def __enter__(self) -> 'Writer':
+		"""Returns: Writer: 自身のインスタンス"""
+		return self
+
+	def __exit__(self, *_: Any) -> None:
+		"""フラッシュされていないバッファと一時ファイルを破棄"""
+		self.rollback()
 
 	def put(self, text: str) -> None:
 		"""バッファにテキストを出力
@@ -21,16 +39,71 @@ class Writer:
 		Args:
 			text (str): テキスト
 		"""
-		self.__content += text
+		self.__chunks.append(text)
+
+	def spill(self) -> None:
+		"""バッファを一時ファイルへ追記してバッファを解放
+
+		Note:
+			トップレベルの要素毎など、任意の単位で繰り返し呼び出して良い
+			出力先への反映はflushで行う
+		"""
+		if self.__temp is None:
+			self.__temp = self.__open_temp()
+
+		self.__temp.write(''.join(self.__chunks))
+		self.__chunks.clear()
 
 	def flush(self) -> None:
-		"""出力バッファをファイルに反映"""
-		with open(self.__filepath, mode='wb') as f:
-			f.write(self.__content.encode('utf-8'))
+		"""出力バッファをファイルに反映
+
+		Note:
+			残りのバッファを一時ファイルへスピルし、一時ファイルを出力先へリネーム
+		"""
+		self.spill()
+		cast(IO[str], self.__temp).close()
+		self.__temp = None
+		os.replace(self.__temp_path, self.__filepath)
+
+	def rollback(self) -> None:
+		"""バッファと一時ファイルを破棄。出力先は変更しない"""
+		self.__chunks.clear()
+		if self.__temp is None:
+			return
+
+		self.__temp.close()
+		self.__temp = None
+		os.remove(self.__temp_path)
+
+	def __open_temp(self) -> IO[str]:
+		"""出力先と同じディレクトリーに一時ファイルを生成
+
+		Returns:
+			IO[str]: 一時ファイル
+		Note:
+			同一ファイルシステム内でのリネームによりアトミックに置き換えるため、出力先と同じディレクトリーに生成
+			パーミッションは通常のファイル生成と同様にumaskに従う
+		"""
+		dirpath, filename = os.path.split(os.path.abspath(self.__filepath))
+		while True:
+			temp_path = os.path.join(dirpath, f'.{filename}.{secrets.token_hex(4)}.tmp')
+			try:
+				fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+				break
+			except FileExistsError:
+				continue
+
+		self.__temp_path = temp_path
+		return os.fdopen(fd, mode='w', encoding='utf-8', newline='')
 
 
 class Renderer:
-	"""テンプレートレンダー"""
+	"""テンプレートレンダー
+
+	Note:
+		テンプレートは生成時に全てコンパイルしてキャッシュし、レンダリング毎のロード・更新確認を行わない
+		そのため、生成後にテンプレートファイルを変更しても反映されない点に注意
+	"""
 
 	def __init__(self, template_dir: str) -> None:
 		"""インスタンスを生成
@@ -38,7 +111,32 @@ class Renderer:
 		Args:
 			template_dir (str): テンプレートファイルのディレクトリー
 		"""
-		self.__renderer = Environment(loader=FileSystemLoader(template_dir, encoding='utf-8'))
+		self.__renderer = Environment(loader=FileSystemLoader(template_dir, encoding='utf-8'), auto_reload=False)
+		self.__templates = self.__preload()
+
+	def __preload(self) -> dict[str, Template]:
+		"""テンプレートディレクトリー配下のテンプレートを全てコンパイル
+
+		Returns:
+			dict[str, Template]: テンプレート名とテンプレートのマップ
+		"""
+		names = self.__renderer.list_templates(extensions=['j2'])
+		return {name[:-len('.j2')]: self.__renderer.get_template(name) for name in names}
+
+	def template(self, template: str) -> Template:
+		"""コンパイル済みのテンプレートを取得
+
+		Args:
+			template (str): テンプレートファイルの名前
+		Returns:
+			Template: テンプレート
+		Raises:
+			TemplateNotFound: テンプレートが存在しない
+		"""
+		if template not in self.__templates:
+			self.__templates[template] = self.__renderer.get_template(f'{template}.j2')
+
+		return self.__templates[template]
 
 	def render(self, template: str, indent: int = 0, vars: Union[TypedDict, dict[str, Any]] = {}) -> str:
 		"""テンプレートをレンダリング
@@ -50,7 +148,7 @@ class Renderer:
 		Returns:
 			str: レンダリング結果
 		"""
-		text = self.__renderer.get_template(f'{template}.j2').render(vars)
+		text = self.template(template).render(vars)
 		return self.__indentation(text, indent)
 
 	def __indentation(self, text: str, indent: int) -> str:
@@ -66,4 +164,4 @@ class Renderer:
 			return text
 
 		begin = '\t' * indent
-		return begin + f'\n{begin}'.join(text.split('\n'))
+		return begin + text.replace('\n', f'\n{begin}')
@@ -0,0 +1,22 @@
+import os
+from unittest import TestLoader, TestSuite
+
+
+def load_tests(loader: TestLoader, standard_tests: TestSuite, pattern: str | None) -> TestSuite:
+	"""パフォーマンステストを収集
+
+	Args:
+		loader (TestLoader): ローダー
+		standard_tests (TestSuite): パッケージ直下のテストスイート
+		pattern (str | None): ファイル名のパターン
+	Returns:
+		TestSuite: テストスイート
+	Note:
+		計測は実行時間が長く、結果も環境に依存するため、環境変数PY2CPP_PERF=1の場合のみ探索の対象とする
+		モジュールを直接指定した場合は環境変数に依らず実行される
+	"""
+	if os.environ.get('PY2CPP_PERF') != '1':
+		return standard_tests
+
+	standard_tests.addTests(loader.discover(start_dir=os.path.dirname(__file__), pattern=pattern or 'test*.py'))
+	return standard_tests
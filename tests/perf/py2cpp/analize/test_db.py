@@ -0,0 +1,33 @@
+import json
+from unittest import TestCase
+
+from py2cpp.analize.db import Expanded
+from py2cpp.app.app import App
+from py2cpp.module.module import Module
+from py2cpp.module.types import ModulePath
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def module(cls, module_path: str) -> Module:
+		module = App({'py2cpp.module.types.ModulePath': lambda: ModulePath(module_path, module_path)}).resolve(Module)
+		module.entrypoint
+		return module
+
+
+class TestExpanded(TestCase):
+	def test_loads(self) -> None:
+		module_path = 'py2cpp.python.classes'
+		data = json.loads(json.dumps(Expanded.expand(Fixture.module(module_path)).dumps()))
+		expand_modules = [Fixture.module(module_path) for _ in range(3)]
+		loads_modules = [Fixture.module(module_path) for _ in range(3)]
+
+		# XXX ノードはモジュール毎に解決されるため、計測毎に未展開のモジュールを使用
+		expand_seconds = elapsed(lambda: Expanded.expand(expand_modules.pop()))
+		loads_seconds = elapsed(lambda: Expanded.loads(loads_modules.pop(), data))
+		report(f'Expanded: {module_path} ({len(data["rows"])} rows, {len(data["decl_vars"])} vars)', [
+			('case', 'elapsed(ms)'),
+			('Expanded.expand', f'{expand_seconds * 1000:.2f}'),
+			('Expanded.loads', f'{loads_seconds * 1000:.2f}'),
+		])
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+from py2cpp.analize.procedure import HandlerInvoker
+from py2cpp.app.app import App
+from py2cpp.ast.query import Query
+from py2cpp.bin.transpile import Handler
+from py2cpp.lang.annotation import FunctionAnnotation
+from py2cpp.module.types import ModulePath
+from py2cpp.node.node import Node
+from py2cpp.view.render import Renderer
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def app(cls) -> App:
+		return App({'py2cpp.module.types.ModulePath': lambda: ModulePath('__main__', 'example.example')})
+
+
+class TestProcedure(TestCase):
+	def test_process(self) -> None:
+		app = Fixture.app()
+		root = app.resolve(Query[Node]).by('file_input')
+		instances = [*root.calculated(), root]
+		renderer = Renderer('example/template')
+
+		def process() -> None:
+			handler = Handler(renderer)
+			for node in instances:
+				handler.process(node)
+
+			handler.result()
+
+		def legacy_dispatch() -> None:
+			for node in instances:
+				handler_name = f'on_{node.classification}'
+				handler = getattr(Handler, handler_name) if hasattr(Handler, handler_name) else Handler.on_fallback
+				args = FunctionAnnotation(handler).args
+				for key in reversed(args.keys()):
+					args[key].is_list
+
+		def compiled_dispatch() -> None:
+			invoker = HandlerInvoker[str]()
+			for node in instances:
+				handler_name = f'on_{node.classification}'
+				invoker.plan(getattr(Handler, handler_name, Handler.on_fallback))
+
+		process_seconds = elapsed(process)
+		legacy_seconds = elapsed(legacy_dispatch, repeat=10)
+		compiled_seconds = elapsed(compiled_dispatch, repeat=10)
+		report(f'Procedure.process: example/example.py ({len(instances)} nodes)', [
+			('case', 'elapsed(ms)', 'nodes/sec'),
+			('transpile.Handler', f'{process_seconds * 1000:.2f}', f'{len(instances) / process_seconds:.0f}'),
+			('dispatch: annotation per node', f'{legacy_seconds * 1000:.2f}', f'{len(instances) / legacy_seconds:.0f}'),
+			('dispatch: compiled plan', f'{compiled_seconds * 1000:.2f}', f'{len(instances) / compiled_seconds:.0f}'),
+		])
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from lark import Token, Tree
+
+from py2cpp.ast.entry import Entry
+from py2cpp.ast.finder import ASTFinder
+from py2cpp.tp_lark.entry import EntryOfLark
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def tree(cls, entries: int) -> Entry:
+		"""Note: 1ステートメントあたり6エントリー。同名の兄弟を含めてインデックス付きのパスも生成させる"""
+		statements = [
+			Tree('stmt', [
+				Token('name', 'a'),
+				Tree('expr', [Token('op', '+'), Token('number', '1'), Token('number', '2')]),
+			])
+			for _ in range(max(1, entries // 6))
+		]
+		return EntryOfLark(Tree('file_input', statements))
+
+
+class TestASTFinder(TestCase):
+	def test_walk(self) -> None:
+		finder = ASTFinder()
+		rows = [('entries', 'elapsed(ms)', 'per entry(us)')]
+		for entries in [100, 1000, 10000, 50000]:
+			tree = Fixture.tree(entries)
+			actual_entries = len(list(finder.walk(tree)))
+			seconds = elapsed(lambda: list(finder.walk(tree)))
+			rows.append((str(actual_entries), f'{seconds * 1000:.2f}', f'{seconds / actual_entries * 1000000:.3f}'))
+
+		# 線形時間であればエントリー毎のコストは規模に依らずほぼ一定
+		report('ASTFinder.walk', rows)
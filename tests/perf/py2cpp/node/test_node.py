@@ -0,0 +1,57 @@
+import sys
+import tracemalloc
+from unittest import TestCase
+
+from py2cpp.app.app import App
+from py2cpp.ast.entry import Entry
+from py2cpp.ast.finder import ASTFinder
+from py2cpp.ast.query import Query
+from py2cpp.module.types import ModulePath
+from py2cpp.node.cache import Memoize
+from py2cpp.node.node import Node
+from py2cpp.node.resolver import NodeResolver
+from tests.test.benchmark import report
+
+
+class Fixture:
+	@classmethod
+	def app(cls) -> App:
+		return App({'py2cpp.module.types.ModulePath': lambda: ModulePath('__main__', 'example.example')})
+
+
+class TestNode(TestCase):
+	def test_memory(self) -> None:
+		app = Fixture.app()
+		nodes = app.resolve(Query[Node])
+		resolver = app.resolve(NodeResolver)
+		paths = [full_path for full_path, entry in ASTFinder().walk(app.resolve(Entry)) if resolver.can_resolve(entry.name)]
+
+		tracemalloc.start()
+		begin, _ = tracemalloc.get_traced_memory()
+		instances = [nodes.by(full_path) for full_path in paths]
+		end, _ = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+
+		per_node = (end - begin) / len(instances)
+		per_instance = sum(sys.getsizeof(node) + (sys.getsizeof(node.__dict__) if hasattr(node, '__dict__') else 0) for node in instances) / len(instances)
+		# ノードはエントリーIDのみを保持し、パスの分解結果は要素単位で共有される
+		report(f'Node instantiation: example/example.py ({len(instances)} nodes)', [
+			('total(bytes)', 'per node(bytes)', 'per instance(bytes)'),
+			(str(end - begin), f'{per_node:.1f}', f'{per_instance:.1f}'),
+		])
+
+	def test_meta_cache(self) -> None:
+		app = Fixture.app()
+		nodes = app.resolve(Query[Node])
+		before = Memoize.stats()
+		list(nodes.by('file_input').calculated())
+		after = Memoize.stats()
+
+		rows = [('method', 'hits', 'misses')]
+		for name in ['MetaCache.table', 'MetaCache.expands', 'MetaCache.actualized', 'MetaCache.accept_tags']:
+			hits = after.get(name, (0, 0))[0] - before.get(name, (0, 0))[0]
+			misses = after.get(name, (0, 0))[1] - before.get(name, (0, 0))[1]
+			rows.append((name, str(hits), str(misses)))
+
+		# Node._embed_tableは常にメタデータキャッシュのテーブルを参照し、ミスはクラス毎の初回の構築時のみ
+		report('MetaCache: example/example.py', rows)
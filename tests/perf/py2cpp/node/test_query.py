@@ -0,0 +1,58 @@
+import re
+from unittest import TestCase
+
+from py2cpp.app.app import App
+from py2cpp.ast.cache import EntryCache
+from py2cpp.ast.entry import Entry
+from py2cpp.ast.finder import ASTFinder
+from py2cpp.ast.path import EntryPath
+from py2cpp.ast.query import Query
+from py2cpp.module.types import ModulePath
+from py2cpp.node.node import Node
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def app(cls) -> App:
+		return App({'py2cpp.module.types.ModulePath': lambda: ModulePath('__main__', 'example.example')})
+
+
+class TestNodes(TestCase):
+	def test_children(self) -> None:
+		app = Fixture.app()
+		nodes = app.resolve(Query[Node])
+		entries = EntryCache[Entry]()
+		for parent, elem_index, entry in ASTFinder().walk_indexs(app.resolve(Entry)):
+			entries.add(entry, entry.name, parent, elem_index)
+
+		paths = list(entries.group_by('file_input').keys())
+		parents = [path for path in paths if entries.children_of(entries.index_of(path))]
+
+		def regex_children() -> None:
+			# 子のインデックスを使わず、配下のパスを正規表現で絞り込む方式(比較用)
+			for path in paths:
+				regular = re.compile(rf'{EntryPath(path).escaped_origin}\.[^.]+')
+				[in_path for in_path in entries.group_by(path).keys() if regular.fullmatch(in_path)]
+
+		def indexed_children() -> None:
+			for path in paths:
+				entries.children_of(entries.index_of(path))
+
+		def nodes_children() -> None:
+			for path in paths:
+				nodes.children(path)
+
+		def nodes_at() -> None:
+			for path in parents:
+				nodes.at(path, 0)
+
+		regex_seconds = elapsed(regex_children)
+		indexed_seconds = elapsed(indexed_children)
+		report(f'children: example/example.py ({len(paths)} entries)', [
+			('method', 'elapsed(ms)'),
+			('regex filtering', f'{regex_seconds * 1000:.2f}'),
+			('child index', f'{indexed_seconds * 1000:.2f}'),
+			('Nodes.children', f'{elapsed(nodes_children) * 1000:.2f}'),
+			('Nodes.at', f'{elapsed(nodes_at) * 1000:.2f}'),
+		])
@@ -0,0 +1,58 @@
+import time
+from typing import Callable
+from unittest import TestCase
+
+from py2cpp.app.app import App
+from py2cpp.ast.entry import Entry
+from py2cpp.ast.finder import ASTFinder
+from py2cpp.ast.query import Query
+from py2cpp.lang.locator import Currying
+from py2cpp.module.types import ModulePath
+from py2cpp.node.node import Node
+from py2cpp.node.resolver import NodeResolver
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def app(cls) -> App:
+		return App({'py2cpp.module.types.ModulePath': lambda: ModulePath('__main__', 'example.example')})
+
+
+class TestNodeResolver(TestCase):
+	def test_resolve(self) -> None:
+		results: list[tuple[int, float]] = []
+		for _ in range(3):
+			app = Fixture.app()
+			nodes = app.resolve(Query[Node])
+			resolver = app.resolve(NodeResolver)
+			paths = [full_path for full_path, entry in ASTFinder().walk(app.resolve(Entry)) if resolver.can_resolve(entry.name)]
+
+			begin = time.perf_counter()
+			for full_path in paths:
+				nodes.by(full_path)
+
+			results.append((len(paths), time.perf_counter() - begin))
+
+		count, seconds = min(results, key=lambda result: result[1])
+
+		app = Fixture.app()
+		currying = app.resolve(Currying)
+		factory = currying(Node, Callable[[int], Node])
+
+		def curried_per_node() -> None:
+			for entry_id in range(count):
+				currying(Node, Callable[[int], Node])(entry_id)
+
+		def cached_factory() -> None:
+			for entry_id in range(count):
+				factory(entry_id)
+
+		curried_seconds = elapsed(curried_per_node)
+		cached_seconds = elapsed(cached_factory)
+		report(f'NodeResolver.resolve: example/example.py ({count} nodes)', [
+			('method', 'elapsed(ms)', 'nodes/sec'),
+			('Nodes.by (cold)', f'{seconds * 1000:.2f}', f'{count / seconds:.0f}'),
+			('currying per node', f'{curried_seconds * 1000:.2f}', f'{count / curried_seconds:.0f}'),
+			('cached factory', f'{cached_seconds * 1000:.2f}', f'{count / cached_seconds:.0f}'),
+		])
@@ -0,0 +1,54 @@
+import tracemalloc
+from unittest import TestCase
+
+from lark import Token, Tree
+
+from py2cpp.ast.finder import ASTFinder
+from py2cpp.tp_lark.entry import EntryOfLark
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def tree(cls, entries: int) -> Tree:
+		"""Note: 1ステートメントあたり6エントリー"""
+		statements = [
+			Tree('stmt', [
+				Token('name', 'a'),
+				Tree('expr', [Token('op', '+'), Token('number', '1'), Token('number', '2')]),
+			])
+			for _ in range(max(1, entries // 6))
+		]
+		return Tree('file_input', statements)
+
+
+class TestEntryOfLark(TestCase):
+	def test_walk_allocations(self) -> None:
+		finder = ASTFinder()
+		rows = [('entries', 'walk(ms)', '1st(bytes/entry)', '2nd(bytes/entry)')]
+		for entries in [1000, 10000, 50000]:
+			entry = EntryOfLark(Fixture.tree(entries))
+			actual_entries = 0
+			# 走査中の一時オブジェクトのフリーリストを事前に満たし、実行順序による計測のぶれを抑える
+			for _ in finder.walk(EntryOfLark(Fixture.tree(entries))):
+				pass
+
+			tracemalloc.start()
+			for _ in finder.walk(entry):
+				actual_entries += 1
+
+			first, _ = tracemalloc.get_traced_memory()
+			tracemalloc.reset_peak()
+			for _ in finder.walk(entry):
+				pass
+
+			second, _ = tracemalloc.get_traced_memory()
+			tracemalloc.stop()
+
+			seconds = elapsed(lambda: [_ for _ in finder.walk(entry)])
+			per_first = first / actual_entries
+			per_second = (second - first) / actual_entries
+			rows.append((str(actual_entries), f'{seconds * 1000:.2f}', f'{per_first:.1f}', f'{per_second:.1f}'))
+
+		# ラッパーは初回の走査で1度だけ生成されるため、2回目の走査ではほぼ増加しない
+		report('EntryOfLark.children (tracemalloc)', rows)
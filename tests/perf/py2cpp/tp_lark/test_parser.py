@@ -0,0 +1,68 @@
+import os
+import tempfile
+from typing import cast
+from unittest import TestCase
+
+from lark import Tree
+
+from py2cpp.app.app import App
+from py2cpp.ast.entry import Entry
+from py2cpp.module.types import ModulePath
+from py2cpp.tp_lark.parser import EntryBinaryStored, EntryStored
+from py2cpp.tp_lark.entry import BinarySerialization, EntryOfLark
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def tree(cls, scale: int) -> Tree:
+		"""Note: example/example.pyのステートメントを複製して大規模なモジュールを模倣"""
+		app = App({'py2cpp.module.types.ModulePath': lambda: ModulePath('__main__', 'example.example')})
+		tree = cast(Tree, app.resolve(Entry).source)
+		return Tree(tree.data, tree.children * scale)
+
+
+class TestEntryStored(TestCase):
+	def test_load(self) -> None:
+		rows = [('scale', 'json(ms)', 'binary(ms)', 'lazy top-level(ms)', 'json(bytes)', 'binary(bytes)', 'binary ratio', 'lazy ratio')]
+		with tempfile.TemporaryDirectory() as dirpath:
+			for scale in [1, 10, 50]:
+				entry = EntryOfLark(Fixture.tree(scale))
+				json_path = os.path.join(dirpath, f'{scale}.json')
+				binary_path = os.path.join(dirpath, f'{scale}.bin')
+				with open(json_path, mode='wb') as f:
+					EntryStored(entry).save(f)
+
+				with open(binary_path, mode='wb') as f:
+					EntryBinaryStored(entry).save(f)
+
+				def load_json() -> None:
+					with open(json_path, mode='rb') as f:
+						EntryStored.load(f)
+
+				def load_binary() -> None:
+					with open(binary_path, mode='rb') as f:
+						BinarySerialization.loads(f.read())
+
+				def load_lazy() -> None:
+					with open(binary_path, mode='rb') as f:
+						entry = EntryBinaryStored.load(f).entry
+
+					# トップレベルのステートメント名のみ参照
+					[child.name for child in entry.children]
+
+				json_seconds = elapsed(load_json)
+				binary_seconds = elapsed(load_binary)
+				lazy_seconds = elapsed(load_lazy)
+				rows.append((
+					str(scale),
+					f'{json_seconds * 1000:.2f}',
+					f'{binary_seconds * 1000:.2f}',
+					f'{lazy_seconds * 1000:.2f}',
+					str(os.path.getsize(json_path)),
+					str(os.path.getsize(binary_path)),
+					f'{json_seconds / binary_seconds:.1f}x',
+					f'{binary_seconds / lazy_seconds:.1f}x',
+				))
+
+		report('EntryStored.load (json vs binary vs lazy)', rows)
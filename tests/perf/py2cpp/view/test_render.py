@@ -0,0 +1,101 @@
+import os
+import tempfile
+import tracemalloc
+from unittest import TestCase
+
+from jinja2 import Environment, FileSystemLoader
+
+from py2cpp.view.render import Renderer, Writer
+from tests.test.benchmark import elapsed, report
+
+
+class Fixture:
+	@classmethod
+	def samples(cls) -> list[tuple[str, dict[str, object]]]:
+		return [
+			('move_assign', {'receiver': 'hoge', 'value': '1234'}),
+			('anno_assign', {'receiver': 'hoge', 'value': '1234', 'var_type': 'int'}),
+			('func_call', {'calls': 'A.func', 'arguments': ['1 + 2', 'A.value']}),
+			('return', {'return_value': '(1 + 2)'}),
+			('block', {'statements': ['int x = 0;', 'int y = 0;', 'int z = 0;']}),
+			('list', {'values': ['1234', '2345']}),
+		]
+
+
+class LegacyWriter:
+	def __init__(self, filepath: str) -> None:
+		self.__filepath = filepath
+		self.__content = ''
+
+	def put(self, text: str) -> None:
+		self.__content += text
+
+	def flush(self) -> None:
+		with open(self.__filepath, mode='wb') as f:
+			f.write(self.__content.encode('utf-8'))
+
+
+class TestWriter(TestCase):
+	def test_write(self) -> None:
+		chunk = 'int value = 1234; // ' + 'x' * 200 + '\n'
+		rows = [('size(MB)', 'legacy(ms)', 'legacy peak(MB)', 'writer(ms)', 'writer peak(MB)')]
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'out.cpp')
+			for counts in [2000, 8000]:
+				def legacy() -> None:
+					writer = LegacyWriter(filepath)
+					for _ in range(counts):
+						writer.put(chunk)
+
+					writer.flush()
+
+				def streaming() -> None:
+					writer = Writer(filepath)
+					for index in range(counts):
+						writer.put(chunk)
+						if index % 100 == 0:
+							writer.spill()
+
+					writer.flush()
+
+				results: list[tuple[float, float]] = []
+				for func in [legacy, streaming]:
+					tracemalloc.start()
+					func()
+					_, peak = tracemalloc.get_traced_memory()
+					tracemalloc.stop()
+					results.append((elapsed(func), peak / 1024 / 1024))
+
+				size = len(chunk) * counts / 1024 / 1024
+				rows.append((f'{size:.1f}', f'{results[0][0] * 1000:.2f}', f'{results[0][1]:.1f}', f'{results[1][0] * 1000:.2f}', f'{results[1][1]:.1f}'))
+
+		# 逐次スピルによりバッファは出力サイズに比例しない
+		report('Writer: put/spill/flush', rows)
+
+
+class TestRenderer(TestCase):
+	def test_render(self) -> None:
+		template_dir = 'example/template'
+		samples = Fixture.samples() * 200
+
+		def by_get_template() -> None:
+			env = Environment(loader=FileSystemLoader(template_dir, encoding='utf-8'))
+			for template, vars in samples:
+				text = env.get_template(f'{template}.j2').render(vars)
+				'\t' + '\n\t'.join(text.split('\n'))
+
+		renderer = Renderer(template_dir)
+
+		def by_cache() -> None:
+			for template, vars in samples:
+				renderer.render(template, indent=1, vars=vars)
+
+		legacy = elapsed(by_get_template)
+		cached = elapsed(by_cache)
+		preload = elapsed(lambda: Renderer(template_dir))
+		report(f'Renderer.render: example/template ({len(samples)} renders)', [
+			('case', 'elapsed(ms)', 'templates/sec'),
+			('get_template per render', f'{legacy * 1000:.2f}', f'{len(samples) / legacy:.0f}'),
+			('precompiled', f'{cached * 1000:.2f}', f'{len(samples) / cached:.0f}'),
+			('preload (startup)', f'{preload * 1000:.2f}', '-'),
+		])
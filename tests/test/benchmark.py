@@ -0,0 +1,33 @@
+import time
+from typing import Callable
+
+
+def elapsed(func: Callable[[], object], repeat: int = 3) -> float:
+	"""関数の実行時間を計測。計測結果は最速値を採用
+
+	Args:
+		func (Callable[[], object]): 計測対象の関数
+		repeat (int): 試行回数(default = 3)
+	Returns:
+		float: 実行時間(秒)
+	"""
+	results: list[float] = []
+	for _ in range(repeat):
+		begin = time.perf_counter()
+		func()
+		results.append(time.perf_counter() - begin)
+
+	return min(results)
+
+
+def report(title: str, rows: list[tuple[str, ...]]) -> None:
+	"""計測結果を表形式で出力
+
+	Args:
+		title (str): 表題
+		rows (list[tuple[str, ...]]): 行リスト。先頭行は見出し
+	"""
+	widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+	print(f'\n# {title}')
+	for row in rows:
+		print('  '.join(value.rjust(widths[column]) for column, value in enumerate(row)))
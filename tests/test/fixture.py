@@ -14,25 +14,27 @@ from py2cpp.tp_lark.parser import SyntaxParserOfLark
 
 class Fixture:
 	@classmethod
-	def make(cls, filepath: str) -> 'Fixture':
+	def make(cls, filepath: str, definitions: ModuleDefinitions = {}) -> 'Fixture':
 		rel_path = filepath.split(cls.__appdir())[1]
 		without_ext = rel_path.split('.')[0]
 		elems =  [elem for elem in without_ext.split(os.path.sep) if elem]
 		test_module_path = '.'.join(elems)
-		return cls(test_module_path)
+		return cls(test_module_path, definitions)
 
 	@classmethod
 	def __appdir(cls) -> str:
 		return os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 
-	def __init__(self, test_module_path: str) -> None:
+	def __init__(self, test_module_path: str, definitions: ModuleDefinitions = {}) -> None:
 		self.__test_module_path = test_module_path
+		self.__custom_definitions = definitions
 		self.__app = App(self.__definitions())
 
 	def __definitions(self) -> ModuleDefinitions:
 		return {
 			'py2cpp.module.types.ModulePath': self.__module_path,
 			'py2cpp.module.types.LibraryPaths': self.__library_paths,
+			**self.__custom_definitions,
 		}
 
 	def __module_path(self) -> ModulePath:
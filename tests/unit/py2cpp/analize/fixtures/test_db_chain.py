@@ -0,0 +1,3 @@
+from tests.unit.py2cpp.analize.fixtures.test_db_chain_a import A, C
+
+a: A = A()
@@ -0,0 +1,4 @@
+from tests.unit.py2cpp.analize.fixtures.test_db_chain_b import B, C
+
+class A(B):
+	na: int = 0
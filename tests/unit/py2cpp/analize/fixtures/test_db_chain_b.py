@@ -0,0 +1,6 @@
+from tests.unit.py2cpp.analize.fixtures.test_db_chain_c import C, c
+
+class B(C):
+	nb: int = 0
+
+b: B = B()
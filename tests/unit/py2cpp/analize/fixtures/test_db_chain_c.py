@@ -0,0 +1,4 @@
+class C:
+	nc: int = 0
+
+c: C = C()
@@ -0,0 +1,8 @@
+@__alias__('int')
+class Int: pass
+
+
+class Unknown: pass
+
+
+class Number: pass
@@ -1,6 +1,18 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable
 from unittest import TestCase
+from unittest.mock import patch
 
-from py2cpp.analize.db import SymbolDB
+from py2cpp.analize.db import Expanded, LibraryExpands, SymbolDB
+from py2cpp.ast.parser import ParserSetting
+from py2cpp.lang.cache import CacheSetting
+from py2cpp.module.module import Module
+from py2cpp.module.modules import Modules
+from py2cpp.module.types import ModulePath
+from py2cpp.tp_lark.entry import BinaryTable, EntryOfBinary
 from tests.test.fixture import Fixture
 from tests.test.helper import data_provider
 
@@ -90,3 +102,132 @@ class TestSymbolDB(TestCase):
 			self.assertEqual(db.rows[expected_path].org_path, expected_org_path)
 
 		self.assertEqual(len(db.rows), len(expected))
+
+	def test_transitive_imports(self) -> None:
+		fixtures = 'tests.unit.py2cpp.analize.fixtures'
+		db = Fixture.make(__file__, {
+			'py2cpp.module.types.ModulePath': lambda: ModulePath('__main__', f'{fixtures}.test_db_chain'),
+		}).get(SymbolDB)
+		expected = {
+			f'{fixtures}.test_db_chain_c.C': f'{fixtures}.test_db_chain_c.C',
+			f'{fixtures}.test_db_chain_c.c': f'{fixtures}.test_db_chain_c.C',
+			f'{fixtures}.test_db_chain_b.C': f'{fixtures}.test_db_chain_c.C',
+			f'{fixtures}.test_db_chain_b.B': f'{fixtures}.test_db_chain_b.B',
+			f'{fixtures}.test_db_chain_b.b': f'{fixtures}.test_db_chain_b.B',
+			f'{fixtures}.test_db_chain_a.B': f'{fixtures}.test_db_chain_b.B',
+			f'{fixtures}.test_db_chain_a.A': f'{fixtures}.test_db_chain_a.A',
+			'__main__.A': f'{fixtures}.test_db_chain_a.A',
+			'__main__.a': f'{fixtures}.test_db_chain_a.A',
+		}
+		actual = {key: row.org_path for key, row in db.rows.items() if not row.org_path.startswith(f'{fixtures}.test_db_classes.')}
+		# インポートモジュールは幅優先で展開するため、未展開のモジュールからは展開データのシンボルのみ参照 (A -> B -> C のCはAに伝搬しない)
+		self.assertEqual(actual, expected)
+
+	@data_provider([
+		(['test_db_classes', 'test_db_classes2'], 'test_db_classes'),
+		(['test_db_classes2', 'test_db_classes'], 'test_db_classes2'),
+	])
+	def test_library_precedence(self, libraries: list[str], expected_module: str) -> None:
+		fixtures = 'tests.unit.py2cpp.analize.fixtures'
+		db = Fixture.make(__file__, {
+			'py2cpp.module.types.LibraryPaths': lambda: [f'{fixtures}.{library}' for library in libraries],
+		}).get(SymbolDB)
+		# 複数の標準ライブラリーで宣言されたシンボルは先に指定された標準ライブラリーを優先
+		self.assertEqual(db.rows['__main__.int'].org_path, f'{fixtures}.{expected_module}.int')
+		self.assertEqual(db.rows['__main__.v'].org_path, f'{fixtures}.{expected_module}.int')
+		self.assertEqual(db.rows['__main__.Unknown'].org_path, f'{fixtures}.{expected_module}.Unknown')
+		self.assertEqual(db.rows['__main__.Number'].org_path, f'{fixtures}.test_db_classes2.Number')
+
+	def test_cache_identity(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			grammar = os.path.join(dirpath, 'grammar.lark')
+			shutil.copyfile('data/grammar.lark', grammar)
+			cache_dir = os.path.join(dirpath, 'cache')
+
+			def symbol_caches() -> list[str]:
+				Fixture.make(__file__, {
+					'py2cpp.lang.cache.CacheSetting': lambda: CacheSetting(basedir=cache_dir, format='json'),
+					'py2cpp.ast.parser.ParserSetting': lambda: ParserSetting(grammar=grammar),
+				}).get(SymbolDB)
+				return sorted(filename for _, _, filenames in os.walk(cache_dir) for filename in filenames if '.symbols-' in filename)
+
+			caches = symbol_caches()
+			self.assertGreater(len(caches), 0)
+			self.assertEqual(symbol_caches(), caches)
+
+			# 文法のみ変更
+			with open(grammar, mode='a') as f:
+				f.write('\n// changed\n')
+
+			grammar_changed = symbol_caches()
+			self.assertEqual(len(grammar_changed), len(caches))
+			self.assertEqual(set(grammar_changed) & set(caches), set())
+
+			# ノードの定義(py2cppパッケージ)のみ変更
+			with patch('py2cpp.analize.db.package_digest', lambda: 'changed'):
+				package_changed = symbol_caches()
+
+			self.assertEqual(len(package_changed), len(caches))
+			self.assertEqual(set(package_changed) & set(grammar_changed), set())
+
+	def test_lazy_entries(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			definitions = {'py2cpp.lang.cache.CacheSetting': lambda: CacheSetting(basedir=dirpath)}
+			expected = Fixture.make(__file__, definitions).get(SymbolDB).rows.keys()
+
+			decoded: list[EntryOfBinary] = []
+			org_init = EntryOfBinary.__init__
+
+			def init(entry: EntryOfBinary, table: BinaryTable, index: int) -> None:
+				decoded.append(entry)
+				org_init(entry, table, index)
+
+			with patch.object(EntryOfBinary, '__init__', init):
+				db = Fixture.make(__file__, definitions).get(SymbolDB)
+
+			self.assertEqual(db.rows.keys(), expected)
+			values = [entry.value for entry in decoded if entry.is_terminal]
+			# 宣言は参照し、関数本体の式などの宣言以外の部分木はキャッシュから読み出さない
+			self.assertIn('func1', values)
+			self.assertNotIn('print', values)
+			self.assertNotIn("'b.b2.v'", values)
+
+
+class TestLibraryExpands(TestCase):
+	fixture = Fixture.make(__file__)
+
+	def test_expand(self) -> None:
+		library = self.fixture.get(Modules).libralies[0]
+		library_expands = LibraryExpands()
+		expanded = library_expands.expand(library)
+		self.assertIn('tests.unit.py2cpp.analize.fixtures.test_db_classes.int', expanded.rows)
+		self.assertEqual(list(library_expands.keys()), [library])
+
+		expanded.rows.clear()
+		self.assertEqual(library_expands.expand(library).rows.keys(), library_expands[library].rows.keys())
+		self.assertGreater(len(library_expands[library].rows), 0)
+
+
+class TestExpanded(TestCase):
+	@data_provider([
+		(lambda fixture: fixture.main,),
+		(lambda fixture: fixture.get(Modules).libralies[0],),
+	])
+	def test_dumps_loads(self, get_module: Callable[[Fixture], Module]) -> None:
+		expanded = Expanded.expand(get_module(Fixture.make(__file__)))
+		data = json.loads(json.dumps(expanded.dumps()))
+		module = get_module(Fixture.make(__file__))
+		restored = Expanded.loads(module, data)
+
+		def locate(nodes: list) -> list[tuple[str, type]]:
+			return [(node.full_path, node.__class__) for node in nodes]
+
+		self.assertEqual(list(restored.rows.keys()), list(expanded.rows.keys()))
+		for key, row in restored.rows.items():
+			self.assertIs(row.module, module)
+			self.assertEqual(row.ref_path, expanded.rows[key].ref_path)
+			self.assertEqual(row.symbol.tokens, expanded.rows[key].symbol.tokens)
+			self.assertEqual(locate([row.types, row.decl]), locate([expanded.rows[key].types, expanded.rows[key].decl]))
+
+		self.assertEqual(locate(restored.decl_vars), locate(expanded.decl_vars))
+		self.assertEqual(locate(restored.import_nodes), locate(expanded.import_nodes))
@@ -0,0 +1,117 @@
+from unittest import TestCase
+
+from py2cpp.analize.procedure import ArgKinds, HandlerInvoker, Procedure, ValueStack
+from py2cpp.errors import LogicError
+import py2cpp.node.definition as defs
+from py2cpp.node.node import Node
+from tests.test.fixture import Fixture
+
+
+class Handler(Procedure[str]):
+	def on_entrypoint(self, node: defs.Entrypoint, statements: list[str]) -> str:
+		return '\n'.join(statements)
+
+	def on_move_assign(self, node: defs.MoveAssign, receiver: str, value: str) -> str:
+		return f'{receiver} = {value}'
+
+	def on_list(self, node: defs.List, values: list[str]) -> str:
+		return f'[{", ".join(values)}]'
+
+	def on_fallback(self, node: Node) -> str:
+		return node.tokens
+
+	def on_exit_integer(self, node: defs.Integer, result: str) -> str:
+		return f'int({result})'
+
+
+class Undefined(Procedure[str]):
+	def on_entrypoint(self, node: defs.Entrypoint, statements: list[str]) -> str:
+		return '\n'.join(statements)
+
+
+class Leaky(Handler):
+	def __init__(self) -> None:
+		super().__init__(debug=True)
+
+	def on_move_assign(self, node: defs.MoveAssign, value: str) -> str:
+		return value
+
+
+class TestValueStack(TestCase):
+	def test_pop_n(self) -> None:
+		node = Fixture.make(__file__).custom_nodes('a = 1').by('file_input')
+		stack = ValueStack[str]()
+		for value in ['a', 'b', 'c']:
+			stack.push(value, node)
+
+		self.assertEqual(stack.pop_n(0), [])
+		self.assertEqual(stack.pop_n(2), ['b', 'c'])
+		self.assertEqual(stack.pop(), 'a')
+		self.assertEqual(stack.owners(), [])
+		with self.assertRaises(LogicError):
+			stack.pop()
+
+		with self.assertRaises(LogicError):
+			stack.pop_n(1)
+
+	def test_owners(self) -> None:
+		node = Fixture.make(__file__).custom_nodes('a = 1').by('file_input')
+		stack = ValueStack[str](debug=True)
+		stack.push('a', node)
+		stack.push('b', node)
+		self.assertEqual(stack.owners(), ['file_input', 'file_input'])
+		stack.pop()
+		self.assertEqual(stack.owners(), ['file_input'])
+
+
+class TestProcedure(TestCase):
+	fixture = Fixture.make(__file__)
+
+	def test_process(self) -> None:
+		root = self.fixture.custom_nodes('a = [1, 2]').by('file_input')
+		handler = Handler()
+		for node in [*root.calculated(), root]:
+			handler.process(node)
+
+		self.assertEqual(handler.result(), 'a = [int(1), int(2)]')
+
+	def test_process_debug(self) -> None:
+		root = self.fixture.custom_nodes('a = [1, 2]').by('file_input')
+		handler = Handler(debug=True)
+		for node in [*root.calculated(), root]:
+			handler.process(node)
+
+		self.assertEqual(handler.result(), 'a = [int(1), int(2)]')
+
+	def test_drain(self) -> None:
+		root = self.fixture.custom_nodes('a = 1\nb = 2').by('file_input')
+		handler = Handler()
+		for node in root.calculated():
+			handler.process(node)
+
+		self.assertEqual(handler.drain(), ['a = int(1)', 'b = int(2)'])
+		self.assertEqual(handler.drain(), [])
+
+	def test_process_debug_error(self) -> None:
+		root = self.fixture.custom_nodes('a = 1').by('file_input')
+		handler = Leaky()
+		with self.assertRaisesRegex(LogicError, 'values left behind'):
+			for node in [*root.calculated(), root]:
+				handler.process(node)
+
+	def test_process_error(self) -> None:
+		root = self.fixture.custom_nodes('a = 1').by('file_input')
+		handler = Undefined()
+		with self.assertRaises(LogicError):
+			for node in [*root.calculated(), root]:
+				handler.process(node)
+
+
+class TestHandlerInvoker(TestCase):
+	def test_plan(self) -> None:
+		invoker = HandlerInvoker[str]()
+		plan = invoker.plan(Handler.on_move_assign)
+		self.assertEqual(plan.handler, Handler.on_move_assign)
+		self.assertEqual(plan.args, (('value', ArgKinds.Value), ('receiver', ArgKinds.Value), ('node', ArgKinds.Node)))
+		self.assertEqual(invoker.plan(Handler.on_list).args, (('values', ArgKinds.List), ('node', ArgKinds.Node)))
+		self.assertIs(HandlerInvoker[str]().plan(Handler.on_move_assign), plan)
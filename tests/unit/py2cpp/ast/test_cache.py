@@ -2,20 +2,36 @@ from typing import TypeAlias, cast
 from unittest import TestCase
 
 from py2cpp.ast.cache import EntryCache
+from py2cpp.errors import LogicError, NotFoundError
+from tests.test.helper import data_provider
 
 T_Entry: TypeAlias = tuple[str, list] | tuple[str, str]
 
 
+class Fixture:
+	@classmethod
+	def cache(cls) -> EntryCache[T_Entry]:
+		cache = EntryCache[T_Entry]()
+		root = cache.add(('root', []), 'root')
+		cache.add(('term_a', ''), 'term_a', root)
+		tree_a = cache.add(('tree_a', []), 'tree_a', root, 1)
+		cache.add(('term_b', ''), 'term_b', tree_a)
+		cache.add(('tree_a', []), 'tree_a', root, 2)
+		cache.add(('term_c', ''), 'term_c', root)
+		return cache
+
+
 class TestEntryCache(TestCase):
 	def test_exists(self) -> None:
 		cache = EntryCache[T_Entry]()
-		cache.add('root', ('root', []))
+		cache.add(('root', []), 'root')
 		self.assertEqual(cache.exists('root'), True)
+		self.assertEqual(cache.exists('root.term_a'), False)
 
 	def test_by(self) -> None:
 		cache = EntryCache[T_Entry]()
 		root = ('root', [])
-		cache.add('root', root)
+		cache.add(root, 'root')
 		self.assertEqual(cache.by('root'), root)
 
 	def test_group_by(self) -> None:
@@ -28,11 +44,11 @@ class TestEntryCache(TestCase):
 			('term_c', ''),
 		])
 		tree_a = cast(tuple[str, list], root[1][1])
-		cache.add('root', root)
-		cache.add('root.term_a', root[1][0])
-		cache.add('root.tree_a', root[1][1])
-		cache.add('root.tree_a.term_b', tree_a[1][0])
-		cache.add('root.term_c', root[1][2])
+		root_index = cache.add(root, 'root')
+		cache.add(root[1][0], 'term_a', root_index)
+		tree_a_index = cache.add(root[1][1], 'tree_a', root_index)
+		cache.add(tree_a[1][0], 'term_b', tree_a_index)
+		cache.add(root[1][2], 'term_c', root_index)
 
 		under_root = list(cache.group_by('root').values())
 		self.assertEqual(under_root, [root, root[1][0], tree_a, tree_a[1][0], root[1][2]])
@@ -42,5 +58,126 @@ class TestEntryCache(TestCase):
 
 	def test_add(self) -> None:
 		cache = EntryCache[T_Entry]()
-		cache.add('root', ('root', []))
+		self.assertEqual(cache.add(('root', []), 'root'), 0)
+		self.assertEqual(cache.add(('term_a', ''), 'term_a', 0), 1)
 		self.assertEqual(cache.exists('root'), True)
+		self.assertEqual(cache.exists('root.term_a'), True)
+
+	@data_provider([
+		('root', 0),
+		('root.tree_a[1].term_b', 3),
+		('root.term_c', 5),
+	])
+	def test_index_of(self, path: str, expected: int) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.index_of(path), expected)
+		self.assertEqual(cache.path_of(expected), path)
+
+	@data_provider([
+		('root.tree_a',),
+		('root.tree_a[3]',),
+		('root.term_a[1]',),
+		('tree_a',),
+	])
+	def test_index_of_error(self, path: str) -> None:
+		cache = Fixture.cache()
+		with self.assertRaises(NotFoundError):
+			cache.index_of(path)
+
+	@data_provider([
+		(4, 'root.tree_a[2]'),
+		(3, 'root.tree_a[1].term_b'),
+		(0, 'root'),
+	])
+	def test_path_of(self, index: int, expected: str) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.path_of(index), expected)
+		self.assertEqual(cache.index_of(expected), index)
+
+	@data_provider([
+		(0, 'root'),
+		(2, 'tree_a'),
+		(4, 'tree_a'),
+		(5, 'term_c'),
+	])
+	def test_tag_of(self, index: int, expected: str) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.tag_of(index), expected)
+		self.assertEqual(cache.tag_id_of(index), cache.tag_id(expected))
+
+	@data_provider([
+		(0, -1),
+		(1, 0),
+		(3, 2),
+		(4, 0),
+	])
+	def test_parent_of(self, index: int, expected: int) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.parent_of(index), expected)
+
+	@data_provider([
+		(0, [1, 2, 4, 5]),
+		(2, [3]),
+		(3, []),
+		(4, []),
+	])
+	def test_children_of(self, index: int, expected: list[int]) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.children_of(index), expected)
+
+	@data_provider([
+		(0, 5),
+		(1, 1),
+		(2, 3),
+		(4, 4),
+	])
+	def test_end_of(self, index: int, expected: int) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.end_of(index), expected)
+
+	def test_group_by_view(self) -> None:
+		cache = Fixture.cache()
+		group = cache.group_by('root.tree_a[1]')
+		self.assertEqual(len(group), 2)
+		self.assertEqual(list(group.keys()), ['root.tree_a[1]', 'root.tree_a[1].term_b'])
+		self.assertEqual(list(group.items())[1], ('root.tree_a[1].term_b', ('term_b', '')))
+		self.assertEqual('root.tree_a[1].term_b' in group, True)
+		self.assertEqual('root.term_c' in group, False)
+		self.assertEqual(group['root.tree_a[1].term_b'], ('term_b', ''))
+		with self.assertRaises(KeyError):
+			group['root.term_c']
+
+	def test_end_of_after_add(self) -> None:
+		cache = Fixture.cache()
+		self.assertEqual(cache.end_of(2), 3)
+		cache.add(('term_d', ''), 'term_d', 5)
+		self.assertEqual(cache.end_of(0), 6)
+		self.assertEqual(cache.end_of(5), 6)
+
+	def test_unfold(self) -> None:
+		unfolded: list[str] = []
+
+		def unfold(entry: T_Entry) -> list[tuple[str, int, T_Entry]]:
+			tag, children = entry
+			unfolded.append(tag)
+			if not isinstance(children, list):
+				return []
+
+			tags = [child[0] for child in children]
+			return [(child[0], index if tags.count(child[0]) > 1 else -1, child) for index, child in enumerate(children)]
+
+		root = ('root', [
+			('tree_a', [('term_a', '')]),
+			('tree_a', [('term_b', '')]),
+			('term_c', ''),
+		])
+		cache = EntryCache[T_Entry](unfold)
+		cache.add(root, 'root')
+		# パスの経路上のエントリーのみを展開
+		self.assertEqual(cache.by('root.tree_a[1].term_b'), ('term_b', ''))
+		self.assertEqual(unfolded, ['root', 'tree_a'])
+		self.assertEqual(cache.path_of(cache.children_of(0)[0]), 'root.tree_a[0]')
+		self.assertEqual(cache.children_of(cache.index_of('root.term_c')), [])
+		self.assertEqual(unfolded, ['root', 'tree_a', 'term_c'])
+		with self.assertRaises(LogicError):
+			cache.end_of(0)
@@ -110,3 +110,50 @@ class TestASTFinder(TestCase):
 		finder = Fixture.finder()
 		entry = finder.pluck(tree, via)
 		self.assertEqual(list(finder.full_pathfy(entry, via, depth).keys()), expected)
+
+	@data_provider([
+		('root', -1),
+		('root.tree_a', -1),
+		('root.tree_a', 1),
+		('root', 0),
+	])
+	def test_walk(self, via: str, depth: int) -> None:
+		tree = Fixture.tree()
+		finder = Fixture.finder()
+		entry = finder.pluck(tree, via)
+		walked = list(finder.walk(entry, via, depth))
+		self.assertEqual(walked[0], (via, entry))
+		for path, in_entry in walked:
+			self.assertEqual(in_entry.source, finder.pluck(tree, path).source)
+
+	@data_provider([
+		('root', -1),
+		('root.tree_a', -1),
+		('root.tree_a', 1),
+		('root', 0),
+	])
+	def test_walk_indexs(self, via: str, depth: int) -> None:
+		tree = Fixture.tree()
+		finder = Fixture.finder()
+		entry = finder.pluck(tree, via)
+		walked = list(finder.walk(entry, via, depth))
+		paths: list[str] = []
+		for parent, elem_index, in_entry in finder.walk_indexs(entry, depth):
+			tag = in_entry.name if elem_index == -1 else f'{in_entry.name}[{elem_index}]'
+			paths.append(f'{paths[parent]}.{tag}' if parent != -1 else via)
+
+		self.assertEqual(paths, [path for path, _ in walked])
+
+	def test_unfold(self) -> None:
+		tree = Fixture.tree()
+		finder = Fixture.finder()
+		entry = finder.pluck(tree, 'root.tree_a')
+		self.assertEqual([(tag, elem_index, child.name) for tag, elem_index, child in finder.unfold(entry)], [
+			('__empty__', -1, '__empty__'),
+			('token_a', 1, 'token_a'),
+			('tree_b', 2, 'tree_b'),
+			('tree_b', 3, 'tree_b'),
+			('token_a', 4, 'token_a'),
+			('token_c', -1, 'token_c'),
+		])
+		self.assertEqual(finder.unfold(finder.pluck(tree, 'root.token_d')), [])
@@ -1,9 +1,33 @@
 from unittest import TestCase
 
-from py2cpp.ast.path import EntryPath
+from py2cpp.ast.path import EntryPath, ParsedPath
 from tests.test.helper import data_provider
 
 
+class TestParsedPath(TestCase):
+	@data_provider([
+		('a', ('a',), (('a', -1),), 'a'),
+		('a[0].b.c[1]', ('a[0]', 'b', 'c[1]'), (('a', 0), ('b', -1), ('c', 1)), 'a.b.c'),
+		('', (), (), ''),
+	])
+	def test_parse(self, origin: str, elements: tuple[str, ...], pairs: tuple[tuple[str, int], ...], de_identified: str) -> None:
+		parsed = ParsedPath.parse(origin)
+		self.assertEqual(parsed.origin, origin)
+		self.assertEqual(parsed.elements, elements)
+		self.assertEqual(parsed.pairs, pairs)
+		self.assertEqual(parsed.tags, tuple(tag for tag, _ in pairs))
+		self.assertEqual(parsed.de_identified, de_identified)
+
+	def test_intern(self) -> None:
+		self.assertIs(ParsedPath.parse('a[0].b'), ParsedPath.parse('a[0].b'))
+		self.assertEqual(ParsedPath('a[0].b'), ParsedPath.parse('a[0].b'))
+		self.assertEqual(hash(ParsedPath('a[0].b')), hash(ParsedPath.parse('a[0].b')))
+
+	def test_immutable(self) -> None:
+		with self.assertRaises(AttributeError):
+			setattr(ParsedPath.parse('a.b'), 'origin', 'c')
+
+
 class TestEntryPath(TestCase):
 	@data_provider([
 		(['a', 'b'], 'a.b'),
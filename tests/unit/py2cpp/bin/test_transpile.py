@@ -0,0 +1,145 @@
+from contextlib import redirect_stdout
+import io
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import TestCase
+from unittest.mock import patch
+
+from py2cpp.bin.transpile import Args, BatchResult, Context, Handler, collect_sources, depends_environment, main_serve, report_batch, run_batch, transpile
+from py2cpp.lang.cache import CacheSetting
+from py2cpp.module.depends import tree_digest
+from py2cpp.view.render import Renderer, Writer
+from tests.test.fixture import Fixture
+
+
+class TestBatch(TestCase):
+	def test_collect_sources(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			for filepath in ['b.py', 'a.py', 'c.txt', 'sub/d.py']:
+				os.makedirs(os.path.dirname(os.path.join(dirpath, filepath)), exist_ok=True)
+				with open(os.path.join(dirpath, filepath), mode='w') as f:
+					f.write('')
+
+			expected = [
+				os.path.join(dirpath, 'a.py'),
+				os.path.join(dirpath, 'b.py'),
+				os.path.join(dirpath, 'sub/d.py'),
+				'path/to/file.py',
+			]
+			self.assertEqual(collect_sources([dirpath, 'path/to/file.py']), expected)
+
+	def test_report_batch(self) -> None:
+		results = [
+			BatchResult('a.py', 0.5, ''),
+			BatchResult('b.py', 0.25, 'Traceback'),
+			BatchResult('c.py', 0.0, '', skipped=True),
+		]
+		stdout = io.StringIO()
+		with redirect_stdout(stdout):
+			report_batch(results, 1.0)
+
+		lines = stdout.getvalue().split('\n')
+		self.assertEqual(lines[0], 'OK      500.00ms a.py')
+		self.assertEqual(lines[1], 'NG      250.00ms b.py')
+		self.assertEqual(lines[2], 'SKIP      0.00ms c.py')
+		self.assertEqual(lines[3:6], ['==========', 'b.py', 'Traceback'])
+		self.assertEqual(lines[6], 'files: 3, succeeded: 1, failed: 1, skipped: 1, elapsed: 1.00s, total: 0.75s')
+
+	def test_depends_environment(self) -> None:
+		environment = depends_environment('data/grammar.lark')
+		self.assertIn('data/grammar.lark', environment)
+		self.assertIn('example/template/block.j2', environment)
+		self.assertEqual(environment['py2cpp'], tree_digest('py2cpp', '**/*.py'))
+
+		with patch('py2cpp.bin.transpile.package_digest', lambda: 'changed'):
+			self.assertNotEqual(depends_environment('data/grammar.lark'), environment)
+
+	def test_run_batch(self) -> None:
+		sources = [
+			'tests/unit/py2cpp/analize/fixtures/test_db_xyz.py',
+			'tests/unit/py2cpp/analize/fixtures/test_symbols.py',
+		] * 4
+		with tempfile.TemporaryDirectory() as dirpath:
+			def output_path(source: str) -> str:
+				return os.path.join(dirpath, 'output', f'{os.path.basename(source)}.cpp')
+
+			os.makedirs(os.path.join(dirpath, 'output'))
+			cache_dir = os.path.join(dirpath, 'cache')
+			# コールドキャッシュで複数のワーカーからキャッシュを同時に参照する
+			with patch('py2cpp.ast.provider.cache_setting', lambda: CacheSetting(basedir=cache_dir)), \
+				patch('py2cpp.bin.transpile.output_path', output_path):
+				results = run_batch('data/grammar.lark', sources, workers=4)
+
+			self.assertEqual([result.source for result in results], sources)
+			self.assertEqual([result.error for result in results], [''] * len(sources))
+			self.assertEqual(sorted(os.listdir(os.path.join(dirpath, 'output'))), ['test_db_xyz.py.cpp', 'test_symbols.py.cpp'])
+			cache_files = [filename for _, _, filenames in os.walk(cache_dir) for filename in filenames]
+			self.assertTrue(any(filename.startswith('parser.cache-') for filename in cache_files))
+			self.assertEqual([filename for filename in cache_files if filename.endswith('.tmp')], [])
+
+
+class TestTranspile(TestCase):
+	def test_transpile(self) -> None:
+		root = Fixture.make(__file__).custom_nodes('a = 1\nb = [1, 2]\nc = a').by('file_input')
+		renderer = Renderer('example/template')
+		handler = Handler(renderer)
+		for node in [*root.calculated(), root]:
+			handler.process(node)
+
+		expected = handler.result()
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'out.cpp')
+			writer = Writer(filepath)
+			with patch.object(writer, 'spill', wraps=writer.spill) as spill:
+				transpile(root, Context(writer, renderer), verbose=False)
+
+			# トップレベルのステートメント毎の3回と、フラッシュ時の1回
+			self.assertEqual(spill.call_count, 4)
+			with open(filepath) as f:
+				self.assertEqual(f.read(), expected)
+
+
+class TestServe(TestCase):
+	def serve(self, lines: list[str], output_dir: str) -> list[dict[str, Any]]:
+		def output_path(source: str) -> str:
+			return os.path.join(output_dir, f'{os.path.basename(source)}.cpp')
+
+		reader = io.StringIO(''.join(f'{line}\n' for line in lines))
+		writer = io.StringIO()
+		with patch('py2cpp.bin.transpile.output_path', output_path), patch('sys.stdin', reader), patch('sys.stdout', writer):
+			self.assertEqual(main_serve(cast(Args, SimpleNamespace(grammar='data/grammar.lark'))), 0)
+
+		return [json.loads(line) for line in writer.getvalue().splitlines()]
+
+	def test_serve(self) -> None:
+		source = 'tests/unit/py2cpp/analize/fixtures/test_db_xyz.py'
+		lines = [
+			json.dumps({'source': source}),
+			'',
+			'{"source": ',
+			json.dumps([source]),
+			json.dumps({'path': source}),
+			json.dumps({'source': 'path/to/missing.py'}),
+		]
+		with tempfile.TemporaryDirectory() as dirpath:
+			responses = self.serve(lines, dirpath)
+			self.assertEqual(len(responses), 5)
+
+			self.assertEqual(responses[0]['source'], source)
+			self.assertEqual(responses[0]['output'], os.path.join(dirpath, 'test_db_xyz.py.cpp'))
+			self.assertEqual(responses[0]['ok'], True)
+			self.assertEqual(responses[0]['error'], '')
+			self.assertTrue(os.path.isfile(responses[0]['output']))
+
+			for response in responses[1:4]:
+				self.assertEqual(response['ok'], False)
+				self.assertEqual(response['source'], '')
+				self.assertTrue(response['error'].startswith('Invalid request.'))
+
+			self.assertEqual(responses[4]['source'], 'path/to/missing.py')
+			self.assertEqual(responses[4]['ok'], False)
+			self.assertIn('FileNotFoundError', responses[4]['error'])
+			self.assertEqual(os.listdir(dirpath), ['test_db_xyz.py.cpp'])
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+from typing import IO
+from unittest import TestCase
+
+from py2cpp.lang.cache import CacheProvider, CacheSetting
+from tests.test.helper import data_provider
+
+
+class Data:
+	def __init__(self, value: str) -> None:
+		self.value = value
+
+	@classmethod
+	def load(cls, stream: IO) -> 'Data':
+		return cls(json.load(stream)['value'])
+
+	def save(self, stream: IO) -> None:
+		stream.write(json.dumps({'value': self.value}).encode('utf-8'))
+
+
+class TestCacheProvider(TestCase):
+	def test_get(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			cache = CacheProvider(CacheSetting(basedir=dirpath))
+			calls: list[str] = []
+
+			@cache.get('data', identity={'key': 'a'}, format='json')
+			def instantiate() -> Data:
+				calls.append('instantiate')
+				return Data('a')
+
+			self.assertEqual(instantiate().value, 'a')
+			self.assertEqual(instantiate().value, 'a')
+			self.assertEqual(calls, ['instantiate'])
+
+	@data_provider([
+		(b'',),
+		(b'{"value": ',),
+	])
+	def test_get_broken(self, broken: bytes) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			cache = CacheProvider(CacheSetting(basedir=dirpath))
+
+			@cache.get('data', identity={'key': 'a'}, format='json')
+			def instantiate() -> Data:
+				return Data('a')
+
+			instantiate()
+			filepaths = [os.path.join(dirpath, filename) for filename in os.listdir(dirpath)]
+			with open(filepaths[0], mode='wb') as f:
+				f.write(broken)
+
+			# 破損したキャッシュはキャッシュミスとして再生成し、上書きする
+			self.assertEqual(instantiate().value, 'a')
+			with open(filepaths[0], mode='rb') as f:
+				self.assertEqual(Data.load(f).value, 'a')
+
+			self.assertEqual(os.listdir(dirpath), [os.path.basename(filepaths[0])])
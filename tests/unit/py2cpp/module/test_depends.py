@@ -0,0 +1,94 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from py2cpp.errors import LogicError
+from py2cpp.module.depends import DependGraph, collect_imports, source_path_of, tree_digest
+from tests.test.fixture import Fixture
+from tests.test.helper import data_provider
+
+
+def write(module_path: str, text: str) -> None:
+	with open(source_path_of(module_path), mode='w') as f:
+		f.write(text)
+
+
+class TestDependGraph(TestCase):
+	@data_provider([
+		('a', 'a.py'),
+		('path.to.module', 'path/to/module.py'),
+	])
+	def test_source_path_of(self, module_path: str, expected: str) -> None:
+		self.assertEqual(source_path_of(module_path), expected)
+
+	def test_tree_digest(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			def put(filepath: str, text: str) -> None:
+				os.makedirs(os.path.dirname(os.path.join(dirpath, filepath)), exist_ok=True)
+				with open(os.path.join(dirpath, filepath), mode='w') as f:
+					f.write(text)
+
+			put('a.py', 'a = 1')
+			put('sub/b.py', 'b = 1')
+			digest = tree_digest(dirpath, '**/*.py')
+			self.assertEqual(tree_digest(dirpath, '**/*.py'), digest)
+
+			put('c.txt', 'c = 1')
+			self.assertEqual(tree_digest(dirpath, '**/*.py'), digest)
+
+			put('sub/b.py', 'b = 2')
+			changed = tree_digest(dirpath, '**/*.py')
+			self.assertNotEqual(changed, digest)
+
+			os.rename(os.path.join(dirpath, 'sub/b.py'), os.path.join(dirpath, 'sub/d.py'))
+			self.assertNotEqual(tree_digest(dirpath, '**/*.py'), changed)
+
+	def test_collect_imports(self) -> None:
+		entrypoint = Fixture.make(__file__).custom_nodes('from a.b import c\nfrom d import e, f\n\nx = 1').by('file_input')
+		self.assertEqual(collect_imports(entrypoint), ['a.b', 'd'])
+
+	def test_depends(self) -> None:
+		graph = DependGraph({})
+		graph.record('a', {'a': ['b', 'c'], 'b': ['c', 'a'], 'c': ['d']})
+		self.assertEqual(graph.depends('a'), ['a', 'b', 'c', 'd'])
+		self.assertEqual(graph.depends('c'), ['c', 'd'])
+		self.assertEqual(graph.depends('x'), ['x'])
+
+	def test_dirty(self) -> None:
+		with tempfile.TemporaryDirectory(dir='.') as dirpath:
+			package = os.path.basename(dirpath)
+			write(f'{package}.a', 'from b import B')
+			write(f'{package}.b', 'from c import C')
+			write(f'{package}.c', 'C = 1')
+			imports = {f'{package}.a': [f'{package}.b'], f'{package}.b': [f'{package}.c'], f'{package}.c': []}
+
+			graph = DependGraph({})
+			self.assertTrue(graph.dirty(f'{package}.a'))
+			graph.record(f'{package}.a', imports)
+			graph.record(f'{package}.b', imports)
+			self.assertFalse(graph.dirty(f'{package}.a'))
+
+			write(f'{package}.c', 'C = 2')
+			graph = DependGraph.loads(graph.dumps(), {})
+			self.assertTrue(graph.dirty(f'{package}.a'))
+			self.assertTrue(graph.dirty(f'{package}.b'))
+			self.assertTrue(graph.dirty(f'{package}.c'))
+
+			graph.record(f'{package}.a', imports)
+			self.assertFalse(graph.dirty(f'{package}.a'))
+			graph.discard(f'{package}.a')
+			self.assertTrue(graph.dirty(f'{package}.a'))
+
+	def test_record_error(self) -> None:
+		with self.assertRaises(LogicError):
+			DependGraph({}).record('a', {'b': []})
+
+	@data_provider([
+		({'grammar': '1'}, False),
+		({'grammar': '2'}, True),
+	])
+	def test_loads(self, environment: dict[str, str], expected_dirty: bool) -> None:
+		graph = DependGraph({'grammar': '1'})
+		graph.record('a', {'a': []})
+		self.assertEqual(DependGraph.loads(graph.dumps(), environment).dirty('a'), expected_dirty)
+		self.assertTrue(DependGraph.loads('{broken', environment).dirty('a'))
@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from py2cpp.node.cache import Memoize, MetaCache
+from py2cpp.node.embed import EmbedTable, Meta, accept_tags, actualized, expandable
+from py2cpp.node.node import Node
+
+
+class TestMemoize(TestCase):
+	def test_memo(self) -> None:
+		calls: list[int] = []
+
+		@Memoize.memo
+		def double(value: int) -> int:
+			calls.append(value)
+			return value * 2
+
+		self.assertEqual(double(1), 2)
+		self.assertEqual(double(2), 4)
+		self.assertEqual(double(1), 2)
+		self.assertEqual(calls, [1, 2])
+		self.assertEqual(Memoize.stats()['TestMemoize.test_memo.<locals>.double'], (1, 2))
+
+	def test_discard(self) -> None:
+		class Calc:
+			@classmethod
+			@Memoize.memo
+			def double(cls, value: int) -> int:
+				return value * 2
+
+		name = 'TestMemoize.test_discard.<locals>.Calc.double'
+		self.assertEqual(Calc.double(1), 2)
+		self.assertEqual(Calc.double(1), 2)
+		self.assertEqual(Memoize.stats()[name], (1, 1))
+		Memoize.discard(Calc)
+		self.assertEqual(Calc.double(1), 2)
+		self.assertEqual(Memoize.stats()[name], (1, 2))
+
+
+class TestMetaCache(TestCase):
+	def test_lookup(self) -> None:
+		@Meta.embed(Node, accept_tags('class', 'function'))
+		class NodeSet(Node):
+			@property
+			@Meta.embed(Node, expandable)
+			def prop_a(self) -> Node:
+				return self
+
+		@Meta.embed(Node, actualized(via=NodeSet), accept_tags('function'))
+		class NodeSubset(NodeSet):
+			@property
+			@Meta.embed(Node, expandable)
+			def prop_b(self) -> Node:
+				return self
+
+		self.assertEqual(MetaCache(Node, NodeSet).expands(), ('prop_a',))
+		self.assertEqual(MetaCache(Node, NodeSet).accept_tags(), ('class', 'function'))
+		self.assertEqual(MetaCache(Node, NodeSet).actualized(), (NodeSubset,))
+		self.assertEqual(MetaCache(Node, NodeSubset).expands(), ('prop_a', 'prop_b'))
+		self.assertEqual(MetaCache(Node, NodeSubset).accept_tags(), ('function',))
+		self.assertEqual(MetaCache(Node, NodeSubset).actualized(), (NodeSubset,))
+
+	def test_memoized(self) -> None:
+		class NodeSet(Node): pass
+
+		@Meta.embed(Node, actualized(via=NodeSet))
+		class NodeSubset(NodeSet): pass
+
+		name = 'MetaCache.actualized'
+		hits, misses = Memoize.stats().get(name, (0, 0))
+		self.assertIs(MetaCache(Node, NodeSet).actualized(), MetaCache(Node, NodeSet).actualized())
+		self.assertEqual(Memoize.stats()[name], (hits + 1, misses + 1))
+
+	def test_revision(self) -> None:
+		class NodeSet(Node): pass
+
+		@Meta.embed(Node, actualized(via=NodeSet))
+		class NodeSubset(NodeSet): pass
+
+		self.assertEqual(MetaCache(Node, NodeSet).actualized(), (NodeSubset,))
+
+		@Meta.embed(Node, actualized(via=NodeSet))
+		class NodeSubset2(NodeSet): pass
+
+		self.assertEqual(MetaCache(Node, NodeSet).actualized(), (NodeSubset, NodeSubset2))
+
+	def test_table(self) -> None:
+		@Meta.embed(Node, accept_tags('class'))
+		class NodeSet(Node):
+			@property
+			@Meta.embed(Node, expandable)
+			def prop_a(self) -> Node:
+				return self
+
+		@Meta.embed(Node, actualized(via=NodeSet))
+		class NodeSubset(NodeSet): pass
+
+		table = MetaCache(Node, NodeSet).table()
+		self.assertEqual(table, EmbedTable(('prop_a',), ('class',), (NodeSubset,)))
+		self.assertIs(MetaCache(Node, NodeSet).table(), table)
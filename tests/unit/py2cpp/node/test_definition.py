@@ -1,6 +1,7 @@
 from typing import Any
 from unittest import TestCase
 
+from py2cpp.node.cache import Memoize
 import py2cpp.node.definition as defs
 from tests.test.fixture import Fixture
 from tests.test.helper import data_provider
@@ -444,3 +445,18 @@ class TestDefinition(TestCase):
 			self.assertEqual(item.first.tokens, in_expected['key'])
 			self.assertEqual(item.second.tokens, in_expected['value'])
 			self.assertEqual(type(item.second), in_expected['value_type'])
+
+	# General
+
+	def test_slots(self) -> None:
+		# ノードの属性はスロットで管理され、インスタンス毎の辞書を持たない
+		nodes = [node.actualize() for node in self.fixture.shared_nodes.by('file_input').calculated()]
+		self.assertEqual([], [str(node) for node in nodes if hasattr(node, '__dict__')])
+
+	def test_meta_cache(self) -> None:
+		# メタデータのテーブルはflatten/actualize/as_aの度にメタデータキャッシュから参照される
+		name = 'MetaCache.table'
+		hits, _ = Memoize.stats().get(name, (0, 0))
+		nodes = [node.actualize() for node in self.fixture.custom_nodes('class A:\n\tdef f(self) -> None: ...').by('file_input').calculated()]
+		[node.as_a(defs.Class) for node in nodes if isinstance(node, defs.Class)]
+		self.assertGreater(Memoize.stats()[name][0], hits)
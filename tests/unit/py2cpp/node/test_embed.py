@@ -59,3 +59,15 @@ class TestMeta(TestCase):
 		method_meta = Meta.dig_for_method(MetaHolder, C, EmbedKeys.Expandable, value_type=int)
 		self.assertEqual(method_meta['prop0'], True)
 		self.assertEqual(method_meta['prop1'], True)
+
+	def test_revision(self) -> None:
+		class MetaHolder: pass
+		self.assertEqual(Meta.revision(MetaHolder), 0)
+
+		@Meta.embed(MetaHolder, accept_tags('hoge'))
+		class D:
+			@Meta.embed(MetaHolder, expandable)
+			def prop(self) -> int:
+				return 0
+
+		self.assertEqual(Meta.revision(MetaHolder), 2)
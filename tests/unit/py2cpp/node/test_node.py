@@ -11,7 +11,7 @@ from py2cpp.lang.implementation import implements, override
 from py2cpp.lang.locator import Currying, Locator
 from py2cpp.module.provider import module_path_dummy
 from py2cpp.module.types import ModulePath
-from py2cpp.node.embed import Meta, actualized, expandable
+from py2cpp.node.embed import Meta, accept_tags, actualized, expandable
 from py2cpp.node.interface import IScope, ITerminal
 from py2cpp.node.node import Node
 from py2cpp.node.query import Nodes
@@ -422,6 +422,20 @@ class TestNode(TestCase):
 		all = [node.full_path for node in nodes.by(full_path).calculated()]
 		self.assertEqual(all, expected)
 
+	def test_calculated_streaming(self) -> None:
+		nodes = Fixture.nodes()
+		calculated = nodes.by('file_input.class').calculated()
+		self.assertEqual(next(calculated).full_path, 'file_input.class.block.enum.block.assign[0].term_a')
+		self.assertEqual(len(list(calculated)), 16)
+
+	def test_arity_of(self) -> None:
+		nodes = Fixture.nodes()
+		node = nodes.by('file_input.class.block.enum')
+		self.assertEqual(node.arity_of('vars'), len(node.vars))
+		list(nodes.by('file_input.class').calculated())
+		self.assertEqual(node.arity_of('vars'), len(node.vars))
+		self.assertEqual(nodes.by('file_input.class').arity_of('block'), 1)
+
 	def test_is_a(self) -> None:
 		nodes = Fixture.nodes()
 		node = nodes.by('file_input.class')
@@ -448,11 +462,12 @@ class TestNode(TestCase):
 			@classmethod
 			@override
 			def match_feature(cls, via: Node) -> bool:
-				return via.tag == 'node_a'
+				return via.tag == 'class'
 
 		di = Fixture.di()
-		root = di.currying(NodeA, Callable[[str], Node])('root')
-		node = di.currying(NodeA, Callable[[str], Node])('node_a')
+		nodes = di.resolve(Query[Node])
+		root = di.currying(NodeA, Callable[[int], Node])(nodes.id_of('file_input'))
+		node = di.currying(NodeA, Callable[[int], Node])(nodes.id_of('file_input.class'))
 		self.assertEqual(NodeA.match_feature(root), False)
 		self.assertEqual(NodeA.match_feature(node), True)
 
@@ -464,13 +479,74 @@ class TestNode(TestCase):
 			@classmethod
 			@override
 			def match_feature(cls, via: Node) -> bool:
-				return via.tag == 'node_subset'
+				return via.tag == 'class'
 
 		di = Fixture.di()
-		node = di.currying(NodeSet, Callable[[str], Node])('node_subset')
+		nodes = di.resolve(Query[Node])
+		node = di.currying(NodeSet, Callable[[int], Node])(nodes.id_of('file_input.class'))
 		self.assertEqual(type(node), NodeSet)
 		self.assertEqual(type(node.actualize()), NodeSubset)
 
+	def test_actualize_cached(self) -> None:
+		calls: list[str] = []
+
+		class NodeSet(Node): pass
+
+		@Meta.embed(Node, actualized(via=NodeSet))
+		class NodeSubset(NodeSet):
+			@classmethod
+			@override
+			def feature_key(cls, via: Node) -> str:
+				return via.tag
+
+			@classmethod
+			@override
+			def match_feature(cls, via: Node) -> bool:
+				calls.append(via.full_path)
+				return via.tag == 'function'
+
+		di = Fixture.di()
+		nodes = di.resolve(Query[Node])
+		factory = di.currying(NodeSet, Callable[[int], Node])
+		function_a = factory(nodes.id_of('file_input.class.block.function[1]'))
+		function_b = factory(nodes.id_of('file_input.class.block.function[2]'))
+		block = factory(nodes.id_of('file_input.class.block'))
+		self.assertEqual(type(function_a.actualize()), NodeSubset)
+		self.assertEqual(type(function_b.actualize()), NodeSubset)
+		self.assertEqual(type(block.actualize()), NodeSet)
+		self.assertEqual(calls, ['file_input.class.block.function[1]', 'file_input.class.block'])
+
+	def test_embed_table(self) -> None:
+		@Meta.embed(Node, accept_tags('class', 'function'))
+		class NodeSet(Node):
+			@property
+			@Meta.embed(Node, expandable)
+			def prop_a(self) -> Node:
+				return self
+
+		@Meta.embed(Node, actualized(via=NodeSet), accept_tags('function'))
+		class NodeSubset(NodeSet):
+			@property
+			@Meta.embed(Node, expandable)
+			def prop_b(self) -> Node:
+				return self
+
+		table = NodeSet._embed_table()
+		self.assertEqual(table.expandable_keys, ('prop_a',))
+		self.assertEqual(table.accept_tags, ('class', 'function'))
+		self.assertEqual(table.feature_classes, (NodeSubset,))
+		self.assertIs(NodeSet._embed_table(), table)
+
+		sub_table = NodeSubset._embed_table()
+		self.assertEqual(sub_table.expandable_keys, ('prop_a', 'prop_b'))
+		self.assertEqual(sub_table.accept_tags, ('function',))
+		self.assertEqual(sub_table.feature_classes, (NodeSubset,))
+
+		@Meta.embed(Node, actualized(via=NodeSet))
+		class NodeSubset2(NodeSet): pass
+
+		self.assertEqual(NodeSet._embed_table().feature_classes, (NodeSubset, NodeSubset2))
+
 	@data_provider([
 		('file_input.function.block.term_a', {'from': 'F1_A', 'to': 'hoge'}),
 	])
@@ -108,6 +108,24 @@ class TestNodes(TestCase):
 		nodes = Fixture.nodes()
 		self.assertEqual(nodes.exists(path), expected)
 
+	@data_provider([
+		('root', 'root'),
+		('root.tree_a', 'tree_a'),
+		('root.tree_a.__empty__', '__empty__'),
+		('root.tree_a.tree_b[3].token_b', 'token_b'),
+		('root.tree_c.skip_tree_a', 'skip_tree_a'),
+	])
+	def test_id_of(self, path: str, expected_tag: str) -> None:
+		nodes = Fixture.nodes()
+		entry_id = nodes.id_of(path)
+		self.assertEqual(nodes.path_of(entry_id), path)
+		self.assertEqual(nodes.tag_of(entry_id), expected_tag)
+
+	def test_id_of_error(self) -> None:
+		nodes = Fixture.nodes()
+		with self.assertRaises(NotFoundError):
+			nodes.id_of('root.unknown')
+
 	@data_provider([
 		('root', Root),
 		('root.tree_a', TreeA),
@@ -160,6 +178,15 @@ class TestNodes(TestCase):
 		node = nodes.ancestor(via, tag)
 		self.assertEqual(type(node), expected)
 
+	@data_provider([
+		('root.tree_a.token_c', 'tree_b', NotFoundError),
+		('root.outside', 'root', NotFoundError),
+	])
+	def test_ancestor_error(self, via: str, tag: str, expected: type[Exception]) -> None:
+		nodes = Fixture.nodes()
+		with self.assertRaises(expected):
+			nodes.ancestor(via, tag)
+
 	@data_provider([
 		('root.tree_a', [TreeA, Terminal, TreeC]),
 		('root.tree_a.__empty__', [Empty, TokenA, TreeB, TreeB, TokenA, TokenC]),
@@ -189,6 +216,28 @@ class TestNodes(TestCase):
 		in_nodes = nodes.children(via)
 		self.assertEqual([type(node) for node in in_nodes], expected)
 
+	@data_provider([
+		('root', 0, TreeA),
+		('root', 2, TreeC),
+		('root.tree_a', 3, TreeB),
+		('root.tree_a.tree_b[3]', 0, TokenB),
+	])
+	def test_at(self, via: str, index: int, expected: type[Node]) -> None:
+		nodes = Fixture.nodes()
+		node = nodes.at(via, index)
+		self.assertEqual(type(node), expected)
+
+	@data_provider([
+		('root', 3, NotFoundError),
+		('root', -1, NotFoundError),
+		('root.term_a', 0, NotFoundError),
+		('root.outside', 0, NotFoundError),
+	])
+	def test_at_error(self, via: str, index: int, expected: type[Exception]) -> None:
+		nodes = Fixture.nodes()
+		with self.assertRaises(expected):
+			nodes.at(via, index)
+
 	@data_provider([
 		('root', [TreeA, Terminal, TreeC]),
 		('root.tree_a', [Empty, TokenA, TreeB, TreeB, TokenA, TokenC]),
@@ -201,6 +250,13 @@ class TestNodes(TestCase):
 		in_nodes = nodes.expand(via)
 		self.assertEqual([type(node) for node in in_nodes], expected)
 
+	def test_expand_memoized(self) -> None:
+		nodes = Fixture.nodes()
+		first = nodes.expand('root.tree_a')
+		second = nodes.expand('root.tree_a')
+		self.assertIsNot(first, second)
+		self.assertEqual([id(node) for node in first], [id(node) for node in second])
+
 	@data_provider([
 		('root.__empty__', NotFoundError),
 	])
@@ -219,3 +275,31 @@ class TestNodes(TestCase):
 	def test_values(self, via: str, expected: str) -> None:
 		nodes = Fixture.nodes()
 		self.assertEqual(nodes.values(via), expected)
+
+	@data_provider([
+		('root.tree_a',),
+		('root.tree_a.tree_b[3]',),
+		('root.tree_a.tree_b[3].token_b',),
+		('root.term_a',),
+		('root.tree_c.skip_tree_a.term_a',),
+	])
+	def test_id_variants(self, via: str) -> None:
+		nodes = Fixture.nodes()
+		entry_id = nodes.id_of(via)
+		self.assertIs(nodes.node_of(entry_id), nodes.by(via))
+		self.assertIs(nodes.parent_of(entry_id), nodes.parent(via))
+		self.assertIs(nodes.ancestor_of(entry_id, 'root'), nodes.ancestor(via, 'root'))
+		self.assertEqual(nodes.siblings_of(entry_id), nodes.siblings(via))
+		self.assertEqual(nodes.children_of(entry_id), nodes.children(via))
+		self.assertEqual(nodes.expand_of(entry_id), nodes.expand(via))
+		self.assertEqual(nodes.values_of(entry_id), nodes.values(via))
+
+	@data_provider([
+		('root', 0),
+		('root.tree_a', 3),
+	])
+	def test_child_of(self, via: str, index: int) -> None:
+		nodes = Fixture.nodes()
+		self.assertIs(nodes.child_of(nodes.id_of(via), index), nodes.at(via, index))
+		with self.assertRaises(NotFoundError):
+			nodes.child_of(nodes.id_of(via), 10)
@@ -1,3 +1,4 @@
+from typing import Callable
 from unittest import TestCase
 
 from lark import Token, Tree
@@ -102,4 +103,20 @@ class TestNodeResolver(TestCase):
 
 	def test_resolve(self) -> None:
 		resolver = Fixture.resolver()
-		self.assertEqual(resolver.resolve('root', 'root').full_path, 'root')
+		self.assertEqual(resolver.resolve('root', 0).full_path, 'root')
+
+	def test_resolve_factory_cached(self) -> None:
+		di = Fixture.di()
+		nodes = di.resolve(Query[Node])
+		curried: list[type] = []
+
+		def currying(factory: type, expect: type) -> Callable:
+			curried.append(factory)
+			return di.currying(factory, expect)
+
+		resolver = NodeResolver(currying, di.resolve(SymbolMapping))
+		tree_b2 = resolver.resolve('tree_b', nodes.id_of('root.tree_a.tree_b[2]'))
+		tree_b3 = resolver.resolve('tree_b', nodes.id_of('root.tree_a.tree_b[3]'))
+		self.assertEqual(tree_b2.full_path, 'root.tree_a.tree_b[2]')
+		self.assertEqual(tree_b3.full_path, 'root.tree_a.tree_b[3]')
+		self.assertEqual(curried, [TreeB])
@@ -0,0 +1,103 @@
+from typing import Callable
+from unittest import TestCase
+
+from lark import Token, Tree
+
+from py2cpp.ast.entry import Entry
+from py2cpp.tp_lark.entry import BinarySerialization, BinaryTable, EntryOfBinary, EntryOfLark, Serialization
+from tests.test.helper import data_provider
+
+
+class TestEntryOfLark(TestCase):
+	@data_provider([
+		(Tree('tree_a', [Token('term_a', 'a')]), {'name': 'tree_a', 'value': '', 'has_child': True, 'is_terminal': False, 'is_empty': False}),
+		(Token('term_a', 'a'), {'name': 'term_a', 'value': 'a', 'has_child': False, 'is_terminal': True, 'is_empty': False}),
+		(None, {'name': '__empty__', 'value': '', 'has_child': False, 'is_terminal': False, 'is_empty': True}),
+	])
+	def test_schema(self, source: Tree | Token | None, expected: dict[str, str | bool]) -> None:
+		entry = EntryOfLark(source)
+		self.assertEqual(entry.source, source)
+		self.assertEqual(entry.name, expected['name'])
+		self.assertEqual(entry.value, expected['value'])
+		self.assertEqual(entry.has_child, expected['has_child'])
+		self.assertEqual(entry.is_terminal, expected['is_terminal'])
+		self.assertEqual(entry.is_empty, expected['is_empty'])
+
+	def test_children(self) -> None:
+		entry = EntryOfLark(Tree('tree_a', [Token('term_a', 'a'), Tree('tree_b', [Token('term_b', 'b')]), None]))
+		self.assertEqual([child.name for child in entry.children], ['term_a', 'tree_b', '__empty__'])
+		self.assertEqual([child.name for child in entry.children[1].children], ['term_b'])
+		self.assertEqual(entry.children[2].children, ())
+
+	def test_children_identity(self) -> None:
+		entry = EntryOfLark(Tree('tree_a', [Token('term_a', 'a'), Tree('tree_b', [Token('term_b', 'b')])]))
+		self.assertIs(entry.children, entry.children)
+		self.assertIs(entry.children[1].children[0], entry.children[1].children[0])
+
+
+class TestBinarySerialization(TestCase):
+	@data_provider([
+		(Tree('file_input', [Tree('stmt', [Token('name', 'a'), None, Tree('expr', [Token('op', '+'), Token('string', '"あ"')])]), Tree('empty', [])]),),
+		(Token('name', 'a'),),
+		(None,),
+	])
+	def test_dumps_loads(self, source: Tree | Token | None) -> None:
+		actual = BinarySerialization.loads(BinarySerialization.dumps(source))
+		self.assertEqual(Serialization.dumps(actual), Serialization.dumps(source))
+
+	def test_loads_deep(self) -> None:
+		depth = 10000
+		source = Tree('expr', [Token('number', '1')])
+		for _ in range(depth):
+			source = Tree('expr', [source])
+
+		actual = BinarySerialization.loads(BinarySerialization.dumps(source))
+		for _ in range(depth):
+			self.assertEqual(actual.data, 'expr')
+			actual = actual.children[0]
+
+		self.assertEqual(actual.children[0], Token('number', '1'))
+
+	@data_provider([
+		(lambda data: b'',),
+		(lambda data: b'P2CA',),
+		(lambda data: b'XXXX' + data[4:],),
+		(lambda data: data[:BinarySerialization.header.size + 4],),
+		(lambda data: data[:-1],),
+	])
+	def test_loads_error(self, broken: Callable[[bytes], bytes]) -> None:
+		data = BinarySerialization.dumps(Tree('file_input', [Token('name', 'a')]))
+		with self.assertRaises(ValueError):
+			BinarySerialization.loads(broken(data))
+
+
+class TestEntryOfBinary(TestCase):
+	def __tree(self) -> Tree:
+		return Tree('file_input', [
+			Tree('stmt', [Token('name', 'a'), None, Tree('expr', [Token('op', '+'), Token('string', '"あ"')])]),
+			Tree('empty', []),
+			Token('name', 'b'),
+		])
+
+	def __rows(self, entry: Entry) -> list[tuple[str, str, bool, bool, bool, int]]:
+		rows = [(entry.name, entry.value, entry.has_child, entry.is_terminal, entry.is_empty, len(entry.children))]
+		for child in entry.children:
+			rows.extend(self.__rows(child))
+
+		return rows
+
+	def test_schema(self) -> None:
+		tree = self.__tree()
+		entry = EntryOfBinary(BinaryTable(BinarySerialization.dumps(tree)), 0)
+		self.assertEqual(self.__rows(entry), self.__rows(EntryOfLark(tree)))
+
+	def test_source(self) -> None:
+		tree = self.__tree()
+		entry = EntryOfBinary(BinaryTable(BinarySerialization.dumps(tree)), 0)
+		self.assertEqual(Serialization.dumps(entry.source), Serialization.dumps(tree))
+		self.assertEqual(Serialization.dumps(entry.children[0].children[2].source), Serialization.dumps(tree.children[0].children[2]))
+
+	def test_children_identity(self) -> None:
+		entry = EntryOfBinary(BinaryTable(BinarySerialization.dumps(self.__tree())), 0)
+		self.assertIs(entry.children, entry.children)
+		self.assertIs(entry.children[0].children[2], entry.children[0].children[2])
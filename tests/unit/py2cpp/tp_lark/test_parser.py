@@ -0,0 +1,39 @@
+import os
+import tempfile
+from typing import cast
+from unittest import TestCase
+
+from lark import Token, Tree
+
+from py2cpp.tp_lark.entry import BinarySerialization, EntryOfLark, Serialization
+from py2cpp.tp_lark.parser import EntryBinaryStored
+from tests.test.helper import data_provider
+
+
+class TestEntryBinaryStored(TestCase):
+	def test_save_load(self) -> None:
+		tree = Tree('file_input', [Tree('stmt', [Token('name', 'a')]), Token('name', 'b')])
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'entry.bin')
+			with open(filepath, mode='wb') as f:
+				EntryBinaryStored(EntryOfLark(tree)).save(f)
+
+			with open(filepath, mode='rb') as f:
+				entry = EntryBinaryStored.load(f).entry
+
+			self.assertEqual(Serialization.dumps(cast(Tree, entry.source)), Serialization.dumps(tree))
+
+	@data_provider([
+		(b'',),
+		(b'P2CA',),
+		(BinarySerialization.dumps(Tree('file_input', [Token('name', 'a')]))[:-1],),
+	])
+	def test_load_error(self, data: bytes) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'entry.bin')
+			with open(filepath, mode='wb') as f:
+				f.write(data)
+
+			with open(filepath, mode='rb') as f:
+				with self.assertRaises(ValueError):
+					EntryBinaryStored.load(f)
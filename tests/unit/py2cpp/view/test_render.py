@@ -1,8 +1,11 @@
 import os
+import tempfile
 from typing import Any
 from unittest import TestCase
 
-from py2cpp.view.render import Renderer
+from jinja2 import TemplateNotFound
+
+from py2cpp.view.render import Renderer, Writer
 from tests.test.helper import data_provider
 
 class Fixture:
@@ -15,12 +18,80 @@ class Fixture:
 		return Renderer(os.path.join(cls.appdir(), 'example/template'))
 
 
+class TestWriter(TestCase):
+	def test_flush(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'out.cpp')
+			writer = Writer(filepath)
+			writer.put('int x = 0;\n')
+			writer.spill()
+			self.assertFalse(os.path.exists(filepath))
+			writer.put('int y = 1;\n')
+			writer.put('// 日本語\n')
+			writer.flush()
+			with open(filepath, mode='rb') as f:
+				self.assertEqual(f.read().decode('utf-8'), 'int x = 0;\nint y = 1;\n// 日本語\n')
+
+			self.assertEqual(os.listdir(dirpath), ['out.cpp'])
+
+	def test_rollback(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'out.cpp')
+			with open(filepath, mode='w') as f:
+				f.write('before')
+
+			writer = Writer(filepath)
+			writer.put('after')
+			writer.spill()
+			writer.rollback()
+			with open(filepath) as f:
+				self.assertEqual(f.read(), 'before')
+
+			self.assertEqual(os.listdir(dirpath), ['out.cpp'])
+
+	def test_cleanup(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'out.cpp')
+			with self.assertRaises(ValueError):
+				with Writer(filepath) as writer:
+					writer.put('int x = 0;\n')
+					writer.spill()
+					raise ValueError()
+
+			self.assertEqual(os.listdir(dirpath), [])
+
+			with Writer(filepath) as writer:
+				writer.put('int x = 0;\n')
+				writer.spill()
+
+			self.assertEqual(os.listdir(dirpath), [])
+
+	def test_permission(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'out.cpp')
+			umask = os.umask(0o022)
+			try:
+				with Writer(filepath) as writer:
+					writer.put('int x = 0;\n')
+					writer.flush()
+			finally:
+				os.umask(umask)
+
+			self.assertEqual(os.stat(filepath).st_mode & 0o777, 0o644)
+
+
 class TestRenderer(TestCase):
 	def assertRender(self, template: str, indent: int, vars: dict[str, Any], expected: str) -> None:
 		renderer = Fixture.renderer()
 		actual = renderer.render(template, indent=indent, vars=vars)
 		self.assertEqual(actual, expected)
 
+	def test_template(self) -> None:
+		renderer = Fixture.renderer()
+		self.assertIs(renderer.template('move_assign'), renderer.template('move_assign'))
+		with self.assertRaises(TemplateNotFound):
+			renderer.template('__unknown__')
+
 	@data_provider([
 		(1, {'receiver': 'hoge', 'value': '1234'}, '\thoge = 1234;'),
 		(2, {'receiver': 'hoge', 'value': '1234'}, '\t\thoge = 1234;'),
@@ -28,6 +99,9 @@ class TestRenderer(TestCase):
 	def test_render_indent(self, indent: int, vars: dict[str, Any], expected: str) -> None:
 		self.assertRender('move_assign', indent, vars, expected)
 
+	def test_render_indent_lines(self) -> None:
+		self.assertRender('block', 1, {'statements': ['int x = 0;', 'int y = 0;']}, '\tint x = 0;\n\tint y = 0;')
+
 	@data_provider([
 		(
 			{'values': ['1234', '2345']},